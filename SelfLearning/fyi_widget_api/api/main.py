@@ -26,6 +26,8 @@ from fyi_widget_api.api import auth
 # Import from fyi_widget_shared_library
 from fyi_widget_shared_library.data import DatabaseManager, JobRepository
 from fyi_widget_shared_library.data.postgres_database import PostgresPublisherRepository
+from fyi_widget_shared_library.services.embedding_cache import EmbeddingCache, set_embedding_cache
+from fyi_widget_shared_library.services.llm_providers import close_llm_clients
 
 # Import config
 import os
@@ -55,6 +57,8 @@ except KeyError as e:
     )
 
 SERVICE_PORT = int(os.getenv("API_SERVICE_PORT", "8005"))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))
+EMBEDDING_CACHE_TTL_SECONDS = int(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
 
 # CORS origins: expect JSON array; fallback to ["*"]
 raw_cors = os.getenv("CORS_ORIGINS", "[\"*\"]")
@@ -88,6 +92,16 @@ async def lifespan(app: FastAPI):
     await job_repo.create_indexes()
     logger.info("✅ Job queue indexes created")
     
+    # Shared embedding cache (same collection as the worker) for query embeddings
+    embedding_cache = EmbeddingCache(
+        database=db_manager.database,
+        max_entries=EMBEDDING_CACHE_MAX_ENTRIES,
+        ttl_seconds=EMBEDDING_CACHE_TTL_SECONDS
+    )
+    await embedding_cache.create_indexes()
+    set_embedding_cache(embedding_cache)
+    logger.info("✅ Embedding cache configured")
+    
     # Connect to PostgreSQL for publisher configs
     publisher_repo_instance = PostgresPublisherRepository(POSTGRES_URL)
     await publisher_repo_instance.connect()
@@ -102,6 +116,7 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("👋 Shutting down API Service...")
+    await close_llm_clients()
     if publisher_repo_instance:
         await publisher_repo_instance.disconnect()
 
@@ -1,10 +1,11 @@
 """Utility functions for enforcing publisher configuration rules."""
 
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 from fastapi import HTTPException
 
+from fyi_widget_shared_library.data.job_repository import JobRepository
 from fyi_widget_shared_library.models.publisher import Publisher
 from fyi_widget_shared_library.utils import normalize_url
 
@@ -64,3 +65,23 @@ def ensure_url_whitelisted(url: str, publisher: Publisher) -> None:
         status_code=403,
         detail="Blog URL is not whitelisted for this publisher.",
     )
+
+
+async def record_trigger_and_check_threshold(
+    url: str,
+    publisher: Publisher,
+    job_repo: JobRepository,
+) -> Tuple[bool, int, int]:
+    """
+    Count a processing request for the URL and check the publisher threshold.
+
+    A blog is processed once it has been requested more than
+    threshold_before_processing_blog times. Callers only reserve a slot and
+    create a job when the threshold is met.
+
+    Returns:
+        Tuple of (threshold_met, trigger_count, threshold)
+    """
+    threshold = getattr(publisher.config, "threshold_before_processing_blog", 0) or 0
+    trigger_count = await job_repo.record_trigger(url)
+    return trigger_count > threshold, trigger_count, threshold
@@ -3,7 +3,7 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 from fastapi import APIRouter, HTTPException, Depends, Request
@@ -11,9 +11,9 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 # Add shared to path
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
-from fyi_widget_shared_library.models.job_queue import JobCreateRequest, JobStatusResponse, JobStatus
-from fyi_widget_shared_library.models import ProcessJobResponse, SwaggerJobStatusResponse, JobStatsResponse, StandardErrorResponse, StandardSuccessResponse
-from fyi_widget_shared_library.data.job_repository import JobRepository
+from fyi_widget_shared_library.models.job_queue import JobCreateRequest, JobBatchCreateRequest, JobStatusResponse, JobStatus, JobPriority, ProcessingJob
+from fyi_widget_shared_library.models import ProcessJobResponse, ProcessBatchJobResponse, SwaggerJobStatusResponse, JobStatsResponse, StandardErrorResponse, StandardSuccessResponse
+from fyi_widget_shared_library.data.job_repository import JobRepository, ACTIVE_STATUSES
 from fyi_widget_shared_library.data.postgres_database import PostgresPublisherRepository
 from fyi_widget_shared_library.models.publisher import PublisherStatus, Publisher
 from fyi_widget_shared_library.utils import (
@@ -27,7 +27,7 @@ from fyi_widget_shared_library.utils import (
 # Import auth
 from fyi_widget_api.api.auth import get_current_publisher, validate_blog_url_domain, verify_admin_key
 # Enforcement helpers
-from fyi_widget_api.api.publisher_rules import ensure_url_whitelisted
+from fyi_widget_api.api.publisher_rules import ensure_url_whitelisted, record_trigger_and_check_threshold
 from fyi_widget_shared_library.data.postgres_database import UsageLimitExceededError
 from fyi_widget_api.api import auth as auth_module
 
@@ -97,7 +97,12 @@ async def enqueue_blog_processing(
     The actual processing will be done asynchronously by the worker service.
     
     If the blog has already been processed, returns the existing completed job
-    instead of creating a duplicate.
+    instead of creating a duplicate. If a job for it is already queued,
+    processing or retrying, that job is returned and no trigger is counted.
+
+    Until the blog has been requested more than the publisher's
+    threshold_before_processing_blog times, the request is only counted and
+    no job is created (status: awaiting_threshold).
     """
     # Get request_id from middleware (fallback to generating one if not available)
     request_id = getattr(http_request.state, 'request_id', None) or generate_request_id()
@@ -183,17 +188,80 @@ async def enqueue_blog_processing(
         # Blog doesn't exist or wasn't successfully processed - enforce limits and enqueue new job
         ensure_url_whitelisted(normalized_url, publisher)
 
+        # A job is already queued/processing/retrying - return it without counting another trigger
+        active_job = await job_repo.collection.find_one(
+            {"blog_url": normalized_url, "status": {"$in": ACTIVE_STATUSES}},
+            sort=[("created_at", -1)]
+        )
+        if active_job:
+            logger.info(f"[{request_id}] ⏳ Job already in progress: {active_job['job_id']}")
+
+            from fyi_widget_shared_library.models import ProcessingJob
+            job = ProcessingJob(**active_job)
+
+            job_response = JobStatusResponse(
+                job_id=job.job_id,
+                blog_url=job.blog_url,
+                status=job.status,
+                failure_count=job.failure_count,
+                error_message=job.error_message,
+                next_attempt_at=job.next_attempt_at,
+                created_at=job.created_at,
+                started_at=job.started_at,
+                completed_at=job.completed_at,
+                processing_time_seconds=job.processing_time_seconds,
+                result=job.result
+            )
+
+            return success_response(
+                result=job_response.model_dump(),
+                message="Blog processing job already in progress",
+                status_code=200,
+                request_id=request_id
+            )
+
+        # Count this trigger; nothing is reserved or crawled until the threshold is crossed
+        threshold_met, trigger_count, threshold = await record_trigger_and_check_threshold(
+            normalized_url, publisher, job_repo
+        )
+        if not threshold_met:
+            logger.info(
+                f"[{request_id}] ⏭️  Threshold not met ({trigger_count}/{threshold + 1} triggers) - no job created"
+            )
+            return success_response(
+                result={
+                    "job_id": None,
+                    "blog_url": normalized_url,
+                    "status": "awaiting_threshold",
+                    "triggered_count": trigger_count,
+                    "threshold": threshold
+                },
+                message=f"Request recorded ({trigger_count}/{threshold + 1}) - processing starts once the threshold is reached",
+                status_code=202,
+                request_id=request_id
+            )
+
         slot_reserved = False
         try:
             if auth_module.publisher_repo:
                 await auth_module.publisher_repo.reserve_blog_slot(publisher.id)
                 slot_reserved = True
             # Pass publisher_id and config so worker can release the slot properly
-            job = await job_repo.enqueue_job(
+            job, is_new_job = await job_repo.create_or_get_job(
                 normalized_url,
                 publisher_id=publisher.id,
-                config=publisher.config.model_dump() if publisher.config else None
+                config=publisher.config.model_dump() if publisher.config else None,
+                subscription_tier=publisher.subscription_tier,
+                priority=JobPriority.NORMAL.value
             )
+            
+            # An active job already existed - its own slot is reserved, release ours
+            if slot_reserved and not is_new_job:
+                await auth_module.publisher_repo.release_blog_slot(
+                    publisher.id,
+                    processed=False,
+                )
+                slot_reserved = False
         except UsageLimitExceededError as exc:
             logger.warning(f"[{request_id}] ❌ Blog limit reached for publisher {publisher.id}: {exc}")
             raise HTTPException(
@@ -217,6 +285,7 @@ async def enqueue_blog_processing(
             status=job.status,
             failure_count=job.failure_count,
             error_message=job.error_message,
+            next_attempt_at=job.next_attempt_at,
             created_at=job.created_at,
             started_at=job.started_at,
             completed_at=job.completed_at,
@@ -252,6 +321,202 @@ async def enqueue_blog_processing(
         )
 
 
+def _error_message(exc: HTTPException) -> str:
+    """Flatten an HTTPException detail (str or standard error dict) into a message."""
+    if isinstance(exc.detail, dict):
+        return exc.detail.get("error", {}).get("detail") or exc.detail.get("message") or str(exc.detail)
+    return str(exc.detail)
+
+
+@router.post(
+    "/process-batch",
+    status_code=202,
+    response_model=ProcessBatchJobResponse,
+    responses={
+        202: {"description": "Batch processed - see per-URL status list"},
+        401: {"model": StandardErrorResponse, "description": "Authentication required - X-API-Key header missing"},
+        403: {"model": StandardErrorResponse, "description": "Blog limit reached"},
+        422: {"model": StandardErrorResponse, "description": "Empty or oversized URL list"}
+    }
+)
+async def enqueue_blog_processing_batch(
+    http_request: Request,
+    request: JobBatchCreateRequest,
+    publisher: Publisher = Depends(get_current_publisher),
+    job_repo: JobRepository = Depends(get_job_repository)
+) -> Dict[str, Any]:
+    """
+    Enqueue many blogs for processing in one request.
+    
+    Applies the same rules as POST /jobs/process to every URL, but URLs are
+    normalized and deduplicated in memory, existing blogs and jobs are
+    resolved with one query each, slots are reserved in a single Postgres
+    transaction and new jobs are written with one insert_many. Batch jobs
+    go into the backfill priority lane.
+    
+    Per-URL status values:
+    - **queued**: new job created
+    - **already_queued**: a queued/processing job already exists
+    - **already_processed**: blog already processed (existing job_id returned)
+    - **awaiting_threshold**: request counted, threshold not reached yet
+    - **rejected**: domain mismatch or URL not whitelisted
+    - **limit_reached**: daily or total blog limit reached
+    - **error**: job could not be created
+    """
+    request_id = getattr(http_request.state, 'request_id', None) or generate_request_id()
+    
+    try:
+        # Normalize and dedupe, keeping request order
+        urls: List[str] = []
+        seen = set()
+        for raw_url in request.blog_urls:
+            normalized_url = normalize_url(raw_url)
+            if normalized_url not in seen:
+                seen.add(normalized_url)
+                urls.append(normalized_url)
+        
+        logger.info(f"[{request_id}] 📥 Batch enqueue: {len(request.blog_urls)} URLs ({len(urls)} distinct) for {publisher.name}")
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        def set_result(url: str, status: str, job_id: str = None, message: str = None):
+            results[url] = {"blog_url": url, "status": status, "job_id": job_id, "message": message}
+        
+        # Domain + whitelist rules (in memory)
+        candidates = []
+        for url in urls:
+            try:
+                await validate_blog_url_domain(url, publisher)
+                ensure_url_whitelisted(url, publisher)
+                candidates.append(url)
+            except HTTPException as exc:
+                set_result(url, "rejected", message=_error_message(exc))
+        
+        # Already processed: blog exists and has a completed job (two $in queries)
+        from fyi_widget_api.api.main import db_manager
+        existing_blogs = {
+            blog["url"]
+            async for blog in db_manager.database["raw_blog_content"].find(
+                {"url": {"$in": candidates}}, {"url": 1}
+            )
+        } if candidates else set()
+        completed_jobs = await job_repo.find_jobs_by_urls(list(existing_blogs), [JobStatus.COMPLETED.value])
+        active_jobs = await job_repo.find_jobs_by_urls(candidates, ACTIVE_STATUSES)
+        
+        pending = []
+        for url in candidates:
+            if url in completed_jobs:
+                set_result(url, "already_processed", job_id=completed_jobs[url]["job_id"])
+            elif url in active_jobs:
+                set_result(url, "already_queued", job_id=active_jobs[url]["job_id"])
+            else:
+                pending.append(url)
+        
+        # Processing threshold (one bulk counter update)
+        threshold = publisher.config.threshold_before_processing_blog or 0
+        trigger_counts = await job_repo.record_triggers(pending)
+        to_enqueue = []
+        for url in pending:
+            count = trigger_counts.get(url, 1)
+            if count > threshold:
+                to_enqueue.append(url)
+            else:
+                set_result(url, "awaiting_threshold", message=f"Request recorded ({count}/{threshold + 1})")
+        
+        # Daily limit (one count for the whole batch)
+        if publisher.config.daily_blog_limit and to_enqueue:
+            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            jobs_today = await job_repo.collection.count_documents({
+                "blog_url": {"$regex": f"^https?://(www\\.)?{publisher.domain}"},
+                "status": "completed",
+                "completed_at": {"$gte": today_start}
+            })
+            remaining_today = max(0, publisher.config.daily_blog_limit - jobs_today)
+            for url in to_enqueue[remaining_today:]:
+                set_result(url, "limit_reached", message=f"Daily blog processing limit reached ({publisher.config.daily_blog_limit})")
+            to_enqueue = to_enqueue[:remaining_today]
+        
+        # Reserve slots for the whole batch in one transaction
+        granted = len(to_enqueue)
+        if to_enqueue and auth_module.publisher_repo:
+            try:
+                granted = await auth_module.publisher_repo.reserve_blog_slots(publisher.id, len(to_enqueue))
+            except UsageLimitExceededError as exc:
+                raise HTTPException(status_code=403, detail=str(exc))
+        for url in to_enqueue[granted:]:
+            set_result(url, "limit_reached", message="Publisher reached the maximum number of blogs")
+        to_enqueue = to_enqueue[:granted]
+        
+        # Insert every new job at once; release slots of any that failed
+        config = publisher.config.model_dump() if publisher.config else None
+        new_jobs = [
+            ProcessingJob(
+                blog_url=url,
+                publisher_id=publisher.id,
+                subscription_tier=publisher.subscription_tier,
+                priority=JobPriority.BACKFILL.value,  # Bulk imports never delay reader-triggered jobs
+                config=config
+            )
+            for url in to_enqueue
+        ]
+        try:
+            inserted = await job_repo.enqueue_jobs(new_jobs)
+        except Exception:
+            if granted and auth_module.publisher_repo:
+                await auth_module.publisher_repo.release_blog_slots(publisher.id, granted)
+            raise
+        
+        # Inserts rejected by the active-job unique index raced with another request
+        inserted_ids = {job.job_id for job in inserted}
+        raced_jobs = await job_repo.find_jobs_by_urls(
+            [job.blog_url for job in new_jobs if job.job_id not in inserted_ids],
+            ACTIVE_STATUSES
+        )
+        for job in new_jobs:
+            if job.job_id in inserted_ids:
+                set_result(job.blog_url, "queued", job_id=job.job_id)
+            elif job.blog_url in raced_jobs:
+                set_result(job.blog_url, "already_queued", job_id=raced_jobs[job.blog_url]["job_id"])
+            else:
+                set_result(job.blog_url, "error", message="Failed to create job")
+        
+        failed_count = len(new_jobs) - len(inserted)
+        if failed_count and auth_module.publisher_repo:
+            await auth_module.publisher_repo.release_blog_slots(publisher.id, failed_count)
+        
+        logger.info(f"[{request_id}] ✅ Batch enqueue: {len(inserted)}/{len(urls)} jobs created")
+        
+        return success_response(
+            result={
+                "total": len(urls),
+                "enqueued": len(inserted),
+                "results": [results[url] for url in urls]
+            },
+            message=f"{len(inserted)} of {len(urls)} blogs enqueued",
+            status_code=202,
+            request_id=request_id
+        )
+        
+    except HTTPException as exc:
+        logger.error(f"[{request_id}] ❌ HTTP error: {exc.detail}")
+        response_data = handle_http_exception(exc, request_id=request_id)
+        raise HTTPException(
+            status_code=response_data["status_code"],
+            detail=response_data
+        )
+    except Exception as e:
+        logger.error(f"[{request_id}] ❌ Failed to enqueue batch: {e}", exc_info=True)
+        response_data = handle_generic_exception(
+            e,
+            message="Failed to enqueue batch",
+            request_id=request_id
+        )
+        raise HTTPException(
+            status_code=response_data["status_code"],
+            detail=response_data
+        )
+
+
 @router.get(
     "/status/{job_id}",
     response_model=SwaggerJobStatusResponse,
@@ -295,6 +560,7 @@ async def get_job_status(
             status=job.status,
             failure_count=job.failure_count,
             error_message=job.error_message,
+            next_attempt_at=job.next_attempt_at,
             created_at=job.created_at,
             started_at=job.started_at,
             completed_at=job.completed_at,
@@ -358,7 +624,8 @@ async def get_queue_stats(
     **Admin Only**: This endpoint requires admin authentication (X-Admin-Key header).
     
     Returns aggregated statistics about job processing including counts by status
-    (pending, processing, completed, failed) and total job count.
+    (queued, processing, retrying, completed, failed) and total job count.
+    Failed counts include jobs moved to the dead-letter collection.
     """
     # Get request_id from middleware (fallback to generating one if not available)
     request_id = getattr(http_request.state, 'request_id', None) or generate_request_id()
@@ -408,11 +675,11 @@ async def cancel_job(
     job_repo: JobRepository = Depends(get_job_repository)
 ) -> Dict[str, Any]:
     """
-    Cancel a queued job.
+    Cancel a queued or retrying job.
     
     **Admin Only**: This endpoint requires admin authentication (X-Admin-Key header).
     
-    Jobs can only be cancelled if they are in 'pending' or 'queued' status.
+    Jobs can only be cancelled if they are in 'queued' or 'retrying' status.
     Jobs that are already processing or completed cannot be cancelled.
     """
     # Get request_id from middleware (fallback to generating one if not available)
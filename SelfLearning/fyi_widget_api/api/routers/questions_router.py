@@ -13,8 +13,8 @@ sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 from fyi_widget_shared_library.services import StorageService
 from fyi_widget_shared_library.models import QuestionsByUrlResponse, QuestionByIdResponse, CheckAndLoadResponse, StandardErrorResponse
 from fyi_widget_shared_library.models.publisher import Publisher
-from fyi_widget_shared_library.models.job_queue import JobStatus
-from fyi_widget_shared_library.data.job_repository import JobRepository
+from fyi_widget_shared_library.models.job_queue import JobStatus, JobPriority
+from fyi_widget_shared_library.data.job_repository import JobRepository, ACTIVE_STATUSES
 from fyi_widget_shared_library.utils import (
     normalize_url,
     success_response,
@@ -25,7 +25,7 @@ from fyi_widget_shared_library.utils import (
 
 # Import auth
 from fyi_widget_api.api.auth import get_current_publisher, validate_blog_url_domain, verify_admin_key
-from fyi_widget_api.api.publisher_rules import ensure_url_whitelisted
+from fyi_widget_api.api.publisher_rules import ensure_url_whitelisted, record_trigger_and_check_threshold
 from fyi_widget_shared_library.data.postgres_database import UsageLimitExceededError
 
 logger = logging.getLogger(__name__)
@@ -150,11 +150,11 @@ async def check_and_load_questions(
         # STEP 2: No questions found - Check if processing job exists
         logger.info(f"[{request_id}] 🔄 No questions found, checking for existing job")
         
-        # Check for existing active job (pending or processing)
+        # Check for existing active job (queued, processing or waiting to retry)
         # Allow immediate requeuing of skipped jobs - they can be requeued right away
         existing_job = await job_repo.collection.find_one({
             "blog_url": normalized_url,
-            "status": {"$in": ["pending", "processing"]}
+            "status": {"$in": ACTIVE_STATUSES}
         }, sort=[("created_at", -1)])
         
         if existing_job:
@@ -171,8 +171,18 @@ async def check_and_load_questions(
                     "job_id": job_id,
                     "message": "Blog is currently being processed"
                 }
-            elif job_status == "pending":
-                logger.info(f"[{request_id}] ⏳ Job pending: {job_id}")
+            elif job_status == JobStatus.RETRYING.value:
+                logger.info(f"[{request_id}] ⏳ Job waiting to retry: {job_id}")
+                result_data = {
+                    "processing_status": "processing",
+                    "blog_url": normalized_url,
+                    "questions": None,
+                    "blog_info": None,
+                    "job_id": job_id,
+                    "message": "Blog processing will be retried shortly"
+                }
+            else:
+                logger.info(f"[{request_id}] ⏳ Job queued: {job_id}")
                 result_data = {
                     "processing_status": "processing",
                     "blog_url": normalized_url,
@@ -182,7 +192,7 @@ async def check_and_load_questions(
                     "message": "Blog processing is queued"
                 }
             
-            # Return early if we have an active job (processing or pending)
+            # Return early if we have an active job (queued, processing or retrying)
             # Skipped jobs are NOT included in the query, so they can be immediately requeued
             return success_response(
                 result=result_data,
@@ -205,6 +215,29 @@ async def check_and_load_questions(
         
         ensure_url_whitelisted(normalized_url, publisher)
         
+        # Count this trigger; nothing is reserved or crawled until the threshold is crossed
+        threshold_met, trigger_count, threshold = await record_trigger_and_check_threshold(
+            normalized_url, publisher, job_repo
+        )
+        if not threshold_met:
+            logger.info(
+                f"[{request_id}] ⏭️  Threshold not met ({trigger_count}/{threshold + 1} triggers) - no job created"
+            )
+            result_data = {
+                "processing_status": "not_started",
+                "blog_url": normalized_url,
+                "questions": None,
+                "blog_info": None,
+                "job_id": None,
+                "message": f"Request recorded ({trigger_count}/{threshold + 1}) - processing starts once the threshold is reached"
+            }
+            return success_response(
+                result=result_data,
+                message=result_data["message"],
+                status_code=200,
+                request_id=request_id
+            )
+        
         # Create or reuse job, enforcing limits BEFORE creating a NEW job
         slot_reserved = False
         try:
@@ -217,7 +250,9 @@ async def check_and_load_questions(
             job_id, is_new_job = await job_repo.create_job(
                 blog_url=normalized_url,
                 publisher_id=publisher.id,
-                config=publisher_config
+                config=publisher_config,
+                subscription_tier=publisher.subscription_tier,
+                priority=JobPriority.INTERACTIVE.value  # Reader is waiting on this job
             )
 
             # If we ended up reusing an existing job, release the extra slot
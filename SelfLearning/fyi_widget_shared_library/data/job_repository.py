@@ -1,15 +1,78 @@
 """Repository for job queue operations."""
 
 import logging
-from datetime import datetime
-from typing import Optional, List
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Optional, List
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo import ASCENDING, IndexModel
+from pymongo import ASCENDING, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 
-from ..models.job_queue import ProcessingJob, JobStatus
+from ..models.job_queue import ProcessingJob, JobStatus, JobPriority
 
 logger = logging.getLogger(__name__)
 
+# Weighted fair scheduling: share of worker capacity per publisher by subscription tier
+SCHEDULING_TIER_WEIGHTS = {
+    "free": 1,
+    "basic": 2,
+    "pro": 4,
+    "enterprise": 8,
+}
+DEFAULT_SCHEDULING_WEIGHT = 1
+
+
+def get_scheduling_weight(subscription_tier: Optional[str]) -> int:
+    """Scheduling weight of a publisher's subscription tier."""
+    return SCHEDULING_TIER_WEIGHTS.get((subscription_tier or "").lower(), DEFAULT_SCHEDULING_WEIGHT)
+
+
+# Statuses covered by the one-active-job-per-URL unique index
+ACTIVE_STATUSES = [JobStatus.QUEUED.value, JobStatus.PROCESSING.value, JobStatus.RETRYING.value]
+
+# Checkpoints of jobs that never finish (e.g. cancelled) expire after this long
+CHECKPOINT_TTL_SECONDS = 7 * 24 * 3600
+
+# Delay before a failed job is retried: exponential per attempt, capped, with equal jitter
+RETRY_BACKOFF_BASE_SECONDS = 30
+RETRY_BACKOFF_MAX_SECONDS = 1800
+
+
+def get_retry_delay(attempt: int) -> float:
+    """
+    Backoff delay before retry number `attempt` (1-based).
+    
+    Half of the capped exponential delay is fixed and half is random, so jobs
+    that failed together (e.g. during a provider outage) do not all come
+    back at the same moment.
+    
+    Args:
+        attempt: Number of failed attempts so far
+        
+    Returns:
+        Delay in seconds
+    """
+    delay = min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_BASE_SECONDS * (2 ** max(0, attempt - 1)))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+# Priority lanes, highest first
+LANE_ORDER = [JobPriority.INTERACTIVE.value, JobPriority.NORMAL.value, JobPriority.BACKFILL.value]
+# Starvation protection: a lower lane whose oldest job waited longer than this is served anyway...
+LANE_MAX_WAIT_SECONDS = {
+    JobPriority.NORMAL.value: 300,
+    JobPriority.BACKFILL.value: 1800,
+}
+# ...until it holds this many in-flight jobs across all workers
+LANE_STARVATION_SLOTS = 2
+
+
+def get_lane_rank(priority: Optional[str]) -> int:
+    """Rank of a priority lane (0 = highest, unknown/missing = normal)."""
+    try:
+        return LANE_ORDER.index(priority or JobPriority.NORMAL.value)
+    except ValueError:
+        return LANE_ORDER.index(JobPriority.NORMAL.value)
+
 
 class JobRepository:
     """Repository for managing processing jobs."""
@@ -18,6 +81,11 @@ class JobRepository:
         """Initialize repository with database connection."""
         self.database = database
         self.collection: AsyncIOMotorCollection = database["processing_jobs"]
+        self.triggers: AsyncIOMotorCollection = database["blog_triggers"]
+        # Permanently failed jobs are moved out of the hot queue collection
+        self.dead_letters: AsyncIOMotorCollection = database["dead_letter_jobs"]
+        # Stage outputs of in-flight jobs (kept out of processing_jobs: embeddings are large)
+        self.checkpoints: AsyncIOMotorCollection = database["job_checkpoints"]
         logger.info("✅ JobRepository initialized")
     
     async def create_indexes(self):
@@ -27,60 +95,326 @@ class JobRepository:
                 IndexModel([("status", ASCENDING), ("created_at", ASCENDING)]),
                 IndexModel([("blog_url", ASCENDING)]),
                 IndexModel([("job_id", ASCENDING)], unique=True),
+                IndexModel([("status", ASCENDING), ("lease_expires_at", ASCENDING)]),
+                # Lane + fair scheduling: per-lane, per-publisher queue heads and in-flight counts
+                IndexModel([
+                    ("status", ASCENDING),
+                    ("priority", ASCENDING),
+                    ("publisher_id", ASCENDING),
+                    ("created_at", ASCENDING)
+                ]),
+                # Retry promotion: retrying jobs whose backoff has elapsed
+                IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)]),
             ]
             await self.collection.create_indexes(indexes)
+            await self.dead_letters.create_indexes([
+                IndexModel([("job_id", ASCENDING)], unique=True),
+                IndexModel([("dead_lettered_at", ASCENDING)]),
+                IndexModel([("blog_url", ASCENDING)]),
+            ])
+            await self.checkpoints.create_indexes([
+                IndexModel([("updated_at", ASCENDING)], expireAfterSeconds=CHECKPOINT_TTL_SECONDS),
+            ])
             logger.info("✅ Job queue indexes created")
         except Exception as e:
             logger.warning(f"⚠️  Index creation warning: {e}")
+        
+        await self._create_active_job_index()
     
-    async def create_job(
+    async def _create_active_job_index(self):
+        """
+        Create the partial unique index allowing one active job per blog URL.
+        
+        Duplicate active jobs left over from before the index existed would
+        make the build fail, so the newer duplicates are cancelled first. An
+        existing index built for a different set of active statuses is
+        dropped and rebuilt.
+        """
+        index = IndexModel(
+            [("blog_url", ASCENDING)],
+            name="unique_active_blog_url",
+            unique=True,
+            partialFilterExpression={"status": {"$in": ACTIVE_STATUSES}}
+        )
+        try:
+            await self.collection.create_indexes([index])
+            logger.info("✅ Active job unique index created")
+            return
+        except OperationFailure as e:
+            if e.code in (85, 86):  # IndexOptionsConflict / IndexKeySpecsConflict
+                logger.info("🔁 Active job index definition changed, rebuilding")
+                try:
+                    await self.collection.drop_index("unique_active_blog_url")
+                except Exception as drop_error:
+                    logger.warning(f"⚠️  Could not drop outdated active job index: {drop_error}")
+                    return
+                return await self._create_active_job_index()
+            if e.code != 11000:
+                logger.warning(f"⚠️  Active job index creation warning: {e}")
+                return
+        
+        cancelled = await self._cancel_duplicate_active_jobs()
+        logger.info(f"🧹 Cancelled {cancelled} duplicate active jobs before building the unique index")
+        try:
+            await self.collection.create_indexes([index])
+            logger.info("✅ Active job unique index created")
+        except Exception as e:
+            logger.warning(f"⚠️  Active job index creation warning: {e}")
+    
+    async def _cancel_duplicate_active_jobs(self) -> int:
+        """
+        Cancel all but one active job per blog URL.
+        
+        Processing jobs are kept over queued ones, queued over retrying ones,
+        then the oldest wins.
+        
+        Returns:
+            Number of jobs cancelled
+        """
+        pipeline = [
+            {"$match": {"status": {"$in": ACTIVE_STATUSES}}},
+            {"$sort": {"status": ASCENDING, "created_at": ASCENDING}},  # processing < queued < retrying
+            {"$group": {"_id": "$blog_url", "job_ids": {"$push": "$job_id"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}}
+        ]
+        duplicate_ids = []
+        async for group in self.collection.aggregate(pipeline):
+            duplicate_ids.extend(group["job_ids"][1:])
+        
+        if not duplicate_ids:
+            return 0
+        
+        result = await self.collection.update_many(
+            {"job_id": {"$in": duplicate_ids}, "status": {"$in": ACTIVE_STATUSES}},
+            {
+                "$set": {
+                    "status": JobStatus.CANCELLED.value,
+                    "error_message": "Duplicate active job",
+                    "updated_at": datetime.utcnow()
+                }
+            }
+        )
+        return result.modified_count
+    
+    async def record_trigger(self, blog_url: str) -> int:
+        """
+        Atomically count a processing request for a blog URL.
+        
+        Counters live in the `blog_triggers` collection keyed by normalized
+        URL, so the processing threshold can be checked before any job is
+        created or any page is crawled. The first trigger for a URL seeds the
+        counter from the legacy raw_blog_content.triggered_no_of_times field.
+        
+        Args:
+            blog_url: Normalized blog URL
+            
+        Returns:
+            Trigger count including this request
+        """
+        now = datetime.utcnow()
+        doc = await self.triggers.find_one_and_update(
+            {"_id": blog_url},
+            {
+                "$inc": {"count": 1},
+                "$set": {"last_triggered_at": now},
+                "$setOnInsert": {"first_triggered_at": now}
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        count = doc.get("count", 1)
+        
+        if count == 1:
+            count += (await self._seed_legacy_triggers([blog_url])).get(blog_url, 0)
+        
+        return count
+    
+    async def record_triggers(self, blog_urls: List[str]) -> Dict[str, int]:
+        """
+        Count a processing request for each of several blog URLs (bulk record_trigger).
+        
+        Args:
+            blog_urls: Distinct normalized blog URLs
+            
+        Returns:
+            Dict of blog_url -> trigger count including this request
+        """
+        if not blog_urls:
+            return {}
+        
+        now = datetime.utcnow()
+        await self.triggers.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": url},
+                    {
+                        "$inc": {"count": 1},
+                        "$set": {"last_triggered_at": now},
+                        "$setOnInsert": {"first_triggered_at": now}
+                    },
+                    upsert=True
+                )
+                for url in blog_urls
+            ],
+            ordered=False
+        )
+        counts = {
+            doc["_id"]: doc.get("count", 1)
+            async for doc in self.triggers.find({"_id": {"$in": blog_urls}}, {"count": 1})
+        }
+        
+        new_urls = [url for url, count in counts.items() if count == 1]
+        for url, legacy_count in (await self._seed_legacy_triggers(new_urls)).items():
+            counts[url] += legacy_count
+        
+        return counts
+    
+    async def _seed_legacy_triggers(self, blog_urls: List[str]) -> Dict[str, int]:
+        """
+        Carry legacy raw_blog_content.triggered_no_of_times over to new counters.
+        
+        Args:
+            blog_urls: URLs whose counter was just created
+            
+        Returns:
+            Dict of blog_url -> legacy count added (only URLs with a legacy count)
+        """
+        if not blog_urls:
+            return {}
+        
+        seeded = {}
+        async for blog in self.database["raw_blog_content"].find(
+            {"url": {"$in": blog_urls}, "triggered_no_of_times": {"$gt": 0}},
+            {"url": 1, "triggered_no_of_times": 1}
+        ):
+            seeded[blog["url"]] = blog["triggered_no_of_times"]
+        
+        if seeded:
+            await self.triggers.bulk_write(
+                [UpdateOne({"_id": url}, {"$inc": {"count": count}}) for url, count in seeded.items()],
+                ordered=False
+            )
+            logger.info(f"📝 Seeded {len(seeded)} trigger counts from legacy blogs")
+        
+        return seeded
+    
+    async def _promote_priority(self, job_dict: dict, priority: str):
+        """
+        Move a still-queued job into a higher priority lane.
+        
+        A reader hitting a URL that is already waiting in the backfill lane
+        should not wait behind the backfill.
+        """
+        if job_dict.get("status") != JobStatus.QUEUED.value:
+            return
+        if get_lane_rank(priority) >= get_lane_rank(job_dict.get("priority")):
+            return
+        
+        await self.collection.update_one(
+            {"job_id": job_dict["job_id"], "status": JobStatus.QUEUED.value},
+            {"$set": {"priority": priority, "updated_at": datetime.utcnow()}}
+        )
+        job_dict["priority"] = priority
+        logger.info(f"⏫ Job {job_dict['job_id']} promoted to {priority} lane")
+    
+    async def create_or_get_job(
         self,
         blog_url: str,
         publisher_id: Optional[str] = None,
-        config: Optional[dict] = None
-    ) -> tuple[str, bool]:
+        config: Optional[dict] = None,
+        subscription_tier: Optional[str] = None,
+        priority: str = JobPriority.NORMAL.value
+    ) -> tuple[ProcessingJob, bool]:
         """
-        Create a new processing job with publisher context.
+        Return the URL's active (queued/processing) job, creating one if none exists.
+        
+        A single upsert against the partial unique index on active jobs'
+        blog_url: it either matches the active job or inserts a new one. Two
+        concurrent upserts that both miss race on the index; the loser gets
+        a duplicate key error and its retry matches the winner's job, so a
+        burst of requests for one URL always ends with exactly one job.
+        Skipped/failed/completed jobs do not block a new job.
         
         Args:
             blog_url: URL of the blog to process
             publisher_id: ID of the publisher creating the job
             config: Publisher configuration for processing
+            subscription_tier: Publisher subscription tier (scheduling weight)
+            priority: Priority lane (interactive, normal, backfill)
             
         Returns:
-            Tuple of (job_id: str, is_new_job: bool)
-            - job_id: The job ID (existing or newly created)
-            - is_new_job: True if a new job was created, False if an existing job was returned
+            Tuple of (job, is_new_job)
         """
-        # Check if URL is already queued or processing
-        # Allow immediate requeuing of skipped jobs, but prevent duplicate QUEUED/PROCESSING jobs
-        existing = await self.collection.find_one({
-            "blog_url": blog_url,
-            "status": {"$in": [JobStatus.QUEUED.value, JobStatus.PROCESSING.value]}
-        })
-        
-        if existing:
-            logger.info(f"📋 Job already queued/processing for URL: {blog_url}")
-            return existing.get("job_id"), False
-        
-        # Create new job
         job = ProcessingJob(
             blog_url=blog_url,
             publisher_id=publisher_id,
+            subscription_tier=subscription_tier,
+            priority=priority,
             config=config
         )
         job_dict = job.dict()
         
-        await self.collection.insert_one(job_dict)
-        logger.info(f"✅ Created job {job.job_id} for URL: {blog_url} (Publisher: {publisher_id})")
+        for attempt in range(2):
+            try:
+                result = await self.collection.find_one_and_update(
+                    {"blog_url": blog_url, "status": {"$in": ACTIVE_STATUSES}},
+                    {"$setOnInsert": job_dict},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER
+                )
+                break
+            except DuplicateKeyError:
+                # A concurrent request inserted the active job first; the retry matches it
+                if attempt:
+                    raise
+        
+        if result["job_id"] == job.job_id:
+            logger.info(f"✅ Created job {job.job_id} for URL: {blog_url} (Publisher: {publisher_id})")
+            return job, True
+        
+        logger.info(f"📋 Job already queued/processing for URL: {blog_url}")
+        await self._promote_priority(result, priority)
+        return ProcessingJob(**result), False
+    
+    async def create_job(
+        self,
+        blog_url: str,
+        publisher_id: Optional[str] = None,
+        config: Optional[dict] = None,
+        subscription_tier: Optional[str] = None,
+        priority: str = JobPriority.NORMAL.value
+    ) -> tuple[str, bool]:
+        """
+        Create a new processing job with publisher context.
         
-        return job.job_id, True
+        Args:
+            blog_url: URL of the blog to process
+            publisher_id: ID of the publisher creating the job
+            config: Publisher configuration for processing
+            subscription_tier: Publisher subscription tier (scheduling weight)
+            priority: Priority lane (interactive, normal, backfill)
+            
+        Returns:
+            Tuple of (job_id: str, is_new_job: bool)
+            - job_id: The job ID (existing or newly created)
+            - is_new_job: True if a new job was created, False if an existing job was returned
+        """
+        job, is_new_job = await self.create_or_get_job(
+            blog_url,
+            publisher_id=publisher_id,
+            config=config,
+            subscription_tier=subscription_tier,
+            priority=priority
+        )
+        return job.job_id, is_new_job
     
     async def enqueue_job(
         self, 
         blog_url: str,
         publisher_id: Optional[str] = None,
-        config: Optional[dict] = None
+        config: Optional[dict] = None,
+        subscription_tier: Optional[str] = None,
+        priority: str = JobPriority.NORMAL.value
     ) -> ProcessingJob:
         """
         Enqueue a new processing job.
@@ -89,49 +423,200 @@ class JobRepository:
             blog_url: URL of the blog to process
             publisher_id: ID of the publisher creating the job (optional)
             config: Publisher configuration for processing (optional)
+            subscription_tier: Publisher subscription tier (scheduling weight, optional)
+            priority: Priority lane (interactive, normal, backfill)
             
         Returns:
-            Created ProcessingJob
+            Created ProcessingJob (or the URL's existing active job)
         """
-        # Check if URL is already queued or processing
-        existing = await self.collection.find_one({
-            "blog_url": blog_url,
-            "status": {"$in": [JobStatus.QUEUED.value, JobStatus.PROCESSING.value]}
-        })
-        
-        if existing:
-            logger.info(f"📋 Job already queued/processing for URL: {blog_url}")
-            return ProcessingJob(**existing)
-        
-        # Create new job with publisher context
-        job = ProcessingJob(
-            blog_url=blog_url,
+        job, _ = await self.create_or_get_job(
+            blog_url,
             publisher_id=publisher_id,
-            config=config
+            config=config,
+            subscription_tier=subscription_tier,
+            priority=priority
         )
-        job_dict = job.dict()
+        return job
+    
+    async def find_jobs_by_urls(self, blog_urls: List[str], statuses: List[str]) -> Dict[str, dict]:
+        """
+        Look up jobs for many URLs in one query.
         
-        await self.collection.insert_one(job_dict)
-        logger.info(f"✅ Enqueued job {job.job_id} for URL: {blog_url} (Publisher: {publisher_id})")
+        Args:
+            blog_urls: Normalized blog URLs
+            statuses: Job statuses to match
+            
+        Returns:
+            Dict of blog_url -> most recent matching job document
+        """
+        if not blog_urls:
+            return {}
         
-        return job
+        jobs = {}
+        async for job in self.collection.find(
+            {"blog_url": {"$in": blog_urls}, "status": {"$in": statuses}}
+        ).sort("created_at", ASCENDING):
+            jobs[job["blog_url"]] = job
+        return jobs
+    
+    async def enqueue_jobs(self, jobs: List[ProcessingJob]) -> List[ProcessingJob]:
+        """
+        Insert many new jobs with a single unordered insert_many.
+        
+        Jobs for URLs that already have an active job are rejected by the
+        partial unique index and left out of the result.
+        
+        Args:
+            jobs: Jobs to insert
+            
+        Returns:
+            Jobs that were inserted (failed documents are left out)
+        """
+        if not jobs:
+            return []
+        
+        try:
+            await self.collection.insert_many([job.dict() for job in jobs], ordered=False)
+            inserted = jobs
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            inserted = [job for idx, job in enumerate(jobs) if idx not in failed]
+            logger.warning(f"⚠️  {len(failed)}/{len(jobs)} jobs failed to insert: {e.details.get('writeErrors', [])[:3]}")
+        
+        logger.info(f"✅ Enqueued {len(inserted)} jobs in batch")
+        return inserted
     
     async def get_job_by_id(self, job_id: str) -> Optional[ProcessingJob]:
-        """Get job by job_id."""
+        """Get job by job_id (including dead-lettered jobs)."""
         job_dict = await self.collection.find_one({"job_id": job_id})
+        if not job_dict:
+            job_dict = await self.dead_letters.find_one({"job_id": job_id})
         if job_dict:
             return ProcessingJob(**job_dict)
         return None
     
+    async def _queued_lane_heads(self) -> Dict[str, Dict[Optional[str], dict]]:
+        """
+        Get the oldest queued job of every publisher in every priority lane.
+        
+        The sort + $first group is answered from the
+        (status, priority, publisher_id, created_at) index with a distinct
+        scan, so the cost grows with the number of publishers, not the queue
+        length. Jobs without a priority (created before lanes existed) belong
+        to the normal lane.
+        
+        Returns:
+            Dict of lane -> publisher_id -> {"created_at", "subscription_tier"} of its head job
+        """
+        pipeline = [
+            {"$match": {"status": JobStatus.QUEUED.value}},
+            {"$sort": {"priority": ASCENDING, "publisher_id": ASCENDING, "created_at": ASCENDING}},
+            {
+                "$group": {
+                    "_id": {"priority": "$priority", "publisher_id": "$publisher_id"},
+                    "created_at": {"$first": "$created_at"},
+                    "subscription_tier": {"$first": "$subscription_tier"}
+                }
+            }
+        ]
+        lanes: Dict[str, Dict[Optional[str], dict]] = {}
+        async for head in self.collection.aggregate(pipeline):
+            lane = head["_id"].get("priority") or JobPriority.NORMAL.value
+            publisher_id = head["_id"].get("publisher_id")
+            current = lanes.setdefault(lane, {}).get(publisher_id)
+            if current is None or head["created_at"] < current["created_at"]:
+                lanes[lane][publisher_id] = head
+        return lanes
+    
+    async def _processing_counts(self) -> tuple[Dict[Optional[str], int], Dict[str, int]]:
+        """
+        Count in-flight (processing) jobs across all workers.
+        
+        Returns:
+            Tuple of (count per publisher_id, count per lane)
+        """
+        pipeline = [
+            {"$match": {"status": JobStatus.PROCESSING.value}},
+            {
+                "$group": {
+                    "_id": {"priority": "$priority", "publisher_id": "$publisher_id"},
+                    "count": {"$sum": 1}
+                }
+            }
+        ]
+        by_publisher: Dict[Optional[str], int] = {}
+        by_lane: Dict[str, int] = {}
+        async for group in self.collection.aggregate(pipeline):
+            publisher_id = group["_id"].get("publisher_id")
+            lane = group["_id"].get("priority") or JobPriority.NORMAL.value
+            by_publisher[publisher_id] = by_publisher.get(publisher_id, 0) + group["count"]
+            by_lane[lane] = by_lane.get(lane, 0) + group["count"]
+        return by_publisher, by_lane
+    
+    @staticmethod
+    def _lane_filter(lane: str):
+        """Query value matching a lane's jobs (legacy jobs without priority are normal)."""
+        if lane == JobPriority.NORMAL.value:
+            return {"$in": [lane, None]}
+        return lane
+    
+    @staticmethod
+    def _pick_lane(lanes: Dict[str, Dict[Optional[str], dict]], running_by_lane: Dict[str, int]) -> str:
+        """
+        Choose the priority lane the next claim is served from.
+        
+        Higher lanes are drained first. A lower lane whose oldest job has
+        waited longer than its LANE_MAX_WAIT_SECONDS is starving: it is
+        served first until it holds LANE_STARVATION_SLOTS in-flight jobs,
+        which guarantees progress without letting a backlog take over.
+        """
+        ordered = sorted(lanes, key=get_lane_rank)
+        now = datetime.utcnow()
+        
+        for lane in ordered[1:]:
+            max_wait = LANE_MAX_WAIT_SECONDS.get(lane)
+            if max_wait is None or running_by_lane.get(lane, 0) >= LANE_STARVATION_SLOTS:
+                continue
+            oldest = min(head["created_at"] for head in lanes[lane].values())
+            if (now - oldest).total_seconds() > max_wait:
+                return lane
+        
+        return ordered[0]
+    
+    @staticmethod
+    def _pick_publisher(heads: Dict[Optional[str], dict], running: Dict[Optional[str], int]) -> Optional[str]:
+        """
+        Choose the publisher whose job runs next (weighted fair share).
+        
+        The publisher using the smallest share of its weight
+        (in-flight jobs / tier weight) goes first; ties go to the publisher
+        with the oldest queued job.
+        """
+        return min(
+            heads,
+            key=lambda publisher_id: (
+                running.get(publisher_id, 0) / get_scheduling_weight(heads[publisher_id].get("subscription_tier")),
+                heads[publisher_id]["created_at"]
+            )
+        )
+    
     async def get_next_queued_job(self) -> Optional[ProcessingJob]:
         """
-        Get the next queued job (oldest first).
+        Get the next queued job: highest priority lane first, then weighted
+        fair share across publishers (FIFO within a publisher).
         
         Returns:
             ProcessingJob or None if queue is empty
         """
+        lanes = await self._queued_lane_heads()
+        if not lanes:
+            return None
+        
+        running, running_by_lane = await self._processing_counts()
+        lane = self._pick_lane(lanes, running_by_lane)
+        publisher_id = self._pick_publisher(lanes[lane], running)
         job_dict = await self.collection.find_one(
-            {"status": JobStatus.QUEUED.value},
+            {"status": JobStatus.QUEUED.value, "priority": self._lane_filter(lane), "publisher_id": publisher_id},
             sort=[("created_at", ASCENDING)]
         )
         
@@ -139,6 +624,191 @@ class JobRepository:
             return ProcessingJob(**job_dict)
         return None
     
+    async def claim_next_jobs(
+        self,
+        worker_id: str,
+        n: int = 1,
+        lease_seconds: int = 120
+    ) -> List[ProcessingJob]:
+        """
+        Atomically claim up to n queued jobs for a worker.
+        
+        Jobs are claimed from the highest priority lane (interactive, then
+        normal, then backfill), with starvation protection for the lower
+        lanes (see _pick_lane). Within a lane, publishers share worker
+        capacity by weighted fair share: each claim goes to the publisher
+        with the fewest in-flight jobs relative to its subscription tier
+        weight, so one publisher's bulk import cannot starve the others.
+        Within a publisher jobs are claimed oldest first.
+        
+        Each claim is a single find_one_and_update that moves the job from
+        queued to processing, so concurrent workers can never claim the same
+        job. The claim comes with a lease that the worker must keep renewing
+        (see renew_lease); jobs whose lease expires are requeued by
+        requeue_expired_jobs.
+        
+        Args:
+            worker_id: Identifier of the claiming worker (stamped on the job)
+            n: Maximum number of jobs to claim
+            lease_seconds: Initial lease duration
+            
+        Returns:
+            List of claimed jobs in claim order, empty if the queue is empty
+        """
+        claimed: List[ProcessingJob] = []
+        if n <= 0:
+            return claimed
+        
+        lanes = await self._queued_lane_heads()
+        running, running_by_lane = await self._processing_counts() if lanes else ({}, {})
+        
+        while lanes and len(claimed) < n:
+            lane = self._pick_lane(lanes, running_by_lane)
+            heads = lanes[lane]
+            publisher_id = self._pick_publisher(heads, running)
+            now = datetime.utcnow()
+            job_dict = await self.collection.find_one_and_update(
+                {"status": JobStatus.QUEUED.value, "priority": self._lane_filter(lane), "publisher_id": publisher_id},
+                {
+                    "$set": {
+                        "status": JobStatus.PROCESSING.value,
+                        "worker_id": worker_id,
+                        "claimed_at": now,
+                        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                        "started_at": now,
+                        "updated_at": now
+                    }
+                },
+                sort=[("created_at", ASCENDING)],
+                return_document=ReturnDocument.AFTER
+            )
+            
+            if not job_dict:
+                # Publisher's lane queue drained (possibly by another worker)
+                heads.pop(publisher_id)
+                if not heads:
+                    lanes.pop(lane)
+                continue
+            
+            running[publisher_id] = running.get(publisher_id, 0) + 1
+            running_by_lane[lane] = running_by_lane.get(lane, 0) + 1
+            heads[publisher_id]["created_at"] = job_dict["created_at"]
+            claimed.append(ProcessingJob(**job_dict))
+        
+        if claimed:
+            logger.info(f"🔄 Worker {worker_id} claimed {len(claimed)} job(s): {', '.join(job.job_id for job in claimed)}")
+        
+        return claimed
+    
+    async def renew_lease(self, job_id: str, worker_id: str, lease_seconds: int = 120) -> bool:
+        """
+        Extend the lease of a job owned by a worker (heartbeat).
+        
+        Args:
+            job_id: Job ID
+            worker_id: Worker that claimed the job
+            lease_seconds: New lease duration from now
+            
+        Returns:
+            True if the lease was renewed, False if the worker no longer owns the job
+        """
+        result = await self.collection.update_one(
+            {
+                "job_id": job_id,
+                "worker_id": worker_id,
+                "status": JobStatus.PROCESSING.value
+            },
+            {
+                "$set": {
+                    "lease_expires_at": datetime.utcnow() + timedelta(seconds=lease_seconds)
+                }
+            }
+        )
+        
+        return result.matched_count > 0
+    
+    async def requeue_expired_jobs(self, lease_seconds: int = 120) -> List[ProcessingJob]:
+        """
+        Reclaim processing jobs whose worker stopped renewing the lease.
+        
+        Each expired job counts as a failed attempt and goes through the same
+        path as mark_job_failed: a delayed retry with backoff while it has
+        retries left, otherwise the dead-letter collection. A job that keeps
+        crashing its worker therefore backs off and eventually stops. Every
+        transition is guarded on the lease still being expired, so concurrent
+        reapers never double-count a job.
+        
+        Jobs claimed before leases existed (no lease_expires_at) are treated
+        as expired once they have been processing for longer than lease_seconds.
+        
+        Args:
+            lease_seconds: Lease duration, used for jobs without a lease field
+            
+        Returns:
+            List of reaped jobs in their new state (retrying or failed)
+        """
+        now = datetime.utcnow()
+        expired_filter = {
+            "status": JobStatus.PROCESSING.value,
+            "$or": [
+                {"lease_expires_at": {"$lt": now}},
+                {
+                    "lease_expires_at": None,
+                    "started_at": {"$lt": now - timedelta(seconds=lease_seconds)}
+                }
+            ]
+        }
+        
+        reaped: List[ProcessingJob] = []
+        
+        while True:
+            job_dict = await self.collection.find_one(expired_filter)
+            if not job_dict:
+                break
+            
+            logger.warning(f"⚠️  Job {job_dict['job_id']} lease expired (worker {job_dict.get('worker_id')})")
+            job_dict = await self._fail_job(
+                job_dict,
+                {**expired_filter, "job_id": job_dict["job_id"]},
+                error_message="Worker lease expired (worker crashed or was restarted)",
+                should_retry=True,
+                error_type="lease_expired"
+            )
+            if job_dict:
+                reaped.append(ProcessingJob(**job_dict))
+        
+        return reaped
+    
+    def watch_queued_jobs(self):
+        """
+        Open a change stream for jobs that become available to claim.
+        
+        Matches inserts of queued jobs and updates that move a job back to
+        queued (e.g. a failed job being requeued for retry). Requires a replica
+        set or sharded cluster; on a standalone mongod the first read from the
+        stream raises pymongo.errors.OperationFailure.
+        
+        Returns:
+            Motor change stream (use as an async context manager / iterator)
+        """
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {
+                            "operationType": "insert",
+                            "fullDocument.status": JobStatus.QUEUED.value
+                        },
+                        {
+                            "operationType": "update",
+                            "updateDescription.updatedFields.status": JobStatus.QUEUED.value
+                        }
+                    ]
+                }
+            }
+        ]
+        return self.collection.watch(pipeline)
+    
     async def mark_job_processing(self, job_id: str) -> bool:
         """
         Mark a job as processing.
@@ -167,25 +837,38 @@ class JobRepository:
             logger.warning(f"⚠️  Could not mark job {job_id} as processing (may have been picked up by another worker)")
             return False
     
+    @staticmethod
+    def _owned_filter(job_id: str, worker_id: Optional[str]) -> dict:
+        """Filter matching a job only while it is processing under worker_id's lease."""
+        query = {"job_id": job_id, "status": JobStatus.PROCESSING.value}
+        if worker_id:
+            query["worker_id"] = worker_id
+        return query
+    
     async def mark_job_completed(
         self,
         job_id: str,
         processing_time_seconds: float,
-        result: dict
+        result: dict,
+        worker_id: Optional[str] = None
     ) -> bool:
         """
         Mark a job as completed.
         
+        Only a processing job still owned by worker_id is updated, so a
+        worker whose lease expired cannot overwrite the new owner's state.
+        
         Args:
             job_id: Job ID
             processing_time_seconds: Time taken to process
             result: Processing result
+            worker_id: Worker that claimed the job
             
         Returns:
-            True if successfully updated
+            True if successfully updated, False if the job is no longer owned
         """
         update_result = await self.collection.update_one(
-            {"job_id": job_id},
+            self._owned_filter(job_id, worker_id),
             {
                 "$set": {
                     "status": JobStatus.COMPLETED.value,
@@ -199,88 +882,260 @@ class JobRepository:
         
         if update_result.modified_count > 0:
             logger.info(f"✅ Job {job_id} marked as completed ({processing_time_seconds:.2f}s)")
+            await self.delete_checkpoint(job_id)
             return True
+        
+        logger.warning(f"⚠️  Job {job_id} is no longer owned by worker {worker_id}, not marking it completed")
         return False
     
     async def mark_job_failed(
         self,
         job_id: str,
         error_message: str,
-        should_retry: bool = True
+        should_retry: bool = True,
+        error_type: Optional[str] = None,
+        worker_id: Optional[str] = None
     ) -> bool:
         """
-        Mark a job as failed and optionally requeue for retry.
+        Mark a job as failed and schedule a delayed retry or dead-letter it.
+        
+        A retryable failure under max_retries moves the job to `retrying` with
+        next_attempt_at set by exponential backoff; promote_due_retries() puts
+        it back in the queue once that time has passed. Anything else is moved
+        to the dead_letter_jobs collection. Only a processing job still owned
+        by worker_id is touched.
         
         Args:
             job_id: Job ID
             error_message: Error message
-            should_retry: If True, increment failure_count and requeue if under max_retries
+            should_retry: If False, the failure is permanent and the job is dead-lettered
+            error_type: Failure category (crawl_error, llm_error, ...)
+            worker_id: Worker that claimed the job
             
         Returns:
-            True if successfully updated
+            True if successfully updated, False if the job is no longer owned
         """
-        # Get current job
-        job = await self.get_job_by_id(job_id)
-        if not job:
-            logger.error(f"❌ Job {job_id} not found")
+        owned = self._owned_filter(job_id, worker_id)
+        job_dict = await self.collection.find_one(owned)
+        if not job_dict:
+            logger.warning(f"⚠️  Job {job_id} is no longer owned by worker {worker_id}, not marking it failed")
             return False
         
-        new_failure_count = job.failure_count + 1
+        return await self._fail_job(job_dict, owned, error_message, should_retry, error_type) is not None
+    
+    async def _fail_job(
+        self,
+        job_dict: dict,
+        guard: dict,
+        error_message: str,
+        should_retry: bool,
+        error_type: Optional[str]
+    ) -> Optional[dict]:
+        """
+        Record a failed attempt: schedule a delayed retry or dead-letter the job.
         
-        # Determine new status
-        if should_retry and new_failure_count < job.max_retries:
-            new_status = JobStatus.QUEUED.value
-            logger.warning(f"⚠️  Job {job_id} failed (attempt {new_failure_count}/{job.max_retries}), requeuing...")
-        else:
-            new_status = JobStatus.FAILED.value
+        Args:
+            job_dict: Job document as read before the failure is recorded
+            guard: Filter the job must still match (ownership / expired lease)
+            error_message: Error message
+            should_retry: If False, the failure is permanent
+            error_type: Failure category
+            
+        Returns:
+            Job document in its new state (retrying or failed), or None if the
+            guard no longer matched
+        """
+        job_id = job_dict["job_id"]
+        new_failure_count = job_dict.get("failure_count", 0) + 1
+        max_retries = job_dict.get("max_retries", 3)
+        now = datetime.utcnow()
+        
+        if should_retry and new_failure_count < max_retries:
+            delay = get_retry_delay(new_failure_count)
+            job_dict = await self.collection.find_one_and_update(
+                guard,
+                {
+                    "$set": {
+                        "status": JobStatus.RETRYING.value,
+                        "failure_count": new_failure_count,
+                        "error_message": error_message,
+                        "error_type": error_type,
+                        "next_attempt_at": now + timedelta(seconds=delay),
+                        "updated_at": now
+                    },
+                    "$unset": {"worker_id": "", "claimed_at": "", "lease_expires_at": ""}
+                },
+                return_document=ReturnDocument.AFTER
+            )
+            if not job_dict:
+                logger.warning(f"⚠️  Job {job_id} changed before its failure could be recorded")
+                return None
+            logger.warning(
+                f"⚠️  Job {job_id} failed (attempt {new_failure_count}/{max_retries}, {error_type or 'unknown'}), "
+                f"retrying in {delay:.0f}s..."
+            )
+            return job_dict
+        
+        if should_retry:
             logger.error(f"❌ Job {job_id} failed permanently after {new_failure_count} attempts")
+        else:
+            logger.error(f"❌ Job {job_id} failed with non-retryable {error_type or 'error'}")
         
-        # Update job
-        update_result = await self.collection.update_one(
-            {"job_id": job_id},
+        # Take the job out of the queue first so a reclaim cannot race the move
+        job_dict = await self.collection.find_one_and_update(
+            guard,
             {
                 "$set": {
-                    "status": new_status,
+                    "status": JobStatus.FAILED.value,
                     "failure_count": new_failure_count,
                     "error_message": error_message,
-                    "updated_at": datetime.utcnow()
+                    "error_type": error_type,
+                    "updated_at": now
                 }
+            },
+            return_document=ReturnDocument.AFTER
+        )
+        if not job_dict:
+            logger.warning(f"⚠️  Job {job_id} was reclaimed before it could be dead-lettered")
+            return None
+        await self._dead_letter(job_dict)
+        return job_dict
+    
+    async def _dead_letter(self, job_dict: dict) -> bool:
+        """
+        Move a permanently failed job to the dead_letter_jobs collection.
+        
+        The copy is written before the queue document is deleted, so a crash
+        in between leaves the job in both places rather than losing it.
+        
+        Args:
+            job_dict: Job document in its final (failed) state
+            
+        Returns:
+            True if the job was moved
+        """
+        dead_letter = {
+            key: value for key, value in job_dict.items()
+            if key not in ("_id", "worker_id", "claimed_at", "lease_expires_at", "next_attempt_at")
+        }
+        dead_letter["dead_lettered_at"] = datetime.utcnow()
+        
+        try:
+            await self.dead_letters.replace_one({"job_id": job_dict["job_id"]}, dead_letter, upsert=True)
+            await self.collection.delete_one({"job_id": job_dict["job_id"], "status": JobStatus.FAILED.value})
+        except Exception as e:
+            logger.error(f"❌ Failed to dead-letter job {job_dict['job_id']}: {e}")
+            return False
+        
+        await self.delete_checkpoint(job_dict["job_id"])
+        
+        logger.info(f"🪦 Job {job_dict['job_id']} moved to dead letter queue")
+        return True
+    
+    async def promote_due_retries(self) -> int:
+        """
+        Move retrying jobs whose backoff has elapsed back to the queue.
+        
+        Claims only ever look at queued jobs, so waiting retries never slow
+        down the claim query.
+        
+        Returns:
+            Number of jobs requeued
+        """
+        now = datetime.utcnow()
+        result = await self.collection.update_many(
+            {"status": JobStatus.RETRYING.value, "next_attempt_at": {"$lte": now}},
+            {
+                "$set": {"status": JobStatus.QUEUED.value, "updated_at": now},
+                "$unset": {"next_attempt_at": ""}
             }
         )
         
-        return update_result.modified_count > 0
+        if result.modified_count:
+            logger.info(f"🔁 Requeued {result.modified_count} job(s) for retry")
+        return result.modified_count
     
-    async def mark_job_skipped(
-        self,
-        job_id: str,
-        error_message: str = "Job skipped due to threshold check"
-    ) -> bool:
+    async def get_checkpoint(self, job_id: str) -> dict:
         """
-        Mark a job as skipped.
+        Get the stage outputs saved by earlier attempts of a job.
         
         Args:
             job_id: Job ID
-            error_message: Reason for skipping
             
         Returns:
-            True if successfully updated
+            Checkpoint fields (empty dict if the job has none)
         """
-        update_result = await self.collection.update_one(
-            {"job_id": job_id},
+        checkpoint = await self.checkpoints.find_one({"_id": job_id})
+        if not checkpoint:
+            return {}
+        checkpoint.pop("_id", None)
+        checkpoint.pop("updated_at", None)
+        return checkpoint
+    
+    async def save_checkpoint(self, job_id: str, **fields):
+        """
+        Merge stage outputs into a job's checkpoint.
+        
+        Args:
+            job_id: Job ID
+            **fields: Checkpoint fields to set (e.g. summary=..., questions=...)
+        """
+        await self.checkpoints.update_one(
+            {"_id": job_id},
+            {"$set": {**fields, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+    
+    async def delete_checkpoint(self, job_id: str):
+        """Drop a job's checkpoint (job finished or checkpoint no longer valid)."""
+        try:
+            await self.checkpoints.delete_one({"_id": job_id})
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to delete checkpoint of job {job_id}: {e}")
+    
+    async def get_lane_queue_stats(self) -> List[dict]:
+        """
+        Get queue depth and oldest queued job per priority lane.
+        
+        Returns:
+            List of {"priority", "depth", "oldest_created_at"}
+        """
+        pipeline = [
+            {"$match": {"status": JobStatus.QUEUED.value}},
             {
-                "$set": {
-                    "status": JobStatus.SKIPPED.value,
-                    "completed_at": datetime.utcnow(),
-                    "updated_at": datetime.utcnow(),
-                    "error_message": error_message
+                "$group": {
+                    "_id": {"$ifNull": ["$priority", JobPriority.NORMAL.value]},
+                    "depth": {"$sum": 1},
+                    "oldest_created_at": {"$min": "$created_at"}
                 }
             }
-        )
+        ]
+        return [
+            {"priority": group["_id"], "depth": group["depth"], "oldest_created_at": group["oldest_created_at"]}
+            async for group in self.collection.aggregate(pipeline)
+        ]
+    
+    async def get_publisher_queue_stats(self) -> List[dict]:
+        """
+        Get queue depth and oldest queued job per publisher.
         
-        if update_result.modified_count > 0:
-            logger.info(f"⏭️  Job {job_id} marked as skipped: {error_message}")
-            return True
-        return False
+        Returns:
+            List of {"publisher_id", "depth", "oldest_created_at"}
+        """
+        pipeline = [
+            {"$match": {"status": JobStatus.QUEUED.value}},
+            {
+                "$group": {
+                    "_id": "$publisher_id",
+                    "depth": {"$sum": 1},
+                    "oldest_created_at": {"$min": "$created_at"}
+                }
+            }
+        ]
+        return [
+            {"publisher_id": group["_id"], "depth": group["depth"], "oldest_created_at": group["oldest_created_at"]}
+            async for group in self.collection.aggregate(pipeline)
+        ]
     
     async def get_job_stats(self) -> dict:
         """Get statistics about jobs in the queue."""
@@ -299,13 +1154,14 @@ class JobRepository:
         for result in results:
             stats[result["_id"]] = result["count"]
         
+        # Permanently failed jobs live in the dead-letter collection
+        stats[JobStatus.FAILED.value] += await self.dead_letters.estimated_document_count()
+        
         return stats
     
     async def get_failed_jobs(self, limit: int = 10) -> List[ProcessingJob]:
-        """Get recently failed jobs."""
-        cursor = self.collection.find(
-            {"status": JobStatus.FAILED.value}
-        ).sort("updated_at", -1).limit(limit)
+        """Get recently dead-lettered jobs."""
+        cursor = self.dead_letters.find({}).sort("dead_lettered_at", -1).limit(limit)
         
         jobs = []
         async for job_dict in cursor:
@@ -314,12 +1170,13 @@ class JobRepository:
         return jobs
     
     async def cancel_job(self, job_id: str) -> bool:
-        """Cancel a queued job."""
+        """Cancel a queued job, or a retrying one waiting out its backoff."""
         result = await self.collection.update_one(
-            {"job_id": job_id, "status": JobStatus.QUEUED.value},
+            {"job_id": job_id, "status": {"$in": [JobStatus.QUEUED.value, JobStatus.RETRYING.value]}},
             {
                 "$set": {
                     "status": JobStatus.CANCELLED.value,
+                    "next_attempt_at": None,
                     "updated_at": datetime.utcnow()
                 }
             }
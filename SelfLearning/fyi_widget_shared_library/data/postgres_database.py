@@ -4,12 +4,15 @@ PostgreSQL database manager for publisher configurations.
 Uses SQLAlchemy with async support for managing publisher data.
 """
 
+import asyncio
+import json
 import logging
 import uuid
 import secrets
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy import create_engine, Column, String, Integer, Float, Boolean, DateTime, JSON, Enum as SQLEnum, update, case
+from typing import Optional, List, Dict, Any, Callable
+from sqlalchemy import create_engine, Column, String, Integer, Float, Boolean, DateTime, JSON, Enum as SQLEnum, update, case, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -22,6 +25,35 @@ logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# NOTIFY channel for publisher inserts/deletes and settings updates
+PUBLISHER_CHANGES_CHANNEL = "publisher_changes"
+
+# Usage counters are updated on every job, so only these columns notify listeners
+_PUBLISHER_CHANGE_TRIGGER_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION notify_publisher_change() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            PERFORM pg_notify('{PUBLISHER_CHANGES_CHANNEL}', CAST(json_build_object('op', TG_OP, 'id', OLD.id) AS text));
+        ELSIF TG_OP = 'UPDATE' THEN
+            PERFORM pg_notify('{PUBLISHER_CHANGES_CHANNEL}', CAST(json_build_object(
+                'op', TG_OP, 'id', NEW.id, 'domain_changed', OLD.domain IS DISTINCT FROM NEW.domain
+            ) AS text));
+        ELSE
+            PERFORM pg_notify('{PUBLISHER_CHANGES_CHANNEL}', CAST(json_build_object('op', TG_OP, 'id', NEW.id) AS text));
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS publisher_change_notify ON publishers",
+    """
+    CREATE TRIGGER publisher_change_notify
+    AFTER INSERT OR DELETE OR UPDATE OF config, domain, status, subscription_tier ON publishers
+    FOR EACH ROW EXECUTE FUNCTION notify_publisher_change()
+    """,
+]
+
 
 class PublisherTable(Base):
     """SQLAlchemy model for Publisher table."""
@@ -97,12 +129,73 @@ class PostgresPublisherRepository:
             async with self.engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
             
+            await self._create_change_trigger()
+            
             logger.info("✅ PostgreSQL connected and tables created")
             
         except Exception as e:
             logger.error(f"❌ Failed to connect to PostgreSQL: {e}")
             raise
     
+    async def _create_change_trigger(self):
+        """Create the trigger that NOTIFYs listeners when a publisher changes."""
+        try:
+            async with self.engine.begin() as conn:
+                for statement in _PUBLISHER_CHANGE_TRIGGER_SQL:
+                    await conn.execute(text(statement))
+            logger.info("✅ Publisher change notification trigger created")
+        except Exception as e:
+            # Listeners still see changes once their cache TTL expires
+            logger.warning(f"⚠️  Publisher change trigger creation warning: {e}")
+    
+    async def listen_for_changes(
+        self,
+        callback: Callable[[Optional[Dict[str, Any]]], None],
+        reconnect_delay: float = 5.0
+    ):
+        """
+        Call `callback` with every publisher change notification (runs until cancelled).
+        
+        LISTEN needs a dedicated autocommit connection, so a psycopg
+        connection is opened outside the SQLAlchemy pool. Notifications sent
+        while disconnected are lost, so callback(None) is called after every
+        reconnect to signal that anything may have changed.
+        
+        Args:
+            callback: Receives {"op", "id", "domain_changed"} per change, or None after a reconnect
+            reconnect_delay: Seconds to wait before reconnecting after an error
+        """
+        try:
+            import psycopg
+        except ImportError:
+            logger.warning("⚠️  psycopg not installed - publisher change notifications disabled")
+            return
+        
+        conninfo = make_url(self.database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        connected_before = False
+        
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {PUBLISHER_CHANGES_CHANNEL}")
+                    logger.info(f"👂 Listening for publisher changes on '{PUBLISHER_CHANGES_CHANNEL}'")
+                    if connected_before:
+                        callback(None)
+                    connected_before = True
+                    
+                    async for notify in conn.notifies():
+                        try:
+                            change = json.loads(notify.payload)
+                        except ValueError:
+                            change = None
+                        callback(change)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️  Publisher change listener disconnected: {e}, reconnecting in {reconnect_delay}s")
+            
+            await asyncio.sleep(reconnect_delay)
+    
     async def disconnect(self):
         """Close database connection."""
         if self.engine:
@@ -460,6 +553,83 @@ class PostgresPublisherRepository:
                 logger.error(f"❌ Failed to reserve blog slot: {e}")
                 raise
 
+    async def reserve_blog_slots(self, publisher_id: str, count: int) -> int:
+        """
+        Reserve up to `count` blog processing slots in one transaction (atomic).
+
+        Unlike reserve_blog_slot this grants as many slots as the
+        max_total_blogs limit still allows instead of failing outright.
+
+        Args:
+            publisher_id: Publisher ID
+            count: Number of slots wanted
+
+        Returns:
+            Number of slots reserved (0..count)
+        """
+        if count <= 0:
+            return 0
+
+        async with self.async_session_factory() as session:
+            try:
+                result = await session.execute(
+                    select(PublisherTable)
+                    .where(PublisherTable.id == publisher_id)
+                    .with_for_update()
+                )
+                db_publisher = result.scalar_one_or_none()
+                if not db_publisher:
+                    raise UsageLimitExceededError("Publisher not found")
+
+                config = db_publisher.config or {}
+                limit = config.get("max_total_blogs")
+
+                if not limit:
+                    return count
+
+                processed = db_publisher.total_blogs_processed or 0
+                reserved = db_publisher.blog_slots_reserved or 0
+                granted = max(0, min(count, limit - processed - reserved))
+
+                if granted:
+                    db_publisher.blog_slots_reserved = reserved + granted
+                    db_publisher.last_active_at = datetime.utcnow()
+                    await session.commit()
+
+                return granted
+            except UsageLimitExceededError:
+                await session.rollback()
+                raise
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"❌ Failed to reserve blog slots: {e}")
+                raise
+
+    async def release_blog_slots(self, publisher_id: str, count: int) -> None:
+        """Release `count` unused reserved slots (atomic, never below zero)."""
+        if count <= 0:
+            return
+
+        async with self.async_session_factory() as session:
+            try:
+                await session.execute(
+                    update(PublisherTable)
+                    .where(PublisherTable.id == publisher_id)
+                    .values(
+                        blog_slots_reserved=case(
+                            (PublisherTable.blog_slots_reserved > count, PublisherTable.blog_slots_reserved - count),
+                            else_=0
+                        ),
+                        last_active_at=datetime.utcnow()
+                    )
+                )
+                await session.commit()
+                logger.info(f"📉 Released {count} unused blog slots (publisher: {publisher_id})")
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"❌ Failed to release blog slots: {e}")
+                raise
+
     async def release_blog_slot(
         self,
         publisher_id: str,
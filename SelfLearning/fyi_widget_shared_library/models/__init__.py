@@ -1,6 +1,6 @@
 """Shared models."""
 
-from .job_queue import ProcessingJob, JobStatus, JobResult, JobCreateRequest, JobStatusResponse
+from .job_queue import ProcessingJob, JobStatus, JobPriority, JobResult, JobCreateRequest, JobBatchCreateRequest, JobStatusResponse
 from .api_response import (
     StandardResponse,
     SuccessResponse,
@@ -19,6 +19,7 @@ from .swagger_responses import (
     CheckAndLoadResponse,
     # Jobs
     ProcessJobResponse,
+    ProcessBatchJobResponse,
     JobStatusResponse as SwaggerJobStatusResponse,
     JobStatsResponse,
     # QA
@@ -45,8 +46,10 @@ except ImportError:
 __all__ = [
     "ProcessingJob",
     "JobStatus",
+    "JobPriority",
     "JobResult",
     "JobCreateRequest",
+    "JobBatchCreateRequest",
     "JobStatusResponse",
     "StandardResponse",
     "SuccessResponse",
@@ -60,6 +63,7 @@ __all__ = [
     "QuestionByIdResponse",
     "CheckAndLoadResponse",
     "ProcessJobResponse",
+    "ProcessBatchJobResponse",
     "SwaggerJobStatusResponse",
     "JobStatsResponse",
     "QAResponse",
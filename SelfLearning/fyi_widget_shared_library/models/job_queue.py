@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 
 
@@ -11,12 +11,20 @@ class JobStatus(str, Enum):
     """Job status enum."""
     QUEUED = "queued"
     PROCESSING = "processing"
+    RETRYING = "retrying"  # Failed, waiting for next_attempt_at before being requeued
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
     SKIPPED = "skipped"
 
 
+class JobPriority(str, Enum):
+    """Priority lane of a job (claimed highest lane first)."""
+    INTERACTIVE = "interactive"  # Reader-triggered (check-and-load)
+    NORMAL = "normal"  # Single-URL API enqueue
+    BACKFILL = "backfill"  # Bulk imports
+
+
 class JobResult(BaseModel):
     """Result of a completed job."""
     summary_id: Optional[str] = None
@@ -30,11 +38,20 @@ class ProcessingJob(BaseModel):
     job_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     blog_url: str
     publisher_id: Optional[str] = None
+    subscription_tier: Optional[str] = None  # Publisher tier at enqueue time (scheduling weight)
     config: Optional[Dict[str, Any]] = None
+    priority: JobPriority = JobPriority.NORMAL
     status: JobStatus = JobStatus.QUEUED
     failure_count: int = 0
     max_retries: int = 3
     error_message: Optional[str] = None
+    error_type: Optional[str] = None  # Failure category of the last attempt
+    next_attempt_at: Optional[datetime] = None  # When a retrying job goes back to the queue
+    
+    # Ownership (set when a worker claims the job)
+    worker_id: Optional[str] = None
+    claimed_at: Optional[datetime] = None
+    lease_expires_at: Optional[datetime] = None  # Renewed by the worker heartbeat
     
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -58,6 +75,15 @@ class JobCreateRequest(BaseModel):
     blog_url: str
 
 
+# Maximum number of URLs accepted by one batch enqueue request
+MAX_BATCH_URLS = 1000
+
+
+class JobBatchCreateRequest(BaseModel):
+    """Request to create jobs for many blog URLs at once."""
+    blog_urls: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_URLS)
+
+
 class JobStatusResponse(BaseModel):
     """Response for job status."""
     job_id: str
@@ -65,6 +91,7 @@ class JobStatusResponse(BaseModel):
     status: JobStatus
     failure_count: int
     error_message: Optional[str] = None
+    next_attempt_at: Optional[datetime] = None
     created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
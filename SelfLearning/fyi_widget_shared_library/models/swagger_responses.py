@@ -118,9 +118,11 @@ class CheckAndLoadResponse(StandardSuccessResponse):
 
 class JobResultSchema(BaseModel):
     """Job result schema."""
-    job_id: str = Field(..., example="72815d48-7283-4a89-9004-3465d1b4c293")
+    job_id: Optional[str] = Field(None, example="72815d48-7283-4a89-9004-3465d1b4c293", description="Job ID (None while awaiting threshold)")
     blog_url: str = Field(..., example="https://example.com/article")
-    status: str = Field(..., example="COMPLETED")
+    status: str = Field(..., example="COMPLETED", description="Job status, or awaiting_threshold if no job was created yet")
+    triggered_count: Optional[int] = Field(None, example=2, description="Trigger count when awaiting threshold")
+    threshold: Optional[int] = Field(None, example=5, description="Publisher processing threshold when awaiting threshold")
 
 
 class ProcessJobResponse(StandardSuccessResponse):
@@ -129,6 +131,31 @@ class ProcessJobResponse(StandardSuccessResponse):
     result: JobResultSchema
 
 
+class BatchJobItemSchema(BaseModel):
+    """Per-URL outcome of a batch enqueue."""
+    blog_url: str = Field(..., example="https://example.com/article")
+    status: str = Field(
+        ...,
+        example="queued",
+        description="queued, already_queued, already_processed, awaiting_threshold, rejected, limit_reached, or error"
+    )
+    job_id: Optional[str] = Field(None, example="72815d48-7283-4a89-9004-3465d1b4c293")
+    message: Optional[str] = Field(None, example=None)
+
+
+class BatchJobResultSchema(BaseModel):
+    """Batch enqueue result schema."""
+    total: int = Field(..., example=3, description="Distinct normalized URLs in the request")
+    enqueued: int = Field(..., example=2)
+    results: List[BatchJobItemSchema]
+
+
+class ProcessBatchJobResponse(StandardSuccessResponse):
+    """Response for POST /jobs/process-batch."""
+    status_code: int = Field(202, example=202)
+    result: BatchJobResultSchema
+
+
 class JobStatusSchema(BaseModel):
     """Job status schema."""
     job_id: str = Field(..., example="72815d48-7283-4a89-9004-3465d1b4c293")
@@ -136,6 +163,7 @@ class JobStatusSchema(BaseModel):
     status: str = Field(..., example="completed")
     failure_count: int = Field(..., example=0)
     error_message: Optional[str] = Field(None, example=None)
+    next_attempt_at: Optional[str] = Field(None, example=None)
     created_at: str = Field(..., example="2025-10-18T14:30:00")
     started_at: Optional[str] = Field(None, example="2025-10-18T14:30:05")
     completed_at: Optional[str] = Field(None, example="2025-10-18T14:35:00")
@@ -153,6 +181,7 @@ class QueueStatsSchema(BaseModel):
     """Queue statistics schema."""
     queued: int = Field(..., example=5)
     processing: int = Field(..., example=2)
+    retrying: int = Field(0, example=1)
     completed: int = Field(..., example=100)
     failed: int = Field(..., example=3)
     cancelled: int = Field(..., example=1)
@@ -1,11 +1,15 @@
 """Shared services."""
 
 from .crawler_service import CrawlerService
+from .embedding_cache import EmbeddingCache, get_embedding_cache, set_embedding_cache
 from .llm_service import LLMService
 from .storage_service import StorageService
 
 __all__ = [
     "CrawlerService",
+    "EmbeddingCache",
+    "get_embedding_cache",
+    "set_embedding_cache",
     "LLMService",
     "StorageService",
 ]
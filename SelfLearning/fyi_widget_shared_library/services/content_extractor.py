@@ -0,0 +1,534 @@
+"""
+HTML content extraction.
+
+Pure functions (no service state) so extraction can run in a worker process:
+the crawler sends the fetched HTML across the process boundary once and only
+the resulting CrawledContent comes back.
+
+Two engines produce the same result:
+- "fast": lxml, one traversal collects every candidate container, then the
+  candidates are tried in the usual priority order
+- "soup": the original BeautifulSoup implementation (also used as fallback
+  when lxml can't parse a document)
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+
+from fyi_widget_shared_library.models.schemas import CrawledContent
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - handled at runtime
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_ENGINES = ("fast", "soup")
+
+# Elements removed before extraction
+UNWANTED_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript')
+
+# Common blog content classes, in priority order (also matched as substrings)
+CONTENT_CLASSES = [
+    'post-content', 'article-content', 'entry-content',
+    'blog-post', 'post-body', 'content', 'main-content',
+    'post', 'article', 'entry', 'story', 'text'
+]
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Minimum words for a candidate container to be accepted
+MIN_CONTAINER_WORDS = 50
+
+# Tags that mark a fetched page as HTML (anything else needs enough plain-text words)
+PAGE_HTML_INDICATORS = ('<html', '<body', '<div', '<article', '<main', '<p', '<h1', '<h2', '<script', '<head', '<title')
+
+
+def extract_content(html: str, url: str, engine: str = "fast") -> Tuple[CrawledContent, float]:
+    """
+    Extract meaningful content from HTML.
+    
+    Args:
+        html: Page HTML
+        url: Page URL
+        engine: Extraction engine ("fast" or "soup")
+        
+    Returns:
+        Tuple of (CrawledContent, CPU seconds spent extracting)
+        
+    Raises:
+        ValueError: If the page is not valid HTML/text or no valid content could be extracted
+    """
+    cpu_start = time.process_time()
+    validate_page(html, url)
+    if engine == "fast" and etree is not None:
+        content = _extract_fast(html, url)
+    else:
+        content = _extract(html, url)
+    return content, time.process_time() - cpu_start
+
+
+def validate_page(html: str, url: str):
+    """
+    Reject a fetched page that is binary/corrupted or doesn't look like HTML.
+    
+    Runs with the extraction (in the process pool when configured), since
+    scanning a page of up to several MB would otherwise block the event loop.
+    
+    Args:
+        html: Page HTML
+        url: Page URL (for logging)
+        
+    Raises:
+        ValueError: If the page can't be used
+    """
+    lowered = html.lower()
+    
+    if is_invalid_content(html, lowered):
+        logger.warning(f"⚠️  Detected invalid/binary content for {url}")
+        logger.warning(f"   Text length: {len(html)} chars")
+        logger.warning(f"   First 500 chars: {repr(html[:500])}")
+        # Check if it might be a JS-rendered site (has script tags but minimal content)
+        script_tags = lowered.count('<script')
+        if script_tags > 5:
+            logger.info(f"   Detected potential JavaScript-rendered site (has {script_tags} script tags)")
+        raise ValueError("Content appears to be binary or corrupted - cannot extract valid HTML")
+    
+    # Additional check: verify it looks like HTML (be more lenient for JS-rendered sites)
+    if not any(tag in lowered for tag in PAGE_HTML_INDICATORS):
+        # Might be valid plain text, but for a web page it's suspicious
+        logger.warning(f"⚠️  Content doesn't appear to contain HTML tags: {url}")
+        # But don't fail if it's valid text with enough words
+        if len(html.split()) < 30:
+            raise ValueError("Content doesn't appear to be valid HTML or text")
+
+
+def is_invalid_content(text: str, lowered: Optional[str] = None) -> bool:
+    """
+    Check if content appears to be invalid (binary/junk data).
+    
+    Args:
+        text: Content to check
+        lowered: text.lower() if the caller already has it
+    
+    Returns True if content is likely invalid.
+    """
+    if not text or len(text) < 50:  # Reduced from 100 to be less strict
+        return True
+    
+    # Count printable vs non-printable characters
+    printable_chars = sum(1 for c in text if c.isprintable() or c.isspace())
+    total_chars = len(text)
+    
+    # If less than 50% of characters are printable, likely binary/junk (reduced from 70%)
+    if total_chars > 0 and (printable_chars / total_chars) < 0.5:
+        logger.warning(f"⚠️  Low printable character ratio: {printable_chars/total_chars:.2%}")
+        return True
+    
+    # Check for high ratio of Unicode replacement characters (increased threshold)
+    replacement_chars = text.count('\ufffd')
+    if replacement_chars > len(text) * 0.2:  # Increased from 10% to 20%
+        logger.warning(f"⚠️  High ratio of replacement characters: {replacement_chars}/{len(text)}")
+        return True
+    
+    # Check if content looks like HTML - be more lenient
+    # Many JS-rendered sites have minimal HTML structure
+    html_indicators = ['<html', '<body', '<div', '<article', '<main', '<p', '<h1', '<h2', '<script', '<head']
+    lowered = lowered if lowered is not None else text.lower()
+    has_html_tags = any(tag in lowered for tag in html_indicators)
+    
+    if not has_html_tags:
+        # If no HTML tags but has substantial text, might be plain text (acceptable)
+        words = text.split()
+        if len(words) < 20:  # Very short content without HTML is suspicious
+            return True
+    
+    return False
+
+
+def _extract(html: str, url: str) -> CrawledContent:
+    """Extract meaningful content from HTML."""
+    # Try lxml parser first (faster, more robust), fallback to html.parser
+    try:
+        soup = BeautifulSoup(html, 'lxml')
+    except Exception:
+        # Fallback to html.parser if lxml fails
+        soup = BeautifulSoup(html, 'html.parser')
+    
+    # Remove unwanted elements
+    for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript']):
+        tag.decompose()
+    
+    # Extract title
+    title = _extract_title(soup)
+    
+    # Extract main content
+    content = _extract_main_content(soup)
+    
+    # Detect language
+    language = _detect_language(soup)
+    
+    return _build_crawled_content(url, title, content, language)
+
+
+def _build_crawled_content(url: str, title: str, content: str, language: str) -> CrawledContent:
+    """Validate extracted content and build the CrawledContent."""
+    # Validate extracted content (be more lenient)
+    if not content or len(content.strip()) < 30:  # Reduced from 50
+        raise ValueError("Extracted content is too short or empty")
+    
+    # Additional validation: check if content looks valid (but be less strict)
+    # Only fail if it's clearly invalid, not just because it's short
+    if len(content.strip()) > 100 and is_invalid_content(content):
+        raise ValueError("Extracted content appears to be invalid/binary data")
+    
+    # Calculate word count
+    word_count = len(content.split())
+    
+    # Validate minimum word count
+    if word_count < 10:
+        raise ValueError(f"Extracted content has too few words: {word_count} (minimum: 10)")
+    
+    # Parse domain for metadata
+    parsed_url = urlparse(url)
+    metadata = {
+        'domain': parsed_url.netloc,
+        'path': parsed_url.path,
+        'extracted_at': None  # Will be set by storage service
+    }
+    
+    return CrawledContent(
+        url=url,
+        title=title,
+        content=content,
+        language=language,
+        word_count=word_count,
+        metadata=metadata
+    )
+
+
+def _extract_title(soup: BeautifulSoup) -> str:
+    """Extract page title."""
+    # Try og:title first
+    og_title = soup.find('meta', property='og:title')
+    if og_title and og_title.get('content'):
+        return og_title['content']
+    
+    # Try title tag
+    title_tag = soup.find('title')
+    if title_tag:
+        return title_tag.get_text().strip()
+    
+    # Try h1
+    h1 = soup.find('h1')
+    if h1:
+        return h1.get_text().strip()
+    
+    return "Untitled"
+
+
+def _extract_main_content(soup: BeautifulSoup) -> str:
+    """Extract main article content."""
+    # Try to find main article container
+    article = soup.find('article')
+    if article:
+        text = _clean_text(article.get_text())
+        if len(text.split()) >= 50:  # Ensure we got substantial content
+            return text
+    
+    # Try main tag
+    main = soup.find('main')
+    if main:
+        text = _clean_text(main.get_text())
+        if len(text.split()) >= 50:
+            return text
+    
+    # Try common blog content classes (also try partial matches)
+    content_classes = [
+        'post-content', 'article-content', 'entry-content',
+        'blog-post', 'post-body', 'content', 'main-content',
+        'post', 'article', 'entry', 'story', 'text'
+    ]
+    
+    for cls in content_classes:
+        # Try exact match first
+        content_div = soup.find('div', class_=cls)
+        if not content_div:
+            # Try partial class match (for cases like "post-content-wrapper")
+            content_div = soup.find('div', class_=lambda x: x and cls in ' '.join(x) if isinstance(x, list) else cls in str(x))
+        if content_div:
+            text = _clean_text(content_div.get_text())
+            if len(text.split()) >= 50:
+                return text
+    
+    # Try data attributes that might contain content
+    content_div = soup.find('div', attrs={'data-content': True}) or soup.find('div', attrs={'data-post': True})
+    if content_div:
+        text = _clean_text(content_div.get_text())
+        if len(text.split()) >= 50:
+            return text
+    
+    # Fallback: get all paragraphs (filter out very short ones)
+    paragraphs = soup.find_all('p')
+    if paragraphs:
+        # Filter paragraphs by length
+        meaningful_paragraphs = [p for p in paragraphs if len(p.get_text().strip()) > 20]
+        if meaningful_paragraphs:
+            text = ' '.join(p.get_text() for p in meaningful_paragraphs)
+            cleaned = _clean_text(text)
+            if len(cleaned.split()) >= 50:
+                return cleaned
+    
+    # Try getting text from all headings and paragraphs
+    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    if headings:
+        heading_text = ' '.join(h.get_text() for h in headings)
+        if paragraphs:
+            combined = heading_text + ' ' + ' '.join(p.get_text() for p in paragraphs[:20])  # Limit paragraphs
+            cleaned = _clean_text(combined)
+            if len(cleaned.split()) >= 50:
+                return cleaned
+    
+    # Last resort: body text (but filter out script/style content more aggressively)
+    body = soup.find('body')
+    if body:
+        # Remove all script and style tags
+        for tag in body(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript', 'svg']):
+            tag.decompose()
+        text = _clean_text(body.get_text())
+        if len(text.split()) >= 50:
+            return text
+    
+    # Final fallback: entire document
+    return _clean_text(soup.get_text())
+
+
+def _clean_text(text: str) -> str:
+    """Clean and normalize text."""
+    # Remove extra whitespace
+    lines = [line.strip() for line in text.split('\n')]
+    lines = [line for line in lines if line]
+    return ' '.join(lines)
+
+
+def _detect_language(soup: BeautifulSoup) -> str:
+    """Detect page language."""
+    # Check html lang attribute
+    html_tag = soup.find('html')
+    if html_tag and html_tag.get('lang'):
+        lang = html_tag['lang']
+        # Normalize language code (e.g., "en-US" -> "en")
+        return lang.split('-')[0].lower()
+    
+    # Check meta content-language
+    lang_meta = soup.find('meta', attrs={'http-equiv': 'content-language'})
+    if lang_meta and lang_meta.get('content'):
+        lang = lang_meta['content']
+        return lang.split('-')[0].lower()
+    
+    # Default to English
+    return 'en'
+
+
+def _extract_fast(html: str, url: str) -> CrawledContent:
+    """
+    Extract content with lxml in a single traversal.
+    
+    Mirrors _extract(): same removed elements, same candidate priority
+    (article, main, content classes, data attributes, paragraphs, headings,
+    body, document) and the same 50-word acceptance rule. Candidates are
+    collected in one pass and their text is only computed when tried.
+    Falls back to the BeautifulSoup engine if lxml can't parse the page.
+    """
+    try:
+        parser = etree.HTMLParser(remove_comments=True, remove_pis=True)
+        root = etree.fromstring(html, parser)
+    except Exception as e:
+        logger.debug(f"lxml parse failed for {url} ({e}), falling back to BeautifulSoup")
+        root = None
+    if root is None:
+        return _extract(html, url)
+    
+    # Remove unwanted elements
+    for element in list(root.iter(*UNWANTED_TAGS)):
+        _drop_element(element)
+    
+    candidates = _collect_candidates(root)
+    
+    title = _fast_title(candidates)
+    content = _fast_main_content(root, candidates)
+    language = _fast_language(root, candidates)
+    
+    return _build_crawled_content(url, title, content, language)
+
+
+def _drop_element(element: Any):
+    """Remove an element but keep its tail text (like BeautifulSoup's decompose)."""
+    parent = element.getparent()
+    if parent is None:
+        return
+    
+    if element.tail:
+        previous = element.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + element.tail
+        else:
+            parent.text = (parent.text or "") + element.tail
+    parent.remove(element)
+
+
+def _collect_candidates(root: Any) -> Dict[str, Any]:
+    """Walk the tree once and record every element the extraction steps look at."""
+    candidates: Dict[str, Any] = {
+        "og_title": None,
+        "title": None,
+        "h1": None,
+        "content_language": None,
+        "article": None,
+        "main": None,
+        "body": None,
+        "data_content": None,
+        "data_post": None,
+        "class_exact": {},
+        "class_partial": {},
+        "paragraphs": [],
+        "headings": [],
+    }
+    class_exact: Dict[str, Any] = candidates["class_exact"]
+    class_partial: Dict[str, Any] = candidates["class_partial"]
+    
+    for element in root.iter():
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+        
+        if tag == 'p':
+            candidates["paragraphs"].append(element)
+        elif tag in HEADING_TAGS:
+            candidates["headings"].append(element)
+            if tag == 'h1' and candidates["h1"] is None:
+                candidates["h1"] = element
+        elif tag == 'div':
+            classes = (element.get('class') or '').split()
+            if classes:
+                for cls in CONTENT_CLASSES:
+                    if cls not in class_exact and cls in classes:
+                        class_exact[cls] = element
+                    if cls not in class_partial and any(cls in name for name in classes):
+                        class_partial[cls] = element
+            if candidates["data_content"] is None and element.get('data-content') is not None:
+                candidates["data_content"] = element
+            if candidates["data_post"] is None and element.get('data-post') is not None:
+                candidates["data_post"] = element
+        elif tag == 'meta':
+            if candidates["og_title"] is None and element.get('property') == 'og:title':
+                candidates["og_title"] = element
+            if candidates["content_language"] is None and element.get('http-equiv') == 'content-language':
+                candidates["content_language"] = element
+        elif tag in ('article', 'main', 'title', 'body') and candidates[tag] is None:
+            candidates[tag] = element
+    
+    return candidates
+
+
+def _element_text(element: Any) -> str:
+    """Concatenated text of an element and its descendants (like get_text())."""
+    return "".join(element.itertext())
+
+
+def _fast_title(candidates: Dict[str, Any]) -> str:
+    """Extract page title (og:title, <title>, first <h1>)."""
+    og_title = candidates["og_title"]
+    if og_title is not None and og_title.get('content'):
+        return og_title.get('content')
+    
+    if candidates["title"] is not None:
+        return _element_text(candidates["title"]).strip()
+    
+    if candidates["h1"] is not None:
+        return _element_text(candidates["h1"]).strip()
+    
+    return "Untitled"
+
+
+def _fast_main_content(root: Any, candidates: Dict[str, Any]) -> str:
+    """Try the candidate containers in priority order."""
+    texts: Dict[Any, str] = {}
+    
+    def container_text(element: Any) -> Optional[str]:
+        """Cleaned text of a container if it has enough words, else None."""
+        if element not in texts:
+            texts[element] = _clean_text(_element_text(element))
+        text = texts[element]
+        return text if len(text.split()) >= MIN_CONTAINER_WORDS else None
+    
+    # Article, then main
+    for key in ("article", "main"):
+        if candidates[key] is not None:
+            text = container_text(candidates[key])
+            if text:
+                return text
+    
+    # Content classes (exact class match first, then substring match)
+    for cls in CONTENT_CLASSES:
+        element = candidates["class_exact"].get(cls)
+        if element is None:
+            element = candidates["class_partial"].get(cls)
+        if element is not None:
+            text = container_text(element)
+            if text:
+                return text
+    
+    # Data attributes
+    element = candidates["data_content"] if candidates["data_content"] is not None else candidates["data_post"]
+    if element is not None:
+        text = container_text(element)
+        if text:
+            return text
+    
+    # Paragraphs (filter out very short ones)
+    paragraphs: List[Any] = candidates["paragraphs"]
+    paragraph_texts = [_element_text(p) for p in paragraphs]
+    meaningful = [text for text in paragraph_texts if len(text.strip()) > 20]
+    if meaningful:
+        cleaned = _clean_text(' '.join(meaningful))
+        if len(cleaned.split()) >= MIN_CONTAINER_WORDS:
+            return cleaned
+    
+    # Headings plus the first paragraphs
+    headings: List[Any] = candidates["headings"]
+    if headings and paragraphs:
+        heading_text = ' '.join(_element_text(h) for h in headings)
+        combined = heading_text + ' ' + ' '.join(paragraph_texts[:20])
+        cleaned = _clean_text(combined)
+        if len(cleaned.split()) >= MIN_CONTAINER_WORDS:
+            return cleaned
+    
+    # Body text without inline SVG
+    body = candidates["body"]
+    if body is not None:
+        for svg in list(body.iter('svg')):
+            _drop_element(svg)
+        text = _clean_text(_element_text(body))
+        if len(text.split()) >= MIN_CONTAINER_WORDS:
+            return text
+    
+    # Entire document
+    return _clean_text(_element_text(root))
+
+
+def _fast_language(root: Any, candidates: Dict[str, Any]) -> str:
+    """Detect page language (html lang, content-language meta, default en)."""
+    if root.tag == 'html' and root.get('lang'):
+        return root.get('lang').split('-')[0].lower()
+    
+    lang_meta = candidates["content_language"]
+    if lang_meta is not None and lang_meta.get('content'):
+        return lang_meta.get('content').split('-')[0].lower()
+    
+    return 'en'
@@ -6,16 +6,39 @@ Extracts content from web pages.
 
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+import codecs
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, Tuple
 import httpx
-from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 
 # Configuration handled by service-specific configs
 from fyi_widget_shared_library.models.schemas import CrawledContent
+from .content_extractor import EXTRACTION_ENGINES, extract_content
+from .metrics import (
+    crawler_extraction_cpu_seconds,
+    crawler_http_connections_total,
+    crawler_time_to_first_byte_seconds,
+    crawler_requests_in_flight,
+)
 
 logger = logging.getLogger(__name__)
 
+# Content types accepted for extraction (anything else is rejected before download)
+ALLOWED_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain', 'application/xml', 'text/xml')
+
+
+class CrawlAbortedError(ValueError):
+    """Fetch aborted because the response can never be extracted (too large, not HTML)."""
+
+
+class ContentNotModified(Exception):
+    """Conditional fetch returned 304: the stored content is still current."""
+
 
 class CrawlerService:
     """Internal web crawler service."""
@@ -25,24 +48,130 @@ class CrawlerService:
         timeout: int = 30,
         max_retries: int = 3,
         user_agent: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        max_content_size: int = 10 * 1024 * 1024
+        max_content_size: int = 10 * 1024 * 1024,
+        max_connections: int = 100,
+        max_connections_per_host: int = 6,
+        http2: bool = True,
+        extraction_workers: int = 0,
+        extraction_engine: str = "fast"
     ):
         self.timeout = timeout
         self.max_retries = max_retries
         self.user_agent = user_agent
         self.max_content_size = max_content_size
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2
+        
+        # Long-lived client shared by all fetches (keep-alive, DNS and TLS reuse)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._global_limit = asyncio.Semaphore(max_connections)
+        # host -> [semaphore, requests waiting or in flight]; dropped once a host goes idle
+        self._host_limits: Dict[str, list] = {}
+        
+        # HTML parsing runs in worker processes so it doesn't block the event loop
+        # (0 = parse inline on the loop, e.g. in tests)
+        self.extraction_workers = extraction_workers
+        self.extraction_engine = extraction_engine if extraction_engine in EXTRACTION_ENGINES else "fast"
+        self._extraction_pool: Optional[ProcessPoolExecutor] = None
+    
+    async def start(self):
+        """Create the pooled HTTP client and extraction pool (called on service startup)."""
+        if self.extraction_workers > 0 and self._extraction_pool is None:
+            self._extraction_pool = self._create_extraction_pool()
+            logger.info(f"✅ Extraction process pool started ({self.extraction_workers} workers)")
+        
+        if self._client is not None:
+            return
+        
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=30.0
+        )
+        try:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=limits,
+                http2=self.http2
+            )
+        except ImportError:
+            # http2=True needs the 'h2' package
+            logger.warning("⚠️  'h2' package not installed - crawler falling back to HTTP/1.1")
+            self.http2 = False
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=limits
+            )
+        
+        logger.info(
+            f"✅ Crawler HTTP client started (http2: {self.http2}, max connections: {self.max_connections}, "
+            f"per host: {self.max_connections_per_host})"
+        )
+    
+    async def close(self):
+        """Close the pooled HTTP client and extraction pool (called on service shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("🔌 Crawler HTTP client closed")
+        
+        if self._extraction_pool is not None:
+            self._extraction_pool.shutdown(wait=True, cancel_futures=True)
+            self._extraction_pool = None
+            logger.info("🔌 Extraction process pool stopped")
+    
+    def _create_extraction_pool(self) -> ProcessPoolExecutor:
+        """Create the extraction process pool (spawned, not forked from the running loop)."""
+        return ProcessPoolExecutor(
+            max_workers=self.extraction_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled client, starting it on first use."""
+        if self._client is None:
+            await self.start()
+        return self._client
     
-    async def crawl_url(self, url: str) -> CrawledContent:
+    @asynccontextmanager
+    async def _host_slot(self, host: str):
+        """
+        Hold one of a host's concurrency slots.
+        
+        A host's semaphore only exists while requests to it are waiting or in
+        flight, so the map does not grow with every host ever crawled.
+        """
+        entry = self._host_limits.get(host)
+        if entry is None:
+            entry = self._host_limits[host] = [asyncio.Semaphore(self.max_connections_per_host), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._host_limits[host]
+    
+    async def crawl_url(self, url: str, validators: Optional[Dict[str, Any]] = None) -> CrawledContent:
         """
         Crawl a URL and extract content.
         
+        The response's ETag / Last-Modified are returned in metadata; pass them
+        back as validators on a re-crawl to make the request conditional.
+        
         Args:
             url: URL to crawl
+            validators: Stored metadata with "etag" / "last_modified" (optional)
             
         Returns:
             CrawledContent with extracted data
             
         Raises:
+            ContentNotModified: If validators were given and the page is unchanged (304)
             Exception: If crawling fails
         """
         logger.info(f"🕷️  Crawling URL: {url}")
@@ -50,12 +179,20 @@ class CrawlerService:
         # Try standard HTTP fetch first
         for attempt in range(self.max_retries):
             try:
-                html_content = await self._fetch_html(url)
+                html_content, response_validators = await self._fetch_html(url, validators)
                 extracted = await self._extract_content(html_content, url)
+                extracted.metadata.update(response_validators)
                 
                 logger.info(f"✅ Crawled successfully: {url} ({extracted.word_count} words)")
                 return extracted
                 
+            except ContentNotModified:
+                logger.info(f"♻️  Not modified since last crawl: {url}")
+                raise
+            except CrawlAbortedError as e:
+                # Same response on every attempt - don't retry
+                logger.error(f"❌ Failed to crawl {url}: {e}")
+                raise
             except ValueError as e:
                 # Validation errors - retry with exponential backoff
                 if attempt < self.max_retries - 1:
@@ -73,8 +210,13 @@ class CrawlerService:
                     logger.error(f"❌ Failed to crawl {url}: {e}")
                     raise
     
-    async def _fetch_html(self, url: str) -> str:
-        """Fetch HTML content from URL."""
+    async def _fetch_html(self, url: str, validators: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, str]]:
+        """
+        Fetch HTML content from URL.
+        
+        Returns:
+            Tuple of (HTML, response validators: etag / last_modified)
+        """
         headers = {
             'User-Agent': self.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -82,292 +224,134 @@ class CrawlerService:
             'Accept-Encoding': 'gzip, deflate, br',  # Allow compression
         }
         
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            follow_redirects=True,
-            limits=httpx.Limits(max_connections=10)
-        ) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # Check content size
-            if len(response.content) > self.max_content_size:
-                raise ValueError(f"Content too large: {len(response.content)} bytes")
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if not content_type.startswith('text/html'):
-                logger.warning(f"⚠️  Unexpected content type: {content_type} for {url}")
-            
-            # Get text with proper encoding handling
-            try:
-                # httpx automatically handles gzip/deflate decompression
-                # But let's verify the response was properly decompressed
-                content_encoding = response.headers.get('content-encoding', '').lower()
-                
-                # If content is still compressed, httpx should have handled it, but let's check
-                if content_encoding in ['gzip', 'deflate', 'br']:
-                    # httpx should have automatically decompressed, but verify it's text
-                    if not isinstance(response.content, bytes) or len(response.content) == 0:
-                        raise ValueError("Response content is empty")
-                
-                # Get text - httpx handles encoding automatically
-                # But try to handle encoding issues more gracefully
-                try:
-                    text = response.text
-                except UnicodeDecodeError:
-                    # Try to decode with different encodings
-                    logger.warning(f"⚠️  Unicode decode error, trying alternative encodings for {url}")
-                    for encoding in ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']:
-                        try:
-                            text = response.content.decode(encoding)
-                            logger.info(f"✅ Successfully decoded with {encoding}")
-                            break
-                        except UnicodeDecodeError:
-                            continue
-                    else:
-                        raise ValueError("Failed to decode content with any encoding")
-                
-                # Validate that we got actual text (not binary)
-                if self._is_invalid_content(text):
-                    logger.warning(f"⚠️  Detected invalid/binary content for {url}")
-                    logger.warning(f"   Content-Type: {response.headers.get('content-type', 'unknown')}")
-                    logger.warning(f"   Content-Length: {len(response.content)} bytes")
-                    logger.warning(f"   Text length: {len(text)} chars")
-                    logger.warning(f"   First 500 chars: {repr(text[:500])}")
-                    # Check if it might be a JS-rendered site (has script tags but minimal content)
-                    if '<script' in text.lower() and text.count('<script') > 5:
-                        logger.info(f"   Detected potential JavaScript-rendered site (has {text.count('<script')} script tags)")
-                    raise ValueError("Content appears to be binary or corrupted - cannot extract valid HTML")
-                
-                # Additional check: verify it looks like HTML (be more lenient for JS-rendered sites)
-                html_indicators = ['<html', '<body', '<div', '<article', '<main', '<p', '<h1', '<h2', '<script', '<head', '<title']
-                has_html_tags = any(tag in text.lower() for tag in html_indicators)
-                
-                if not has_html_tags:
-                    # Might be valid plain text, but for a web page it's suspicious
-                    logger.warning(f"⚠️  Content doesn't appear to contain HTML tags")
-                    # But don't fail if it's valid text with enough words
-                    words = text.split()
-                    if len(words) < 30:  # Reduced threshold from 50
-                        raise ValueError("Content doesn't appear to be valid HTML or text")
-                
-                return text
-            except ValueError:
-                # Re-raise validation errors
-                raise
-            except Exception as e:
-                logger.error(f"❌ Failed to decode HTML content: {e}")
-                raise ValueError(f"Failed to extract valid HTML content: {e}")
-    
-    def _is_invalid_content(self, text: str) -> bool:
-        """
-        Check if content appears to be invalid (binary/junk data).
-        
-        Returns True if content is likely invalid.
-        """
-        if not text or len(text) < 50:  # Reduced from 100 to be less strict
-            return True
-        
-        # Count printable vs non-printable characters
-        printable_chars = sum(1 for c in text if c.isprintable() or c.isspace())
-        total_chars = len(text)
-        
-        # If less than 50% of characters are printable, likely binary/junk (reduced from 70%)
-        if total_chars > 0 and (printable_chars / total_chars) < 0.5:
-            logger.warning(f"⚠️  Low printable character ratio: {printable_chars/total_chars:.2%}")
-            return True
+        # Conditional request: the server answers 304 if the page hasn't changed
+        if validators:
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
         
-        # Check for high ratio of Unicode replacement characters (increased threshold)
-        replacement_chars = text.count('\ufffd')
-        if replacement_chars > len(text) * 0.2:  # Increased from 10% to 20%
-            logger.warning(f"⚠️  High ratio of replacement characters: {replacement_chars}/{len(text)}")
-            return True
+        client = await self._get_client()
+        host = urlparse(url).netloc
         
-        # Check if content looks like HTML - be more lenient
-        # Many JS-rendered sites have minimal HTML structure
-        html_indicators = ['<html', '<body', '<div', '<article', '<main', '<p', '<h1', '<h2', '<script', '<head']
-        has_html_tags = any(tag in text.lower() for tag in html_indicators)
+        # Records whether the transport had to open a new connection for this request
+        new_connection = False
         
-        if not has_html_tags:
-            # If no HTML tags but has substantial text, might be plain text (acceptable)
-            words = text.split()
-            if len(words) < 20:  # Very short content without HTML is suspicious
-                return True
+        async def trace(event_name: str, info: Dict[str, Any]):
+            nonlocal new_connection
+            if event_name == "connection.connect_tcp.complete":
+                new_connection = True
         
-        return False
-    
-    async def _extract_content(self, html: str, url: str) -> CrawledContent:
-        """Extract meaningful content from HTML."""
-        # Try lxml parser first (faster, more robust), fallback to html.parser
+        crawler_requests_in_flight.inc()
         try:
-            soup = BeautifulSoup(html, 'lxml')
-        except Exception:
-            # Fallback to html.parser if lxml fails
-            soup = BeautifulSoup(html, 'html.parser')
-        
-        # Remove unwanted elements
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript']):
-            tag.decompose()
-        
-        # Extract title
-        title = self._extract_title(soup)
-        
-        # Extract main content
-        content = self._extract_main_content(soup)
-        
-        # Validate extracted content (be more lenient)
-        if not content or len(content.strip()) < 30:  # Reduced from 50
-            raise ValueError("Extracted content is too short or empty")
-        
-        # Additional validation: check if content looks valid (but be less strict)
-        # Only fail if it's clearly invalid, not just because it's short
-        if len(content.strip()) > 100 and self._is_invalid_content(content):
-            raise ValueError("Extracted content appears to be invalid/binary data")
-        
-        # Detect language
-        language = self._detect_language(soup)
-        
-        # Calculate word count
-        word_count = len(content.split())
-        
-        # Validate minimum word count
-        if word_count < 10:
-            raise ValueError(f"Extracted content has too few words: {word_count} (minimum: 10)")
-        
-        # Parse domain for metadata
-        parsed_url = urlparse(url)
-        metadata = {
-            'domain': parsed_url.netloc,
-            'path': parsed_url.path,
-            'extracted_at': None  # Will be set by storage service
-        }
-        
-        return CrawledContent(
-            url=url,
-            title=title,
-            content=content,
-            language=language,
-            word_count=word_count,
-            metadata=metadata
-        )
-    
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract page title."""
-        # Try og:title first
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            return og_title['content']
-        
-        # Try title tag
-        title_tag = soup.find('title')
-        if title_tag:
-            return title_tag.get_text().strip()
-        
-        # Try h1
-        h1 = soup.find('h1')
-        if h1:
-            return h1.get_text().strip()
-        
-        return "Untitled"
+            async with self._global_limit, self._host_slot(host):
+                request = client.build_request("GET", url, headers=headers, extensions={"trace": trace})
+                request_start = time.time()
+                response = await client.send(request, stream=True)
+                try:
+                    crawler_time_to_first_byte_seconds.labels(publisher_domain=host).observe(time.time() - request_start)
+                    crawler_http_connections_total.labels(
+                        publisher_domain=host,
+                        connection="new" if new_connection else "reused",
+                        http_version=response.http_version
+                    ).inc()
+                    
+                    if response.status_code == 304:
+                        raise ContentNotModified(url)
+                    
+                    response.raise_for_status()
+                    text, body_size = await self._read_text(response, url)
+                finally:
+                    await response.aclose()
+        finally:
+            crawler_requests_in_flight.dec()
+        
+        response_validators = {}
+        if response.headers.get('etag'):
+            response_validators['etag'] = response.headers['etag']
+        if response.headers.get('last-modified'):
+            response_validators['last_modified'] = response.headers['last-modified']
+        
+        if body_size == 0:
+            raise ValueError("Response content is empty")
+        
+        # Binary/non-HTML checks run with the extraction, off the event loop
+        return text, response_validators
     
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
-        """Extract main article content."""
-        # Try to find main article container
-        article = soup.find('article')
-        if article:
-            text = self._clean_text(article.get_text())
-            if len(text.split()) >= 50:  # Ensure we got substantial content
-                return text
-        
-        # Try main tag
-        main = soup.find('main')
-        if main:
-            text = self._clean_text(main.get_text())
-            if len(text.split()) >= 50:
-                return text
-        
-        # Try common blog content classes (also try partial matches)
-        content_classes = [
-            'post-content', 'article-content', 'entry-content',
-            'blog-post', 'post-body', 'content', 'main-content',
-            'post', 'article', 'entry', 'story', 'text'
-        ]
-        
-        for cls in content_classes:
-            # Try exact match first
-            content_div = soup.find('div', class_=cls)
-            if not content_div:
-                # Try partial class match (for cases like "post-content-wrapper")
-                content_div = soup.find('div', class_=lambda x: x and cls in ' '.join(x) if isinstance(x, list) else cls in str(x))
-            if content_div:
-                text = self._clean_text(content_div.get_text())
-                if len(text.split()) >= 50:
-                    return text
-        
-        # Try data attributes that might contain content
-        content_div = soup.find('div', attrs={'data-content': True}) or soup.find('div', attrs={'data-post': True})
-        if content_div:
-            text = self._clean_text(content_div.get_text())
-            if len(text.split()) >= 50:
-                return text
-        
-        # Fallback: get all paragraphs (filter out very short ones)
-        paragraphs = soup.find_all('p')
-        if paragraphs:
-            # Filter paragraphs by length
-            meaningful_paragraphs = [p for p in paragraphs if len(p.get_text().strip()) > 20]
-            if meaningful_paragraphs:
-                text = ' '.join(p.get_text() for p in meaningful_paragraphs)
-                cleaned = self._clean_text(text)
-                if len(cleaned.split()) >= 50:
-                    return cleaned
-        
-        # Try getting text from all headings and paragraphs
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        if headings:
-            heading_text = ' '.join(h.get_text() for h in headings)
-            if paragraphs:
-                combined = heading_text + ' ' + ' '.join(p.get_text() for p in paragraphs[:20])  # Limit paragraphs
-                cleaned = self._clean_text(combined)
-                if len(cleaned.split()) >= 50:
-                    return cleaned
+    async def _read_text(self, response: httpx.Response, url: str) -> tuple[str, int]:
+        """
+        Stream and decode a response body, aborting early on unusable responses.
         
-        # Last resort: body text (but filter out script/style content more aggressively)
-        body = soup.find('body')
-        if body:
-            # Remove all script and style tags
-            for tag in body(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript', 'svg']):
-                tag.decompose()
-            text = self._clean_text(body.get_text())
-            if len(text.split()) >= 50:
-                return text
+        Content-Length and Content-Type are checked before any of the body is
+        read; the (decompressed) body is then decoded chunk by chunk and the
+        read stops as soon as it exceeds max_content_size.
         
-        # Final fallback: entire document
-        return self._clean_text(soup.get_text())
-    
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text."""
-        # Remove extra whitespace
-        lines = [line.strip() for line in text.split('\n')]
-        lines = [line for line in lines if line]
-        return ' '.join(lines)
+        Args:
+            response: Streaming response (headers received, body unread)
+            url: URL being fetched (for logging)
+            
+        Returns:
+            Tuple of (decoded text, decompressed body size in bytes)
+            
+        Raises:
+            CrawlAbortedError: If the response is too large or not HTML/text
+        """
+        content_length = response.headers.get('content-length')
+        if content_length and content_length.isdigit() and int(content_length) > self.max_content_size:
+            raise CrawlAbortedError(f"Content too large: {content_length} bytes (Content-Length)")
+        
+        content_type = response.headers.get('content-type', '').lower()
+        if content_type and not content_type.startswith(ALLOWED_CONTENT_TYPES):
+            raise CrawlAbortedError(f"Unsupported content type: {content_type}")
+        if not content_type.startswith('text/html'):
+            logger.warning(f"⚠️  Unexpected content type: {content_type or 'none'} for {url}")
+        
+        # httpx has already decompressed gzip/deflate/br chunks at this point
+        encoding = response.charset_encoding or 'utf-8'
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        except LookupError:
+            logger.warning(f"⚠️  Unknown charset '{encoding}' for {url}, decoding as utf-8")
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        parts = []
+        body_size = 0
+        async for chunk in response.aiter_bytes():
+            body_size += len(chunk)
+            if body_size > self.max_content_size:
+                raise CrawlAbortedError(f"Content too large: over {self.max_content_size} bytes")
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b'', final=True))
+        
+        return ''.join(parts), body_size
     
-    def _detect_language(self, soup: BeautifulSoup) -> str:
-        """Detect page language."""
-        # Check html lang attribute
-        html_tag = soup.find('html')
-        if html_tag and html_tag.get('lang'):
-            lang = html_tag['lang']
-            # Normalize language code (e.g., "en-US" -> "en")
-            return lang.split('-')[0].lower()
+    async def _extract_content(self, html: str, url: str) -> CrawledContent:
+        """
+        Extract content from HTML, in the extraction process pool when configured.
         
-        # Check meta content-language
-        lang_meta = soup.find('meta', attrs={'http-equiv': 'content-language'})
-        if lang_meta and lang_meta.get('content'):
-            lang = lang_meta['content']
-            return lang.split('-')[0].lower()
+        Args:
+            html: Page HTML
+            url: Page URL
+            
+        Returns:
+            CrawledContent with extracted data
+        """
+        if self._extraction_pool is None:
+            content, cpu_seconds = extract_content(html, url, self.extraction_engine)
+            crawler_extraction_cpu_seconds.labels(mode="inline").observe(cpu_seconds)
+            return content
         
-        # Default to English
-        return 'en'
-
+        loop = asyncio.get_running_loop()
+        try:
+            content, cpu_seconds = await loop.run_in_executor(
+                self._extraction_pool, extract_content, html, url, self.extraction_engine
+            )
+        except BrokenProcessPool:
+            # A worker process died (e.g. OOM on a huge page) - replace the pool and fail this attempt
+            logger.error("❌ Extraction process pool broken, restarting it")
+            self._extraction_pool.shutdown(wait=False, cancel_futures=True)
+            self._extraction_pool = self._create_extraction_pool()
+            raise
+        
+        crawler_extraction_cpu_seconds.labels(mode="process").observe(cpu_seconds)
+        return content
@@ -0,0 +1,211 @@
+"""
+Content-addressed embedding cache.
+
+Embeddings are keyed by (embedding_model, sha256(normalized_text)) so the
+same string is only ever embedded once per model, no matter which blog,
+retry or API request it comes from. Lookups go through an in-process LRU
+first and then the shared MongoDB `embedding_cache` collection, whose
+documents expire through a TTL index.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from .metrics import (
+    embedding_cache_lookups_total,
+    embedding_cache_memory_entries,
+    embedding_cache_evictions_total,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
+
+class EmbeddingCache:
+    """Two-level (LRU + MongoDB) embedding cache."""
+
+    def __init__(
+        self,
+        database: Optional[AsyncIOMotorDatabase] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            database: MongoDB database for the shared layer (None = in-process only)
+            max_entries: Maximum number of embeddings kept in the in-process LRU
+            ttl_seconds: Lifetime of cached embeddings in both layers
+        """
+        self.collection = database["embedding_cache"] if database is not None else None
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._lru: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        logger.info(
+            f"✅ EmbeddingCache initialized (lru: {self.max_entries} entries, "
+            f"ttl: {self.ttl_seconds}s, mongo: {self.collection is not None})"
+        )
+
+    async def create_indexes(self):
+        """Create the TTL index on the MongoDB layer."""
+        if self.collection is None:
+            return
+
+        try:
+            await self.collection.create_indexes([
+                IndexModel([("created_at", ASCENDING)], expireAfterSeconds=self.ttl_seconds),
+            ])
+            logger.info("✅ Embedding cache indexes created")
+        except Exception as e:
+            logger.warning(f"⚠️  Embedding cache index creation warning: {e}")
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text before hashing (collapse whitespace, strip)."""
+        return " ".join(text.split())
+
+    @classmethod
+    def make_key(cls, model: str, text: str) -> str:
+        """
+        Build the cache key for a text embedded with a model.
+
+        Args:
+            model: Embedding model name
+            text: Text to embed
+
+        Returns:
+            Key of the form "<model>:<sha256 of normalized text>"
+        """
+        digest = hashlib.sha256(cls.normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{model}:{digest}"
+
+    async def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for several texts.
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            List aligned with texts; None for cache misses
+        """
+        keys = [self.make_key(model, text) for text in texts]
+        results: List[Optional[List[float]]] = [self._lru_get(key) for key in keys]
+
+        missing = {key for key, value in zip(keys, results) if value is None}
+        memory_misses = sum(1 for value in results if value is None)
+        embedding_cache_lookups_total.labels(layer="memory", result="hit").inc(len(keys) - memory_misses)
+        embedding_cache_lookups_total.labels(layer="memory", result="miss").inc(memory_misses)
+
+        if missing and self.collection is not None:
+            found = {}
+            try:
+                async for doc in self.collection.find({"_id": {"$in": list(missing)}}, {"embedding": 1}):
+                    found[doc["_id"]] = doc["embedding"]
+            except Exception as e:
+                logger.warning(f"⚠️  Embedding cache lookup failed: {e}")
+
+            for index, key in enumerate(keys):
+                if results[index] is None and key in found:
+                    results[index] = found[key]
+                    self._lru_put(key, found[key])
+
+            embedding_cache_lookups_total.labels(layer="mongo", result="hit").inc(len(found))
+            embedding_cache_lookups_total.labels(layer="mongo", result="miss").inc(len(missing) - len(found))
+
+        return results
+
+    async def set_many(self, model: str, texts: Sequence[str], embeddings: Sequence[List[float]]):
+        """
+        Store embeddings for several texts.
+
+        Args:
+            model: Embedding model name
+            texts: Embedded texts
+            embeddings: Embeddings aligned with texts
+        """
+        if not texts:
+            return
+
+        now = datetime.utcnow()
+        docs = {}
+        for text, embedding in zip(texts, embeddings):
+            key = self.make_key(model, text)
+            self._lru_put(key, embedding)
+            docs[key] = {"_id": key, "model": model, "embedding": embedding, "created_at": now}
+
+        if self.collection is None:
+            return
+
+        try:
+            # Upsert so concurrent writers of the same text don't fail each other
+            await self.collection.bulk_write(
+                [UpdateOne({"_id": key}, {"$setOnInsert": doc}, upsert=True) for key, doc in docs.items()],
+                ordered=False
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Embedding cache write failed: {e}")
+
+    async def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Look up a single embedding (None on miss)."""
+        return (await self.get_many(model, [text]))[0]
+
+    async def set(self, model: str, text: str, embedding: List[float]):
+        """Store a single embedding."""
+        await self.set_many(model, [text], [embedding])
+
+    def _lru_get(self, key: str) -> Optional[List[float]]:
+        """Read from the LRU, dropping expired entries."""
+        entry = self._lru.get(key)
+        if entry is None:
+            return None
+
+        expires_at, embedding = entry
+        if expires_at < time.monotonic():
+            del self._lru[key]
+            embedding_cache_evictions_total.labels(reason="ttl").inc()
+            embedding_cache_memory_entries.set(len(self._lru))
+            return None
+
+        self._lru.move_to_end(key)
+        return embedding
+
+    def _lru_put(self, key: str, embedding: List[float]):
+        """Write to the LRU, evicting the least recently used entries when full."""
+        if self.max_entries == 0:
+            return
+
+        self._lru[key] = (time.monotonic() + self.ttl_seconds, embedding)
+        self._lru.move_to_end(key)
+
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+            embedding_cache_evictions_total.labels(reason="size").inc()
+
+        embedding_cache_memory_entries.set(len(self._lru))
+
+
+# Process-wide cache used by the LLM providers (None = caching disabled)
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def set_embedding_cache(cache: Optional[EmbeddingCache]):
+    """Install the process-wide embedding cache (called at service startup)."""
+    global _embedding_cache
+    _embedding_cache = cache
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the process-wide embedding cache, if one is configured."""
+    return _embedding_cache
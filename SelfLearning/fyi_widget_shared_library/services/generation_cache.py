@@ -0,0 +1,161 @@
+"""
+LLM generation result cache.
+
+Completed summary/question generations are stored in the MongoDB
+`llm_generation_cache` collection, keyed by a fingerprint of everything
+that determines the output: provider, model, temperature, max_tokens and
+the hashes of the system and user prompts. A retried or re-triggered job
+that sends the exact same prompt reuses the stored output instead of
+calling the provider again. Documents expire through a TTL index.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+
+
+def hash_text(text: str) -> str:
+    """SHA-256 hex digest of a prompt."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """MongoDB-backed cache of LLM generation results."""
+
+    def __init__(self, database: AsyncIOMotorDatabase, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize cache.
+
+        Args:
+            database: MongoDB database
+            ttl_seconds: Lifetime of cached generations
+        """
+        self.collection = database["llm_generation_cache"]
+        self.ttl_seconds = ttl_seconds
+        logger.info(f"✅ GenerationCache initialized (ttl: {self.ttl_seconds}s)")
+
+    async def create_indexes(self):
+        """Create the TTL index."""
+        try:
+            await self.collection.create_indexes([
+                IndexModel([("created_at", ASCENDING)], expireAfterSeconds=self.ttl_seconds),
+            ])
+            logger.info("✅ Generation cache indexes created")
+        except Exception as e:
+            logger.warning(f"⚠️  Generation cache index creation warning: {e}")
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str,
+        user_prompt: str,
+        **options: Any
+    ) -> str:
+        """
+        Build the prompt fingerprint used as cache key.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum output tokens
+            system_prompt: System prompt
+            user_prompt: User prompt
+            **options: Other parameters that change the output (e.g. use_grounding)
+
+        Returns:
+            SHA-256 hex digest of the canonical parameter set
+        """
+        fingerprint = {
+            "provider": provider,
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "system": hash_text(system_prompt),
+            "user": hash_text(user_prompt),
+            "options": options,
+        }
+        return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached generation.
+
+        Args:
+            key: Prompt fingerprint
+
+        Returns:
+            Cached document (text, tokens_used, generation_seconds, ...) or None
+        """
+        try:
+            return await self.collection.find_one({"_id": key})
+        except Exception as e:
+            logger.warning(f"⚠️  Generation cache lookup failed: {e}")
+            return None
+
+    async def set(
+        self,
+        key: str,
+        operation: str,
+        provider: str,
+        model: str,
+        text: str,
+        tokens_used: int,
+        generation_seconds: float
+    ):
+        """
+        Store a completed generation.
+
+        Args:
+            key: Prompt fingerprint
+            operation: Operation name (summary, questions)
+            provider: Provider name
+            model: Model name
+            text: Generated text
+            tokens_used: Tokens billed for the generation
+            generation_seconds: Wall time of the provider call
+        """
+        try:
+            await self.collection.replace_one(
+                {"_id": key},
+                {
+                    "_id": key,
+                    "operation": operation,
+                    "provider": provider,
+                    "model": model,
+                    "text": text,
+                    "tokens_used": tokens_used,
+                    "generation_seconds": generation_seconds,
+                    "created_at": datetime.utcnow()
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Generation cache write failed: {e}")
+
+
+# Process-wide cache used by LLMService (None = caching disabled)
+_generation_cache: Optional[GenerationCache] = None
+
+
+def set_generation_cache(cache: Optional[GenerationCache]):
+    """Install the process-wide generation cache (called at service startup)."""
+    global _generation_cache
+    _generation_cache = cache
+
+
+def get_generation_cache() -> Optional[GenerationCache]:
+    """Get the process-wide generation cache, if one is configured."""
+    return _generation_cache
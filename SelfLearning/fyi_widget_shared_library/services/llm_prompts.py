@@ -133,3 +133,38 @@ SUMMARY_JSON_FORMAT = """{
     "key_points": ["key point 1", "key point 2", "key point 3"]
 }"""
 
+
+# USER PROMPT BUILDERS
+# --------------------
+# Assemble Part 2 (role + instructions), the content and the format template
+# into the user prompt sent by every provider. Also used to fingerprint
+# prompts for the generation cache, so keep providers on these builders.
+
+def build_summary_user_prompt(content: str, title: str = "", custom_prompt: str = None) -> str:
+    """Build the summary user prompt (custom or default instructions + content + JSON format)."""
+    role_and_instructions = custom_prompt if custom_prompt else DEFAULT_SUMMARY_PROMPT
+    return f"""{role_and_instructions}
+
+Title: {title}
+
+Content:
+{content[:4000]}
+
+REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
+{SUMMARY_JSON_FORMAT}"""
+
+
+def build_questions_user_prompt(content: str, title: str = "", num_questions: int = 5, custom_prompt: str = None) -> str:
+    """Build the questions user prompt (custom or default instructions + content + JSON format)."""
+    role_and_instructions = custom_prompt if custom_prompt else DEFAULT_QUESTIONS_PROMPT
+    return f"""{role_and_instructions}
+
+Title: {title}
+
+Content:
+{content[:4000]}
+
+Generate exactly {num_questions} question-answer pairs.
+
+REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
+{QUESTIONS_JSON_FORMAT}"""
@@ -6,6 +6,7 @@ from .anthropic_provider import AnthropicProvider
 from .gemini_provider import GeminiProvider
 from .factory import LLMProviderFactory, LLMProviderConfigManager, get_provider_config
 from .model_config import LLMModelConfig
+from .client_pool import close_llm_clients
 
 __all__ = [
     "LLMProvider",
@@ -16,5 +17,6 @@ __all__ = [
     "LLMModelConfig",
     "LLMProviderConfigManager",
     "get_provider_config",
+    "close_llm_clients",
 ]
 
@@ -2,10 +2,11 @@
 
 import logging
 from typing import Optional
-from anthropic import AsyncAnthropic
 from fyi_widget_shared_library.models.schemas import LLMGenerationResult, EmbeddingResult
 from .base import LLMProvider
+from .client_pool import get_anthropic_client
 from .model_config import LLMModelConfig
+from .rate_limiter import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ class AnthropicProvider(LLMProvider):
         max_tokens: int = LLMModelConfig.DEFAULT_MAX_TOKENS_QUESTIONS
     ):
         super().__init__(model, api_key, temperature, max_tokens)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = get_anthropic_client(api_key)
         logger.info(f"✅ Anthropic Provider initialized (model: {self.model})")
     
     def _get_provider_name(self) -> str:
@@ -35,26 +36,19 @@ class AnthropicProvider(LLMProvider):
         system_prompt: Optional[str] = None
     ) -> LLMGenerationResult:
         """Generate summary using Anthropic Claude."""
-        from ..llm_prompts import DEFAULT_SUMMARY_PROMPT, SUMMARY_JSON_FORMAT
+        from ..llm_prompts import build_summary_user_prompt
         
-        role_and_instructions = custom_prompt if custom_prompt else DEFAULT_SUMMARY_PROMPT
         system_msg = system_prompt or ""
         
-        user_prompt = f"""{role_and_instructions}
-
-Title: {title}
-
-Content:
-{content[:4000]}
-
-REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
-{SUMMARY_JSON_FORMAT}"""
+        user_prompt = build_summary_user_prompt(content, title, custom_prompt)
 
         logger.debug(f"📝 Anthropic generating summary (system: {len(system_msg)} chars, user: {len(user_prompt)} chars)")
 
         try:
             # Anthropic uses system parameter instead of system message role
-            response = await self.client.messages.create(
+            response = await self._call_with_rate_limit(
+                self.client.messages.create,
+                estimated_tokens=estimate_tokens(system_msg + user_prompt, 500),
                 model=self.model,
                 max_tokens=500,
                 temperature=0.5,  # Lower for more factual summaries
@@ -90,22 +84,11 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
         system_prompt: Optional[str] = None
     ) -> LLMGenerationResult:
         """Generate questions using Anthropic Claude."""
-        from ..llm_prompts import DEFAULT_QUESTIONS_PROMPT, QUESTIONS_JSON_FORMAT
+        from ..llm_prompts import build_questions_user_prompt
         
-        role_and_instructions = custom_prompt if custom_prompt else DEFAULT_QUESTIONS_PROMPT
         system_msg = system_prompt or ""
         
-        user_prompt = f"""{role_and_instructions}
-
-Title: {title}
-
-Content:
-{content[:4000]}
-
-Generate exactly {num_questions} question-answer pairs.
-
-REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
-{QUESTIONS_JSON_FORMAT}"""
+        user_prompt = build_questions_user_prompt(content, title, num_questions, custom_prompt)
 
         logger.debug(f"❓ Anthropic generating {num_questions} questions (system: {len(system_msg)} chars, user: {len(user_prompt)} chars)")
 
@@ -118,7 +101,9 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
         logger.info(f"   Configuration: model={self.model}, temperature={self.temperature}, max_tokens={self.max_tokens}")
 
         try:
-            response = await self.client.messages.create(
+            response = await self._call_with_rate_limit(
+                self.client.messages.create,
+                estimated_tokens=estimate_tokens(system_msg + user_prompt, self.max_tokens),
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
@@ -213,7 +198,9 @@ The <b>path of totality</b>, where the Moon completely blocks the Sun, is typica
             # but still respect publisher's configured chat_max_tokens if lower
             effective_max_tokens = min(350, self.max_tokens)
             
-            response = await self.client.messages.create(
+            response = await self._call_with_rate_limit(
+                self.client.messages.create,
+                estimated_tokens=estimate_tokens(system_prompt + prompt, effective_max_tokens),
                 model=self.model,
                 max_tokens=effective_max_tokens,
                 temperature=self.temperature,
@@ -1,9 +1,14 @@
 """Abstract base class for LLM providers."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Awaitable, Callable, List, Optional
 from fyi_widget_shared_library.models.schemas import LLMGenerationResult, EmbeddingResult
 from fyi_widget_shared_library.services.llm_providers.model_config import LLMModelConfig
+from fyi_widget_shared_library.services.embedding_cache import get_embedding_cache
+from fyi_widget_shared_library.services.llm_providers.rate_limiter import (
+    call_with_rate_limit,
+    get_rate_limiter,
+)
 
 
 class LLMProvider(ABC):
@@ -95,6 +100,84 @@ class LLMProvider(ABC):
         """
         pass
     
+    async def generate_embeddings(self, texts: List[str]) -> List[EmbeddingResult]:
+        """
+        Generate embeddings for several texts.
+        
+        Providers with a native batch API override this; the default embeds
+        the texts one by one.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            EmbeddingResults in the same order as texts
+        """
+        return [await self.generate_embedding(text) for text in texts]
+    
+    async def _with_embedding_cache(
+        self,
+        texts: List[str],
+        embed: Callable[[List[str]], Awaitable[List[EmbeddingResult]]]
+    ) -> List[EmbeddingResult]:
+        """
+        Serve embeddings from the shared embedding cache, embedding only misses.
+        
+        Args:
+            texts: Texts to embed
+            embed: Provider call that embeds a list of texts (in order)
+            
+        Returns:
+            EmbeddingResults in the same order as texts
+        """
+        cache = get_embedding_cache()
+        embedding_model = getattr(self, "embedding_model", None)
+        if cache is None or not embedding_model:
+            return await embed(texts)
+        
+        cached = await cache.get_many(embedding_model, texts)
+        results: List[Optional[EmbeddingResult]] = [
+            EmbeddingResult(embedding=vector, dimensions=len(vector), model=embedding_model) if vector is not None else None
+            for vector in cached
+        ]
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            fresh = await embed([texts[index] for index in missing])
+            for index, result in zip(missing, fresh):
+                results[index] = result
+            await cache.set_many(
+                embedding_model,
+                [texts[index] for index in missing],
+                [result.embedding for result in fresh]
+            )
+        
+        return results
+    
+    async def _call_with_rate_limit(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        estimated_tokens: int,
+        limiter_model: Optional[str] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a provider API call through the shared (provider, model) rate limiter.
+        
+        Args:
+            func: Coroutine function performing the API call
+            *args: Positional arguments for func
+            estimated_tokens: Estimated tokens for the call (see estimate_tokens)
+            limiter_model: Model whose budget is used (defaults to self.model)
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Result of func
+        """
+        limiter = get_rate_limiter(self.provider_name, limiter_model or self.model)
+        return await call_with_rate_limit(limiter, estimated_tokens, func, *args, **kwargs)
+    
     @abstractmethod
     async def answer_question(
         self,
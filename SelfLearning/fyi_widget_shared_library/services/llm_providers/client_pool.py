@@ -0,0 +1,91 @@
+"""
+Process-wide pool of LLM SDK clients.
+
+SDK clients own an HTTP connection pool, so they are created once per
+(provider, api_key) and shared by every provider instance instead of being
+rebuilt (with a fresh TLS handshake) for each job or request. Call
+close_llm_clients() on service shutdown.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+_clients: Dict[Tuple[str, str], Any] = {}
+
+
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client for an API key."""
+    key = ("openai", api_key)
+    if key not in _clients:
+        _clients[key] = AsyncOpenAI(api_key=api_key)
+        logger.info("🔌 OpenAI client created")
+    return _clients[key]
+
+
+def get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """Get the shared AsyncAnthropic client for an API key."""
+    key = ("anthropic", api_key)
+    if key not in _clients:
+        _clients[key] = AsyncAnthropic(api_key=api_key)
+        logger.info("🔌 Anthropic client created")
+    return _clients[key]
+
+
+def get_gemini_client(api_key: str) -> Any:
+    """
+    Get the shared google-generativeai service client for an API key.
+
+    genai.configure() holds a single process-wide key, which the SDK binds
+    lazily and would leak between providers using different keys. Each key
+    gets its own client instead, passed to the SDK calls explicitly.
+    """
+    key = ("gemini", api_key)
+    if key not in _clients:
+        import google.ai.generativelanguage as glm
+
+        _clients[key] = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+        logger.info("🔌 Gemini (google-generativeai) client created")
+    return _clients[key]
+
+
+def get_gemini_grounding_client(api_key: str) -> Optional[Any]:
+    """
+    Get the shared google-genai client (used for Google Search grounding).
+
+    Returns:
+        google.genai.Client, or None if the google-genai SDK is not installed
+    """
+    key = ("gemini-genai", api_key)
+    if key not in _clients:
+        try:
+            from google import genai as new_genai
+            from google.genai.types import HttpOptions
+            _clients[key] = new_genai.Client(api_key=api_key, http_options=HttpOptions(api_version="v1beta"))
+            logger.info("🔌 Gemini (google-genai) client created with v1beta for grounding support")
+        except (ImportError, AttributeError):
+            logger.debug("⚠️ New SDK (google-genai) not available - grounding will be unavailable")
+            _clients[key] = None
+    return _clients[key]
+
+
+async def close_llm_clients():
+    """Close all pooled clients (call on service shutdown)."""
+    for (provider, _), client in list(_clients.items()):
+        try:
+            if isinstance(client, (AsyncOpenAI, AsyncAnthropic)):
+                await client.close()
+            elif provider == "gemini":
+                client.transport.close()
+            elif provider == "gemini-genai" and hasattr(client, "close"):
+                # google-genai exposes a sync close() in newer SDK versions
+                client.close()
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to close {provider} client: {e}")
+
+    _clients.clear()
+    logger.info("🔌 LLM clients closed")
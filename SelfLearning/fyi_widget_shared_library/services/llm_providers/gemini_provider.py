@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 
 try:
     import google.generativeai as genai
@@ -14,7 +14,9 @@ except ImportError as exc:  # pragma: no cover - handled at runtime
 
 from fyi_widget_shared_library.models.schemas import EmbeddingResult, LLMGenerationResult
 from .base import LLMProvider
+from .client_pool import get_gemini_client, get_gemini_grounding_client
 from .model_config import LLMModelConfig
+from .rate_limiter import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -33,25 +35,17 @@ class GeminiProvider(LLMProvider):
         embedding_model: Optional[str] = None,
     ):
         super().__init__(model, api_key, temperature, max_tokens)
-        genai.configure(api_key=api_key)
+        self._client = get_gemini_client(api_key)
         self._base_generation_config = {
             "temperature": temperature,
             "max_output_tokens": max_tokens,
         }
         self.embedding_model = embedding_model or self.DEFAULT_EMBEDDING_MODEL
         # Store a default client without system instructions; we'll build others per call if needed
-        self._model_client = genai.GenerativeModel(model_name=self.model)
+        self._model_client = self._new_model_client()
         
-        # Initialize new SDK client for grounding support (required for Google Search grounding)
-        self._new_sdk_client = None
-        try:
-            from google import genai as new_genai
-            from google.genai.types import HttpOptions
-            self._new_sdk_client = new_genai.Client(api_key=api_key, http_options=HttpOptions(api_version="v1beta"))
-            logger.debug("✅ New SDK (google-genai) client initialized with v1beta for grounding support")
-        except (ImportError, AttributeError):
-            logger.debug("⚠️ New SDK (google-genai) not available - grounding will be unavailable")
-            self._new_sdk_client = None
+        # Shared new SDK client for grounding support (None if google-genai is not installed)
+        self._new_sdk_client = get_gemini_grounding_client(api_key)
         
         logger.info(
             "✅ Gemini Provider initialized (model: %s, embedding: %s)",
@@ -62,6 +56,13 @@ class GeminiProvider(LLMProvider):
     def _get_provider_name(self) -> str:
         return "gemini"
 
+    def _new_model_client(self, system_instruction: Optional[str] = None) -> genai.GenerativeModel:
+        """Build a GenerativeModel bound to this provider's pooled client (not the global genai config)."""
+        model_client = genai.GenerativeModel(model_name=self.model, system_instruction=system_instruction)
+        # GenerativeModel has no client argument; it otherwise binds the global default client on first use
+        model_client._client = self._client
+        return model_client
+
     async def generate_summary(
         self,
         content: str,
@@ -75,20 +76,11 @@ class GeminiProvider(LLMProvider):
         Note: Grounding is NOT used for summary generation (only for question generation).
         This method does not accept use_grounding parameter to prevent accidental usage.
         """
-        from ..llm_prompts import DEFAULT_SUMMARY_PROMPT, SUMMARY_JSON_FORMAT
+        from ..llm_prompts import build_summary_user_prompt
 
-        role_and_instructions = custom_prompt if custom_prompt else DEFAULT_SUMMARY_PROMPT
         system_msg = system_prompt or ""
 
-        user_prompt = f"""{role_and_instructions}
-
-Title: {title}
-
-Content:
-{content[:4000]}
-
-REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
-{SUMMARY_JSON_FORMAT}"""
+        user_prompt = build_summary_user_prompt(content, title, custom_prompt)
 
         logger.debug(
             "📝 Gemini generating summary (system: %d chars, user: %d chars)",
@@ -121,22 +113,11 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
         system_prompt: Optional[str] = None,
         use_grounding: bool = False,
     ) -> LLMGenerationResult:
-        from ..llm_prompts import DEFAULT_QUESTIONS_PROMPT, QUESTIONS_JSON_FORMAT
+        from ..llm_prompts import build_questions_user_prompt
 
-        role_and_instructions = custom_prompt if custom_prompt else DEFAULT_QUESTIONS_PROMPT
         system_msg = system_prompt or ""
 
-        user_prompt = f"""{role_and_instructions}
-
-Title: {title}
-
-Content:
-{content[:4000]}
-
-Generate exactly {num_questions} question-answer pairs.
-
-REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
-{QUESTIONS_JSON_FORMAT}"""
+        user_prompt = build_questions_user_prompt(content, title, num_questions, custom_prompt)
 
         logger.debug(
             "❓ Gemini generating %d questions (system: %d chars, user: %d chars, grounding: %s)",
@@ -171,33 +152,57 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
 
     async def generate_embedding(self, text: str) -> EmbeddingResult:
         """
-        Generate embedding from text.
+        Generate embedding from text (served from the embedding cache when possible).
         
         Note: Grounding is NOT used for embedding generation (only for question generation).
         Embeddings use a separate API that doesn't support grounding.
         """
-        logger.info("🔢 Generating embedding with Gemini (model: %s)...", self.embedding_model)
+        results = await self._with_embedding_cache([text], self._embed_texts)
+        return results[0]
 
-        truncated_text = text[:8000]
-        try:
-            # Note: Embeddings use a separate API that doesn't support grounding
-            response = await asyncio.to_thread(
-                genai.embed_content,
-                model=self.embedding_model,
-                content=truncated_text,
-            )
-        except Exception as exc:
-            logger.error("❌ Embedding generation failed: %s", exc)
-            raise
+    async def generate_embeddings(self, texts: List[str]) -> List[EmbeddingResult]:
+        """Generate embeddings for several texts (served from the embedding cache when possible)."""
+        return await self._with_embedding_cache(texts, self._embed_texts)
+
+    async def _embed_texts(self, texts: List[str]) -> List[EmbeddingResult]:
+        """
+        Embed texts with batched embed_content calls.
+        
+        embed_content accepts a list of contents and returns one vector per
+        item in input order; requests are chunked to the API batch limit.
+        """
+        logger.info("🔢 Generating %d embeddings with Gemini (model: %s)...", len(texts), self.embedding_model)
 
-        embedding = response["embedding"]
-        logger.info("✅ Embedding generated (%d dimensions)", len(embedding))
+        batch_size = LLMModelConfig.GEMINI_MAX_EMBEDDING_BATCH_SIZE
+        results: List[EmbeddingResult] = []
 
-        return EmbeddingResult(
-            embedding=embedding,
-            dimensions=len(embedding),
-            model=self.embedding_model,
-        )
+        for start in range(0, len(texts), batch_size):
+            batch = [text[:8000] for text in texts[start:start + batch_size]]
+            try:
+                response = await self._call_with_rate_limit(
+                    asyncio.to_thread,
+                    genai.embed_content,
+                    estimated_tokens=estimate_tokens("".join(batch)),
+                    limiter_model=self.embedding_model,
+                    model=self.embedding_model,
+                    content=batch,
+                    client=self._client,
+                )
+            except Exception as exc:
+                logger.error("❌ Batch embedding generation failed: %s", exc)
+                raise
+
+            for embedding in response["embedding"]:
+                results.append(
+                    EmbeddingResult(
+                        embedding=embedding,
+                        dimensions=len(embedding),
+                        model=self.embedding_model,
+                    )
+                )
+
+        logger.info("✅ %d embeddings generated", len(results))
+        return results
 
     async def answer_question(
         self,
@@ -321,8 +326,12 @@ The <b>path of totality</b>, where the Moon completely blocks the Sun, is typica
             logger.debug("🔍 Using Google Search grounding for Gemini generation")
             
             # Use new SDK client API
-            response = await asyncio.to_thread(
+            response = await self._call_with_rate_limit(
+                asyncio.to_thread,
                 self._new_sdk_client.models.generate_content,
+                estimated_tokens=estimate_tokens(
+                    (system_instruction or "") + prompt, config_dict["max_output_tokens"]
+                ),
                 model=self.model,
                 contents=prompt,
                 config=config,
@@ -449,10 +458,7 @@ The <b>path of totality</b>, where the Moon completely blocks the Sun, is typica
             generation_config["max_output_tokens"] = max_output_tokens
 
         if system_instruction:
-            model_client = genai.GenerativeModel(
-                model_name=self.model,
-                system_instruction=system_instruction,
-            )
+            model_client = self._new_model_client(system_instruction)
         else:
             model_client = self._model_client
 
@@ -466,9 +472,13 @@ The <b>path of totality</b>, where the Moon completely blocks the Sun, is typica
                 "generation_config": generation_config,
             }
             
-            response = await asyncio.to_thread(
+            response = await self._call_with_rate_limit(
+                asyncio.to_thread,
                 model_client.generate_content,
                 contents,
+                estimated_tokens=estimate_tokens(
+                    (system_instruction or "") + prompt, generation_config.get("max_output_tokens", 0)
+                ),
                 **call_kwargs,
             )
         except Exception as exc:
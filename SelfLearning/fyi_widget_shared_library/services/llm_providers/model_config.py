@@ -33,6 +33,10 @@ class LLMModelConfig:
     # Default embedding model for Gemini (Google Generative AI)
     DEFAULT_GEMINI_EMBEDDING_MODEL = "gemini-embedding-001"
     
+    # Maximum number of inputs per batched embedding request
+    OPENAI_MAX_EMBEDDING_BATCH_SIZE = 2048
+    GEMINI_MAX_EMBEDDING_BATCH_SIZE = 100
+    
     # ========================================================================
     # DEFAULT TEMPERATURE
     # ========================================================================
@@ -50,6 +54,26 @@ class LLMModelConfig:
     DEFAULT_MAX_TOKENS_QUESTIONS = 20000  # Higher for detailed Q&A generation
     DEFAULT_MAX_TOKENS_CHAT = 300
     
+    # ========================================================================
+    # RATE LIMITS (requests / tokens per minute)
+    # ========================================================================
+    # Process-wide budgets enforced by the shared rate limiter per
+    # (provider, model). Model entries override the provider defaults.
+    # Override per provider with <PROVIDER>_RPM_LIMIT / <PROVIDER>_TPM_LIMIT.
+    
+    DEFAULT_RATE_LIMITS = {
+        "openai": {"rpm": 500, "tpm": 200000},
+        "anthropic": {"rpm": 50, "tpm": 40000},
+        "gemini": {"rpm": 150, "tpm": 2000000},
+    }
+    
+    MODEL_RATE_LIMITS = {
+        "text-embedding-3-small": {"rpm": 3000, "tpm": 1000000},
+        "text-embedding-3-large": {"rpm": 3000, "tpm": 1000000},
+        "gemini-embedding-001": {"rpm": 1500, "tpm": 5000000},
+        "gemini-2.5-pro": {"rpm": 150, "tpm": 2000000},
+    }
+    
     # ========================================================================
     # EXACT MODEL-TO-PROVIDER MAPPINGS
     # ========================================================================
@@ -1,11 +1,12 @@
 """OpenAI LLM provider implementation."""
 
 import logging
-from typing import Optional
-from openai import AsyncOpenAI
+from typing import List, Optional
 from fyi_widget_shared_library.models.schemas import LLMGenerationResult, EmbeddingResult
 from .base import LLMProvider
+from .client_pool import get_openai_client
 from .model_config import LLMModelConfig
+from .rate_limiter import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,7 @@ class OpenAIProvider(LLMProvider):
         embedding_model: Optional[str] = None
     ):
         super().__init__(model, api_key, temperature, max_tokens)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.embedding_model = embedding_model if embedding_model is not None else LLMModelConfig.DEFAULT_EMBEDDING_MODEL
         logger.info(f"✅ OpenAI Provider initialized (model: {self.model}, embedding: {self.embedding_model})")
     
@@ -38,20 +39,11 @@ class OpenAIProvider(LLMProvider):
     ) -> LLMGenerationResult:
         """Generate summary using OpenAI."""
         # Import shared prompts
-        from ..llm_prompts import DEFAULT_SUMMARY_PROMPT, SUMMARY_JSON_FORMAT
+        from ..llm_prompts import build_summary_user_prompt
         
-        role_and_instructions = custom_prompt if custom_prompt else DEFAULT_SUMMARY_PROMPT
         system_msg = system_prompt or ""
         
-        user_prompt = f"""{role_and_instructions}
-
-Title: {title}
-
-Content:
-{content[:4000]}
-
-REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
-{SUMMARY_JSON_FORMAT}"""
+        user_prompt = build_summary_user_prompt(content, title, custom_prompt)
 
         logger.debug(f"📝 OpenAI generating summary (system: {len(system_msg)} chars, user: {len(user_prompt)} chars)")
 
@@ -61,7 +53,9 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
                 messages.append({"role": "system", "content": system_msg})
             messages.append({"role": "user", "content": user_prompt})
             
-            response = await self.client.chat.completions.create(
+            response = await self._call_with_rate_limit(
+                self.client.chat.completions.create,
+                estimated_tokens=estimate_tokens(system_msg + user_prompt, 500),
                 model=self.model,
                 messages=messages,
                 temperature=0.5,  # Lower for more factual summaries
@@ -93,22 +87,11 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
         system_prompt: Optional[str] = None
     ) -> LLMGenerationResult:
         """Generate questions using OpenAI."""
-        from ..llm_prompts import DEFAULT_QUESTIONS_PROMPT, QUESTIONS_JSON_FORMAT
+        from ..llm_prompts import build_questions_user_prompt
         
-        role_and_instructions = custom_prompt if custom_prompt else DEFAULT_QUESTIONS_PROMPT
         system_msg = system_prompt or ""
         
-        user_prompt = f"""{role_and_instructions}
-
-Title: {title}
-
-Content:
-{content[:4000]}
-
-Generate exactly {num_questions} question-answer pairs.
-
-REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
-{QUESTIONS_JSON_FORMAT}"""
+        user_prompt = build_questions_user_prompt(content, title, num_questions, custom_prompt)
 
         logger.debug(f"❓ OpenAI generating {num_questions} questions (system: {len(system_msg)} chars, user: {len(user_prompt)} chars)")
 
@@ -126,7 +109,9 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
                 messages.append({"role": "system", "content": system_msg})
             messages.append({"role": "user", "content": user_prompt})
             
-            response = await self.client.chat.completions.create(
+            response = await self._call_with_rate_limit(
+                self.client.chat.completions.create,
+                estimated_tokens=estimate_tokens(system_msg + user_prompt, self.max_tokens),
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -150,31 +135,47 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
             raise
     
     async def generate_embedding(self, text: str) -> EmbeddingResult:
-        """Generate embedding using OpenAI."""
-        logger.info("🔢 Generating embedding with OpenAI...")
+        """Generate embedding using OpenAI (served from the embedding cache when possible)."""
+        results = await self._with_embedding_cache([text], self._embed_texts)
+        return results[0]
+    
+    async def generate_embeddings(self, texts: List[str]) -> List[EmbeddingResult]:
+        """Generate embeddings for several texts (served from the embedding cache when possible)."""
+        return await self._with_embedding_cache(texts, self._embed_texts)
+    
+    async def _embed_texts(self, texts: List[str]) -> List[EmbeddingResult]:
+        """Embed texts using OpenAI's batched input."""
+        logger.info(f"🔢 Generating {len(texts)} embeddings with OpenAI...")
+        
+        max_chars = 8000
+        batch_size = LLMModelConfig.OPENAI_MAX_EMBEDDING_BATCH_SIZE
+        results: List[EmbeddingResult] = []
         
         try:
-            max_chars = 8000
-            if len(text) > max_chars:
-                text = text[:max_chars]
-            
-            response = await self.client.embeddings.create(
-                model=self.embedding_model,
-                input=text
-            )
+            for start in range(0, len(texts), batch_size):
+                batch = [text[:max_chars] for text in texts[start:start + batch_size]]
+                
+                response = await self._call_with_rate_limit(
+                    self.client.embeddings.create,
+                    estimated_tokens=estimate_tokens("".join(batch)),
+                    limiter_model=self.embedding_model,
+                    model=self.embedding_model,
+                    input=batch
+                )
+                
+                # Results carry their input index; sort to preserve input order
+                for item in sorted(response.data, key=lambda d: d.index):
+                    results.append(EmbeddingResult(
+                        embedding=item.embedding,
+                        dimensions=len(item.embedding),
+                        model=self.embedding_model
+                    ))
             
-            embedding = response.data[0].embedding
-            
-            logger.info(f"✅ Embedding generated ({len(embedding)} dimensions)")
-            
-            return EmbeddingResult(
-                embedding=embedding,
-                dimensions=len(embedding),
-                model=self.embedding_model
-            )
+            logger.info(f"✅ {len(results)} embeddings generated")
+            return results
             
         except Exception as e:
-            logger.error(f"❌ Embedding generation failed: {e}")
+            logger.error(f"❌ Batch embedding generation failed: {e}")
             raise
     
     async def answer_question(
@@ -233,7 +234,9 @@ The <b>path of totality</b>, where the Moon completely blocks the Sun, is typica
             # but still respect publisher's configured chat_max_tokens if lower
             effective_max_tokens = min(350, self.max_tokens)
             
-            response = await self.client.chat.completions.create(
+            response = await self._call_with_rate_limit(
+                self.client.chat.completions.create,
+                estimated_tokens=estimate_tokens(system_prompt + prompt, effective_max_tokens),
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -0,0 +1,226 @@
+"""
+Process-wide rate limiter for LLM provider calls.
+
+Every provider API call goes through a limiter for its (provider, model)
+pair. Each limiter holds two token buckets, requests per minute and tokens
+per minute. Token usage is estimated up front from the prompt length and
+the requested max output tokens. A 429 response blocks the limiter for the
+Retry-After period (or an exponential, jittered backoff when the provider
+sends none) and the call is retried, so parallel jobs slow down together
+instead of each burning its own retries.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .model_config import LLMModelConfig
+from ..metrics import llm_rate_limit_wait_seconds, llm_rate_limited_total
+
+logger = logging.getLogger(__name__)
+
+# Retries after a 429 before the error is surfaced to the caller
+MAX_RATE_LIMIT_RETRIES = int(os.getenv("LLM_RATE_LIMIT_MAX_RETRIES", "4"))
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """
+    Estimate the tokens a call will consume.
+
+    Uses the usual ~4 characters per token heuristic for the prompt and
+    assumes the full output budget will be used.
+
+    Args:
+        text: Prompt text (system + user)
+        max_output_tokens: Requested maximum output tokens
+
+    Returns:
+        Estimated total tokens
+    """
+    return len(text or "") // 4 + max(0, max_output_tokens or 0)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at capacity per minute."""
+
+    def __init__(self, per_minute: int):
+        """
+        Initialize bucket (starts full).
+
+        Args:
+            per_minute: Capacity and refill amount per minute
+        """
+        self.capacity = float(max(1, per_minute))
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserve tokens and return how long the caller must wait for them.
+
+        The balance may go negative: later callers then queue behind the
+        earlier reservation, which keeps waiting callers in FIFO order.
+
+        Args:
+            amount: Tokens to take (capped at capacity)
+
+        Returns:
+            Seconds to wait before the reservation is covered
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        self.tokens -= min(amount, self.capacity)
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class ProviderRateLimiter:
+    """RPM + TPM limiter for one (provider, model) pair."""
+
+    def __init__(self, provider: str, model: str, rpm: int, tpm: int):
+        """
+        Initialize limiter.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            rpm: Requests per minute
+            tpm: Tokens per minute
+        """
+        self.provider = provider
+        self.model = model
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.blocked_until = 0.0
+
+    async def acquire(self, estimated_tokens: int) -> float:
+        """
+        Wait until the call fits within both budgets.
+
+        Args:
+            estimated_tokens: Estimated tokens for the call
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = max(
+            self.requests.reserve(1),
+            self.tokens.reserve(estimated_tokens),
+            self.blocked_until - time.monotonic(),
+        )
+
+        if wait > 0:
+            logger.debug(f"⏳ Rate limiter {self.provider}/{self.model}: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+
+        waited = max(0.0, wait)
+        llm_rate_limit_wait_seconds.labels(provider=self.provider, model=self.model).observe(waited)
+        return waited
+
+    def block_for(self, seconds: float):
+        """Pause all calls through this limiter (after a 429)."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+_limiters: Dict[Tuple[str, str], ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str, model: str) -> ProviderRateLimiter:
+    """
+    Get the process-wide limiter for a (provider, model) pair.
+
+    Args:
+        provider: Provider name
+        model: Model name
+
+    Returns:
+        Shared ProviderRateLimiter
+    """
+    key = (provider, model)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limits = dict(LLMModelConfig.DEFAULT_RATE_LIMITS.get(provider, {"rpm": 60, "tpm": 100000}))
+        limits.update(LLMModelConfig.MODEL_RATE_LIMITS.get(model, {}))
+        rpm = int(os.getenv(f"{provider.upper()}_RPM_LIMIT", limits["rpm"]))
+        tpm = int(os.getenv(f"{provider.upper()}_TPM_LIMIT", limits["tpm"]))
+
+        limiter = ProviderRateLimiter(provider, model, rpm, tpm)
+        _limiters[key] = limiter
+        logger.info(f"🚦 Rate limiter created for {provider}/{model} (rpm: {rpm}, tpm: {tpm})")
+    return limiter
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether a provider error is a 429 / quota-exhausted response."""
+    for attr in ("status_code", "code"):
+        if getattr(error, attr, None) == 429:
+            return True
+
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+
+    message = str(error).lower()
+    return "429" in message or "resource_exhausted" in message or "rate limit" in message
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Read the Retry-After header (seconds) from a provider error, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def call_with_rate_limit(
+    limiter: ProviderRateLimiter,
+    estimated_tokens: int,
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    **kwargs: Any
+) -> Any:
+    """
+    Run a provider call through a limiter, retrying 429s with jittered backoff.
+
+    Args:
+        limiter: Limiter of the (provider, model) being called
+        estimated_tokens: Estimated tokens for the call
+        func: Coroutine function performing the API call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+    """
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        await limiter.acquire(estimated_tokens)
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            if attempt >= MAX_RATE_LIMIT_RETRIES or not is_rate_limit_error(e):
+                raise
+
+            delay = get_retry_after(e)
+            if delay is None:
+                delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+            delay += random.uniform(0, delay * 0.25)
+
+            limiter.block_for(delay)
+            llm_rate_limited_total.labels(provider=limiter.provider, model=limiter.model).inc()
+            logger.warning(
+                f"⚠️  {limiter.provider}/{limiter.model} rate limited (attempt {attempt + 1}/{MAX_RATE_LIMIT_RETRIES}), "
+                f"backing off {delay:.1f}s"
+            )
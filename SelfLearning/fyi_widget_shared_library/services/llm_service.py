@@ -12,20 +12,28 @@ Three-Layer Prompt Architecture:
 
 import logging
 import json
-from typing import List, Dict, Any, Tuple, Optional
+import re
+import time
+from typing import List, Dict, Any, Tuple, Optional, Callable, Awaitable
 
 # Configuration handled by service-specific configs
 from fyi_widget_shared_library.models.schemas import LLMGenerationResult, EmbeddingResult
 from .llm_providers.factory import LLMProviderFactory
 from .llm_providers.base import LLMProvider
 from .llm_providers.model_config import LLMModelConfig
+from .generation_cache import GenerationCache, get_generation_cache
+from .metrics import (
+    llm_generation_cache_lookups_total,
+    llm_generation_cache_saved_tokens_total,
+    llm_generation_cache_saved_seconds_total,
+)
 # Import shared prompts and format templates (moved to separate module to avoid circular imports)
 from .llm_prompts import (
     OUTPUT_FORMAT_INSTRUCTION,
-    DEFAULT_QUESTIONS_PROMPT,
     DEFAULT_SUMMARY_PROMPT,
-    QUESTIONS_JSON_FORMAT,
-    SUMMARY_JSON_FORMAT
+    SUMMARY_JSON_FORMAT,
+    build_summary_user_prompt,
+    build_questions_user_prompt,
 )
 
 logger = logging.getLogger(__name__)
@@ -72,6 +80,9 @@ class LLMService:
             max_tokens=max_tokens,
             embedding_model=embedding_model  # Factory will apply default if None
         )
+        # Providers for per-operation overrides, keyed by (model, temperature, max_tokens).
+        # They are thin wrappers: all of them share the pooled SDK clients.
+        self._providers: Dict[Tuple[str, float, int], LLMProvider] = {}
         
         logger.info(f"✅ LLM Service initialized (model: {self.model}, provider: {self.provider.provider_name})")
     
@@ -108,17 +119,105 @@ class LLMService:
         final_temperature = temperature if temperature is not None else self.temperature
         final_max_tokens = max_tokens if max_tokens is not None else self.max_tokens
         
-        logger.debug(
-            f"🔄 Creating provider: model={final_model}, "
-            f"temp={final_temperature}, max_tokens={final_max_tokens}"
-        )
-        return LLMProviderFactory.create(
-            model=final_model,
-            api_key=None,  # Factory will fetch from env vars
-            temperature=final_temperature,
-            max_tokens=final_max_tokens,
-            embedding_model=self.embedding_model
+        key = (final_model, final_temperature, final_max_tokens)
+        if key not in self._providers:
+            logger.debug(
+                f"🔄 Creating provider: model={final_model}, "
+                f"temp={final_temperature}, max_tokens={final_max_tokens}"
+            )
+            self._providers[key] = LLMProviderFactory.create(
+                model=final_model,
+                api_key=None,  # Factory will fetch from env vars
+                temperature=final_temperature,
+                max_tokens=final_max_tokens,
+                embedding_model=self.embedding_model
+            )
+        return self._providers[key]
+    
+    @staticmethod
+    def _is_valid_json_output(text: str) -> bool:
+        """Check that a generation is parseable JSON (optionally fenced in markdown)."""
+        cleaned = (text or "").strip()
+        if cleaned.startswith("```"):
+            match = re.search(r'```(?:json)?\s*(.*?)\s*```', cleaned, re.DOTALL)
+            cleaned = match.group(1).strip() if match else cleaned.strip("`")
+        try:
+            json.loads(cleaned)
+            return True
+        except (ValueError, TypeError):
+            return False
+    
+    async def _cached_generation(
+        self,
+        operation: str,
+        provider: LLMProvider,
+        system_prompt: str,
+        user_prompt: str,
+        generate: Callable[[], Awaitable[LLMGenerationResult]],
+        **options: Any
+    ) -> LLMGenerationResult:
+        """
+        Serve a generation from the generation cache, calling the provider on a miss.
+        
+        Only outputs that parse as JSON are cached, so a truncated or malformed
+        response is never replayed to a retry.
+        
+        Args:
+            operation: Operation name (summary, questions)
+            provider: Provider that would run the generation
+            system_prompt: System prompt sent to the provider
+            user_prompt: User prompt sent to the provider
+            generate: Provider call to run on a cache miss
+            **options: Other parameters that change the output (e.g. use_grounding)
+            
+        Returns:
+            LLMGenerationResult (tokens_used is 0 for cache hits: nothing was billed)
+        """
+        cache = get_generation_cache()
+        if cache is None:
+            return await generate()
+        
+        key = GenerationCache.make_key(
+            provider.provider_name,
+            provider.model,
+            provider.temperature,
+            provider.max_tokens,
+            system_prompt,
+            user_prompt,
+            **options
         )
+        
+        cached = await cache.get(key)
+        if cached:
+            llm_generation_cache_lookups_total.labels(operation=operation, result="hit").inc()
+            llm_generation_cache_saved_tokens_total.labels(operation=operation, model=provider.model).inc(cached.get("tokens_used", 0) or 0)
+            llm_generation_cache_saved_seconds_total.labels(operation=operation, model=provider.model).inc(cached.get("generation_seconds", 0) or 0)
+            logger.info(f"♻️  Reusing cached {operation} generation ({provider.provider_name}/{provider.model}, saved {cached.get('tokens_used', 0)} tokens)")
+            return LLMGenerationResult(
+                text=cached["text"],
+                tokens_used=0,
+                model=provider.model,
+                provider=provider.provider_name
+            )
+        
+        llm_generation_cache_lookups_total.labels(operation=operation, result="miss").inc()
+        
+        start = time.time()
+        result = await generate()
+        elapsed = time.time() - start
+        
+        if self._is_valid_json_output(result.text):
+            await cache.set(
+                key,
+                operation=operation,
+                provider=provider.provider_name,
+                model=provider.model,
+                text=result.text,
+                tokens_used=result.tokens_used,
+                generation_seconds=elapsed
+            )
+        
+        return result
     
     async def generate_summary(
         self, 
@@ -186,12 +285,18 @@ class LLMService:
         logger.debug(f"System Message:\n{OUTPUT_FORMAT_INSTRUCTION}")
         logger.debug("-" * 80)
         
-        # Delegate to provider
-        return await provider.generate_summary(
-            content=content,
-            title=title,
-            custom_prompt=custom_prompt,
-            system_prompt=OUTPUT_FORMAT_INSTRUCTION
+        # Delegate to provider (reusing a cached generation of the same prompt if any)
+        return await self._cached_generation(
+            "summary",
+            provider,
+            OUTPUT_FORMAT_INSTRUCTION,
+            build_summary_user_prompt(content, title, custom_prompt),
+            lambda: provider.generate_summary(
+                content=content,
+                title=title,
+                custom_prompt=custom_prompt,
+                system_prompt=OUTPUT_FORMAT_INSTRUCTION
+            )
         )
     
     async def generate_questions(
@@ -243,8 +348,6 @@ class LLMService:
             logger.info(f"❓ Using max_tokens {max_tokens} for questions (instance: {self.max_tokens})")
         
         # Part 2: Use custom prompt or fallback to default
-        role_and_instructions = custom_prompt if custom_prompt else DEFAULT_QUESTIONS_PROMPT
-        
         if custom_prompt:
             logger.info(f"❓ Generating {num_questions} questions with CUSTOM prompt (length: {len(custom_prompt)} chars)")
             logger.info(f"   Custom prompt preview: {custom_prompt[:150]}...")
@@ -252,18 +355,8 @@ class LLMService:
             logger.info(f"❓ Generating {num_questions} questions with DEFAULT prompt (fallback)")
         
         # Build user prompt: Role+Instructions + Content + Format Template
-        user_prompt = f"""{role_and_instructions}
-
-Title: {title}
-
-Content:
-{content[:4000]}
-
-Generate exactly {num_questions} question-answer pairs.
-
-REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
-{QUESTIONS_JSON_FORMAT}"""
-
+        user_prompt = build_questions_user_prompt(content, title, num_questions, custom_prompt)
+        
         # Log the complete prompts being sent to LLM
         logger.debug("=" * 80)
         logger.debug("FINAL PROMPT SENT TO LLM (generate_questions):")
@@ -275,24 +368,37 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
         if use_grounding and hasattr(provider, 'generate_questions'):
             # Check if the provider is Gemini by checking provider_name
             if provider.provider_name == "gemini":
-                return await provider.generate_questions(
-                    content=content,
-                    title=title,
-                    num_questions=num_questions,
-                    custom_prompt=custom_prompt,
-                    system_prompt=OUTPUT_FORMAT_INSTRUCTION,
-                    use_grounding=use_grounding
+                return await self._cached_generation(
+                    "questions",
+                    provider,
+                    OUTPUT_FORMAT_INSTRUCTION,
+                    user_prompt,
+                    lambda: provider.generate_questions(
+                        content=content,
+                        title=title,
+                        num_questions=num_questions,
+                        custom_prompt=custom_prompt,
+                        system_prompt=OUTPUT_FORMAT_INSTRUCTION,
+                        use_grounding=use_grounding
+                    ),
+                    use_grounding=True
                 )
             else:
                 logger.warning(f"❓ Grounding requested but provider {provider.provider_name} doesn't support it, ignoring")
         
         # Delegate to provider (without grounding)
-        return await provider.generate_questions(
-            content=content,
-            title=title,
-            num_questions=num_questions,
-            custom_prompt=custom_prompt,
-            system_prompt=OUTPUT_FORMAT_INSTRUCTION
+        return await self._cached_generation(
+            "questions",
+            provider,
+            OUTPUT_FORMAT_INSTRUCTION,
+            user_prompt,
+            lambda: provider.generate_questions(
+                content=content,
+                title=title,
+                num_questions=num_questions,
+                custom_prompt=custom_prompt,
+                system_prompt=OUTPUT_FORMAT_INSTRUCTION
+            )
         )
     
     async def generate_embedding(self, text: str) -> EmbeddingResult:
@@ -308,6 +414,22 @@ REQUIRED OUTPUT FORMAT (you must use this exact JSON structure):
         # Delegate to provider
         return await self.provider.generate_embedding(text)
     
+    async def generate_embeddings(self, texts: List[str]) -> List[EmbeddingResult]:
+        """
+        Generate embeddings for several texts in as few requests as possible.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            EmbeddingResults in the same order as texts
+        """
+        if not texts:
+            return []
+        
+        # Delegate to provider (batched natively where supported)
+        return await self.provider.generate_embeddings(texts)
+    
     async def answer_question(
         self, 
         question: str, 
@@ -0,0 +1,109 @@
+"""
+Prometheus metrics for shared services.
+
+These metrics are registered by whichever service imports the shared
+library (API and worker) and are exposed on that service's /metrics endpoint.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# ============================================================================
+# Embedding Cache Metrics
+# ============================================================================
+
+# Embedding cache lookups by layer and result
+embedding_cache_lookups_total = Counter(
+    'embedding_cache_lookups_total',
+    'Total number of embedding cache lookups',
+    ['layer', 'result']  # layer: memory, mongo; result: hit, miss
+)
+
+# Entries currently held in the in-process LRU
+embedding_cache_memory_entries = Gauge(
+    'embedding_cache_memory_entries',
+    'Number of embeddings held in the in-process LRU cache'
+)
+
+# Entries evicted from the in-process LRU
+embedding_cache_evictions_total = Counter(
+    'embedding_cache_evictions_total',
+    'Total number of embeddings evicted from the in-process LRU cache',
+    ['reason']  # reason: size, ttl
+)
+
+# ============================================================================
+# LLM Generation Cache Metrics
+# ============================================================================
+
+# Generation cache lookups
+llm_generation_cache_lookups_total = Counter(
+    'llm_generation_cache_lookups_total',
+    'Total number of LLM generation cache lookups',
+    ['operation', 'result']  # operation: summary, questions; result: hit, miss
+)
+
+# Tokens not spent thanks to cache hits
+llm_generation_cache_saved_tokens_total = Counter(
+    'llm_generation_cache_saved_tokens_total',
+    'Total LLM tokens saved by generation cache hits',
+    ['operation', 'model']
+)
+
+# Provider time not spent thanks to cache hits
+llm_generation_cache_saved_seconds_total = Counter(
+    'llm_generation_cache_saved_seconds_total',
+    'Total LLM generation seconds saved by generation cache hits',
+    ['operation', 'model']
+)
+
+# ============================================================================
+# LLM Rate Limiter Metrics
+# ============================================================================
+
+# Time calls spent waiting for rate limiter budget
+llm_rate_limit_wait_seconds = Histogram(
+    'llm_rate_limit_wait_seconds',
+    'Time LLM calls waited for the shared rate limiter',
+    ['provider', 'model'],
+    buckets=[0, 0.1, 0.5, 1, 2, 5, 10, 30, 60, 120]
+)
+
+# 429 responses received from providers
+llm_rate_limited_total = Counter(
+    'llm_rate_limited_total',
+    'Total number of rate limit (429) responses from LLM providers',
+    ['provider', 'model']
+)
+
+# ============================================================================
+# Crawler HTTP Client Metrics
+# ============================================================================
+
+# Requests by whether they opened a new connection or reused a pooled one
+crawler_http_connections_total = Counter(
+    'crawler_http_connections_total',
+    'Total crawler requests by connection reuse',
+    ['publisher_domain', 'connection', 'http_version']  # connection: new, reused
+)
+
+# Time from sending the request to receiving response headers
+crawler_time_to_first_byte_seconds = Histogram(
+    'crawler_time_to_first_byte_seconds',
+    'Crawler time to first byte per publisher domain',
+    ['publisher_domain'],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0]
+)
+
+# Requests currently waiting for or holding a crawler slot
+crawler_requests_in_flight = Gauge(
+    'crawler_requests_in_flight',
+    'Number of crawler requests in flight'
+)
+
+# CPU time spent parsing/extracting HTML
+crawler_extraction_cpu_seconds = Histogram(
+    'crawler_extraction_cpu_seconds',
+    'CPU time spent extracting content from HTML',
+    ['mode'],  # mode: inline, process
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5]
+)
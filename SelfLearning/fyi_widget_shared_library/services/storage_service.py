@@ -4,7 +4,10 @@ Storage service for MongoDB operations.
 Handles all database read/write operations.
 """
 
+import hashlib
 import logging
+import re
+import unicodedata
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from bson import ObjectId
@@ -20,6 +23,27 @@ from fyi_widget_shared_library.models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def compute_content_fingerprint(content: str) -> str:
+    """
+    Fingerprint extracted article text for duplicate detection.
+    
+    The text is NFKC-normalized, lowercased and reduced to its words, so
+    AMP/syndicated copies that differ only in whitespace, punctuation or
+    casing share a fingerprint.
+    
+    Args:
+        content: Extracted article text
+        
+    Returns:
+        SHA-256 hex digest of the normalized text
+    """
+    normalized = unicodedata.normalize("NFKC", content or "").lower()
+    normalized = " ".join(_NON_WORD_RE.sub(" ", normalized).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
 
 class StorageService:
     """Handles all MongoDB storage operations."""
@@ -36,6 +60,16 @@ class StorageService:
         self.questions_collection = questions_collection
         self.summaries_collection = summaries_collection
     
+    async def create_indexes(self):
+        """Create indexes used for content-fingerprint deduplication."""
+        try:
+            await self.database[self.blogs_collection].create_index("content_fingerprint")
+            await self.database[self.summaries_collection].create_index("blog_id")
+            await self.database[self.questions_collection].create_index([("blog_id", 1), ("summary_id", 1)])
+            logger.info("✅ Storage indexes created")
+        except Exception as e:
+            logger.warning(f"⚠️  Storage index creation warning: {e}")
+    
     async def save_blog_content(
         self, 
         url: str, 
@@ -48,6 +82,10 @@ class StorageService:
         """
         Save blog content to database.
         
+        metadata keeps the response validators (etag, last_modified) used for
+        conditional re-crawls, plus a content_hash of the extracted text.
+        If the blog already exists (re-crawl), its content is refreshed.
+        
         Returns:
             blog_id: MongoDB ObjectId as string
         """
@@ -55,22 +93,39 @@ class StorageService:
         
         collection = self.database[self.blogs_collection]
         
+        metadata = dict(metadata or {})
+        metadata["content_hash"] = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        content_fingerprint = compute_content_fingerprint(content)
+        
         # Check if already exists
         existing = await collection.find_one({"url": url})
         if existing:
-            logger.info(f"📝 Blog already exists: {url}")
+            await collection.update_one(
+                {"_id": existing["_id"]},
+                {"$set": {
+                    "title": title,
+                    "content": content,
+                    "language": language,
+                    "word_count": word_count,
+                    "metadata": metadata,
+                    "content_fingerprint": content_fingerprint,
+                    "revalidated_at": datetime.utcnow(),
+                    "updated_at": datetime.utcnow()
+                }}
+            )
+            logger.info(f"📝 Blog already exists, content refreshed: {url}")
             return str(existing["_id"])
         
-        # Create document with triggered_no_of_times = 0 for first time
-        # It will be incremented when processing is requested
+        # Trigger counts live in blog_triggers (see JobRepository.record_trigger)
         doc = {
             "url": url,
             "title": title,
             "content": content,
             "language": language,
             "word_count": word_count,
-            "metadata": metadata or {},
-            "triggered_no_of_times": 0,  # Will be incremented when processing starts
+            "metadata": metadata,
+            "content_fingerprint": content_fingerprint,
+            "revalidated_at": datetime.utcnow(),
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
@@ -78,7 +133,7 @@ class StorageService:
         result = await collection.insert_one(doc)
         blog_id = str(result.inserted_id)
         
-        logger.info(f"✅ Blog saved: {blog_id} (triggered_no_of_times: 0)")
+        logger.info(f"✅ Blog saved: {blog_id}")
         return blog_id
     
     async def save_summary(
@@ -88,7 +143,9 @@ class StorageService:
         summary_text: str,
         key_points: List[str],
         embedding: List[float],
-        title: Optional[str] = None
+        title: Optional[str] = None,
+        generation_signature: Optional[str] = None,
+        generation_tokens: int = 0
     ) -> str:
         """
         Save blog summary with embedding.
@@ -100,6 +157,8 @@ class StorageService:
             key_points: List of key points
             embedding: Vector embedding
             title: Optional LLM-generated title (stored for reference)
+            generation_signature: Hash of the generation settings (used for dedup)
+            generation_tokens: LLM tokens spent on the summary and questions
         """
         logger.info(f"💾 Saving summary for blog: {blog_id}")
         
@@ -118,6 +177,10 @@ class StorageService:
         if title:
             doc["llm_title"] = title
         
+        if generation_signature:
+            doc["generation_signature"] = generation_signature
+            doc["generation_tokens"] = generation_tokens
+        
         result = await collection.insert_one(doc)
         logger.info(f"✅ Summary saved: {result.inserted_id}")
         return str(result.inserted_id)
@@ -127,9 +190,10 @@ class StorageService:
         blog_id: str, 
         blog_url: str,
         questions: List[Dict[str, Any]],
-        embeddings: List[List[float]] = None
+        embeddings: List[List[float]] = None,
+        summary_id: Optional[str] = None
     ) -> List[str]:
-        """Save question-answer pairs with embeddings."""
+        """Save question-answer pairs with embeddings (summary_id links them to the run's summary)."""
         logger.info(f"💾 Saving {len(questions)} questions for blog: {blog_id}")
         
         collection = self.database[self.questions_collection]
@@ -148,6 +212,8 @@ class StorageService:
                 "click_count": 0,  # Initialize click count to 0
                 "created_at": datetime.utcnow()
             }
+            if summary_id:
+                doc["summary_id"] = summary_id
             docs.append(doc)
         
         if docs:
@@ -158,49 +224,80 @@ class StorageService:
         
         return []
     
+    async def mark_blog_revalidated(self, blog_id: str):
+        """
+        Record that a blog's stored content was confirmed current (304 on re-crawl).
+        
+        Args:
+            blog_id: Blog ID (MongoDB ObjectId as string)
+        """
+        from bson import ObjectId
+        await self.database[self.blogs_collection].update_one(
+            {"_id": ObjectId(blog_id)},
+            {"$set": {"revalidated_at": datetime.utcnow()}}
+        )
+    
     async def get_blog_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Get blog by URL."""
         collection = self.database[self.blogs_collection]
         blog = await collection.find_one({"url": url})
         return blog
     
-    async def increment_triggered_count(self, blog_id: str) -> int:
+    async def find_processed_duplicate(
+        self,
+        content_fingerprint: str,
+        generation_signature: str
+    ) -> Optional[Dict[str, Any]]:
         """
-        Increment triggered_no_of_times for a blog.
+        Find a processed blog with the same content and generation settings.
         
         Args:
-            blog_id: Blog ID (MongoDB ObjectId as string)
+            content_fingerprint: Fingerprint of the extracted content
+            generation_signature: Hash of the generation settings
             
         Returns:
-            New triggered_no_of_times count
+            Dict with blog_id, blog_url, summary and questions (all with
+            embeddings), or None if no reusable blog exists
         """
-        collection = self.database[self.blogs_collection]
-        
-        try:
-            from bson import ObjectId
-            blog_object_id = ObjectId(blog_id)
-        except Exception as e:
-            logger.error(f"Invalid blog_id format: {blog_id}")
-            raise ValueError(f"Invalid blog_id format: {e}")
+        blogs = await self.database[self.blogs_collection].find(
+            {"content_fingerprint": content_fingerprint},
+            {"_id": 1}
+        ).to_list(length=50)
+        if not blogs:
+            return None
         
-        # Increment triggered_no_of_times (initialize to 1 if field doesn't exist)
-        result = await collection.find_one_and_update(
-            {"_id": blog_object_id},
+        summary = await self.database[self.summaries_collection].find_one(
             {
-                "$inc": {"triggered_no_of_times": 1},
-                "$set": {"updated_at": datetime.utcnow()}
+                "blog_id": {"$in": [str(blog["_id"]) for blog in blogs]},
+                "generation_signature": generation_signature,
+                "embedding": {"$ne": None}
             },
-            return_document=True  # Return updated document
+            sort=[("created_at", -1)]
         )
+        if not summary:
+            return None
         
-        if result:
-            # Get the updated count (handle case where field didn't exist before)
-            count = result.get("triggered_no_of_times", 1)
-            logger.info(f"✅ Incremented triggered_no_of_times for blog {blog_id}: {count}")
-            return count
-        else:
-            logger.warning(f"⚠️  Blog not found for triggered count increment: {blog_id}")
-            raise ValueError(f"Blog not found: {blog_id}")
+        # Only the question set saved with this summary - a reprocessed blog holds several
+        saved_questions = await self.database[self.questions_collection].find(
+            {"blog_id": summary["blog_id"], "summary_id": str(summary["_id"])}
+        ).sort("_id", 1).to_list(length=None)
+        
+        # A retried save may have inserted the set twice
+        questions = []
+        seen = set()
+        for question in saved_questions:
+            if question.get("question") not in seen:
+                seen.add(question.get("question"))
+                questions.append(question)
+        if not questions or any(not q.get("embedding") for q in questions):
+            return None
+        
+        return {
+            "blog_id": summary["blog_id"],
+            "blog_url": summary.get("blog_url"),
+            "summary": summary,
+            "questions": questions
+        }
     
     async def get_blogs_by_urls(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
         """
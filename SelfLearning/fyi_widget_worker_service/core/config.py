@@ -11,7 +11,7 @@ class WorkerServiceConfig(BaseSettings):
     # Service
     service_name: str = "worker-service"
     poll_interval_seconds: int = Field(default=5, env="POLL_INTERVAL_SECONDS")
-    concurrent_jobs: int = Field(default=1, env="CONCURRENT_JOBS")
+    concurrent_jobs: int = Field(default=16, env="CONCURRENT_JOBS")
     
     # MongoDB
     mongodb_url: str = Field(default="mongodb://localhost:27017", env="MONGODB_URL")
@@ -43,7 +43,80 @@ jobs_processing_active = Gauge(
 job_queue_size = Gauge(
     'worker_job_queue_size',
     'Current size of job queue',
-    ['status']  # pending, processing, completed, failed
+    ['status']  # queued, processing, retrying, completed, skipped, dead_lettered
+)
+
+# ============================================================================
+# Scheduling Metrics
+# ============================================================================
+
+# Queued jobs per publisher
+publisher_queue_depth = Gauge(
+    'worker_publisher_queue_depth',
+    'Number of queued jobs per publisher',
+    ['publisher_id']
+)
+
+# Age of each publisher's oldest queued job
+publisher_oldest_queued_job_age_seconds = Gauge(
+    'worker_publisher_oldest_queued_job_age_seconds',
+    'Age of the oldest queued job per publisher',
+    ['publisher_id']
+)
+
+# Queued jobs per priority lane
+lane_queue_depth = Gauge(
+    'worker_lane_queue_depth',
+    'Number of queued jobs per priority lane',
+    ['priority']  # priority: interactive, normal, backfill
+)
+
+# Age of each lane's oldest queued job (latency SLO signal)
+lane_oldest_queued_job_age_seconds = Gauge(
+    'worker_lane_oldest_queued_job_age_seconds',
+    'Age of the oldest queued job per priority lane',
+    ['priority']
+)
+
+# Time jobs waited in the queue before being claimed
+job_queue_wait_seconds = Histogram(
+    'worker_job_queue_wait_seconds',
+    'Time jobs waited in the queue before being claimed',
+    ['publisher_id', 'priority'],
+    buckets=[1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600, 7200]
+)
+
+# ============================================================================
+# Pipeline Stage Metrics
+# ============================================================================
+
+# Jobs waiting in each stage's input queue
+pipeline_stage_queue_depth = Gauge(
+    'worker_pipeline_stage_queue_depth',
+    'Number of jobs waiting in a pipeline stage queue',
+    ['stage']  # stage: crawl, generate, embed, persist
+)
+
+# Jobs currently inside each stage
+pipeline_stage_active = Gauge(
+    'worker_pipeline_stage_active',
+    'Number of jobs currently being handled by a pipeline stage',
+    ['stage']
+)
+
+# Time spent in each stage
+pipeline_stage_duration_seconds = Histogram(
+    'worker_pipeline_stage_duration_seconds',
+    'Time taken by a job in a pipeline stage',
+    ['stage'],
+    buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0]
+)
+
+# Jobs that left each stage
+pipeline_stage_jobs_total = Counter(
+    'worker_pipeline_stage_jobs_total',
+    'Total number of jobs handled by a pipeline stage',
+    ['stage', 'status']  # status: success, failed, stopped, cancelled
 )
 
 # ============================================================================
@@ -159,6 +232,34 @@ embeddings_generated_total = Counter(
     ['publisher_domain', 'type']  # type: summary, question
 )
 
+# Blogs whose generated content was cloned from a blog with identical content
+dedup_hits_total = Counter(
+    'worker_dedup_hits_total',
+    'Total number of blogs processed by reusing content-identical results',
+    ['publisher_domain', 'source']  # source: same_url, other_url
+)
+
+# LLM tokens not spent thanks to dedup hits
+dedup_saved_tokens_total = Counter(
+    'worker_dedup_saved_tokens_total',
+    'Total LLM tokens saved by content-hash deduplication',
+    ['publisher_domain']
+)
+
+# Stage outputs restored from a checkpoint instead of being recomputed on retry
+checkpoint_resumes_total = Counter(
+    'worker_checkpoint_resumes_total',
+    'Total number of stage outputs restored from a job checkpoint',
+    ['publisher_domain', 'step']  # step: summary, questions, question_embeddings, summary_saved
+)
+
+# LLM call time not spent again thanks to checkpoint resumes
+checkpoint_saved_llm_seconds_total = Counter(
+    'worker_checkpoint_saved_llm_seconds_total',
+    'Total LLM/embedding seconds saved by resuming jobs from checkpoints',
+    ['publisher_domain', 'step']
+)
+
 # ============================================================================
 # Publisher Usage Metrics
 # ============================================================================
@@ -192,6 +293,50 @@ poll_errors_total = Counter(
     'Total number of errors in poll loop'
 )
 
+# Poll loop wake-ups after an empty queue
+poll_wakeups_total = Counter(
+    'worker_poll_wakeups_total',
+    'Total number of idle poll loop wake-ups',
+    ['reason']  # reason: change_stream, timeout
+)
+
+# Jobs reclaimed from crashed/stalled workers
+jobs_reaped_total = Counter(
+    'worker_jobs_reaped_total',
+    'Total number of processing jobs reclaimed after their lease expired',
+    ['outcome']  # outcome: retrying, dead_lettered
+)
+
+# Lease renewals that found the job no longer owned by this worker
+lease_lost_total = Counter(
+    'worker_lease_lost_total',
+    'Total number of jobs whose lease was lost while processing'
+)
+
+# Change stream state (1 = watching, 0 = falling back to polling)
+change_stream_active = Gauge(
+    'worker_change_stream_active',
+    'Whether the job queue change stream is active'
+)
+
+# ============================================================================
+# Publisher Cache Metrics
+# ============================================================================
+
+# Publisher lookups served from the in-process cache vs. Postgres
+publisher_cache_lookups_total = Counter(
+    'worker_publisher_cache_lookups_total',
+    'Total number of publisher cache lookups',
+    ['key', 'result']  # key: domain, id; result: hit, miss
+)
+
+# Cache invalidations triggered by publisher change notifications
+publisher_cache_invalidations_total = Counter(
+    'worker_publisher_cache_invalidations_total',
+    'Total number of publisher cache invalidations',
+    ['scope']  # scope: publisher, all
+)
+
 # ============================================================================
 # Error Metrics
 # ============================================================================
@@ -210,6 +355,19 @@ job_retries_total = Counter(
     ['publisher_domain']
 )
 
+# Jobs moved to the dead letter collection
+jobs_dead_lettered_total = Counter(
+    'worker_jobs_dead_lettered_total',
+    'Total number of permanently failed jobs moved to dead_letter_jobs',
+    ['publisher_domain', 'error_type']
+)
+
+# Retrying jobs moved back to the queue after their backoff
+retries_promoted_total = Counter(
+    'worker_retries_promoted_total',
+    'Total number of retrying jobs requeued after their backoff elapsed'
+)
+
 def get_metrics():
     """Return Prometheus metrics in text format."""
     return generate_latest(REGISTRY)
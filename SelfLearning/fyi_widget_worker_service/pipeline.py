@@ -0,0 +1,193 @@
+"""
+Staged job pipeline for the worker.
+
+Each stage has its own pool of consumer tasks reading from a bounded
+asyncio queue, so while earlier blogs are waiting on the LLM the next
+ones are already being crawled and validated, and finished ones are
+being written to MongoDB.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from metrics import (
+    pipeline_stage_queue_depth,
+    pipeline_stage_active,
+    pipeline_stage_duration_seconds,
+    pipeline_stage_jobs_total,
+)
+
+logger = logging.getLogger(__name__)
+
+# A stage handler returns True to pass the item on to the next stage, or False
+# when the item is finished early (e.g. job skipped)
+StageHandler = Callable[[Any], Awaitable[bool]]
+
+
+class StageError(Exception):
+    """Stage failure tagged with its error category (processing_errors_total error_type)."""
+
+    def __init__(self, error_type: str, message: Any):
+        """
+        Initialize error.
+
+        Args:
+            error_type: Error category, e.g. crawl_error, llm_error, db_error
+            message: Error message or the underlying exception
+        """
+        super().__init__(str(message))
+        self.error_type = error_type
+
+
+class PipelineStage:
+    """A single pipeline stage: a handler, its concurrency and its input queue."""
+
+    def __init__(self, name: str, handler: StageHandler, concurrency: int, queue_size: Optional[int] = None):
+        """
+        Initialize stage.
+
+        Args:
+            name: Stage name (used as the metrics label)
+            handler: Coroutine function processing one item
+            concurrency: Number of items processed at once
+            queue_size: Input queue bound (defaults to 2x concurrency)
+        """
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or self.concurrency * 2)
+
+
+class JobPipeline:
+    """
+    Runs items through a fixed sequence of stages connected by bounded queues.
+
+    submit() enqueues an item into the first stage and returns once the item
+    has left the pipeline: normally after the last stage, earlier if a
+    handler returns False, or with the handler's exception if a stage fails.
+    Full queues apply backpressure to the previous stage. Cancelling the
+    submitter cancels the stage handler running the item and drops it from
+    the pipeline.
+    """
+
+    def __init__(self, stages: List[PipelineStage]):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in execution order
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+
+        self.stages = stages
+        self._tasks: List[asyncio.Task] = []
+        # Handler task currently running each submitted item, keyed by its done future
+        self._handlers: Dict[asyncio.Future, asyncio.Task] = {}
+
+    def start(self):
+        """Start the consumer tasks of every stage."""
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.concurrency):
+                self._tasks.append(asyncio.create_task(self._consume(index)))
+
+        logger.info(
+            "🔀 Pipeline started: "
+            + ", ".join(f"{stage.name}={stage.concurrency}" for stage in self.stages)
+        )
+
+    async def stop(self):
+        """Cancel all stage consumers."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        logger.info("🔀 Pipeline stopped")
+
+    async def submit(self, item: Any):
+        """
+        Run an item through the pipeline.
+
+        Args:
+            item: Item passed to every stage handler
+
+        Raises:
+            Exception: Whatever the failing stage handler raised
+        """
+        done = asyncio.get_running_loop().create_future()
+        await self._put(0, item, done)
+        try:
+            await done
+        except asyncio.CancelledError:
+            # Cancelling `done` cancels the running handler; wait for it to
+            # stop so the caller never outlives work done on its behalf
+            handler = self._handlers.get(done)
+            if handler:
+                handler.cancel()
+                await asyncio.gather(handler, return_exceptions=True)
+            raise
+
+    async def _put(self, index: int, item: Any, done: asyncio.Future):
+        """Enqueue an item for a stage, waiting while its queue is full."""
+        stage = self.stages[index]
+        await stage.queue.put((item, done))
+        pipeline_stage_queue_depth.labels(stage=stage.name).set(stage.queue.qsize())
+
+    async def _consume(self, index: int):
+        """Consumer loop for one stage."""
+        stage = self.stages[index]
+        is_last = index == len(self.stages) - 1
+
+        while True:
+            item, done = await stage.queue.get()
+            pipeline_stage_queue_depth.labels(stage=stage.name).set(stage.queue.qsize())
+
+            try:
+                # Submitter gave up (e.g. job lease lost) - drop the item
+                if done.done():
+                    continue
+
+                pipeline_stage_active.labels(stage=stage.name).inc()
+                stage_start = time.time()
+                handler = asyncio.create_task(stage.handler(item))
+                self._handlers[done] = handler
+
+                def cancel_handler(future: asyncio.Future, handler: asyncio.Task = handler):
+                    if future.cancelled():
+                        handler.cancel()
+
+                done.add_done_callback(cancel_handler)
+                try:
+                    proceed = await handler
+                except asyncio.CancelledError:
+                    # Re-raise when the pipeline itself is stopping
+                    if not done.cancelled() or asyncio.current_task().cancelling():
+                        raise
+                    pipeline_stage_jobs_total.labels(stage=stage.name, status="cancelled").inc()
+                    continue
+                except Exception as e:
+                    pipeline_stage_jobs_total.labels(stage=stage.name, status="failed").inc()
+                    if not done.done():
+                        done.set_exception(e)
+                    continue
+                finally:
+                    done.remove_done_callback(cancel_handler)
+                    self._handlers.pop(done, None)
+                    pipeline_stage_active.labels(stage=stage.name).dec()
+                    pipeline_stage_duration_seconds.labels(stage=stage.name).observe(time.time() - stage_start)
+
+                if not proceed or is_last:
+                    pipeline_stage_jobs_total.labels(stage=stage.name, status="success" if proceed else "stopped").inc()
+                    if not done.done():
+                        done.set_result(None)
+                    continue
+
+                pipeline_stage_jobs_total.labels(stage=stage.name, status="success").inc()
+                # Submitter gave up while this stage ran - don't hand the item on
+                if done.done():
+                    continue
+                await self._put(index + 1, item, done)
+            finally:
+                stage.queue.task_done()
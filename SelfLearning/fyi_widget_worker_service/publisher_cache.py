@@ -0,0 +1,178 @@
+"""
+In-process publisher cache for the worker.
+
+Every job looks its publisher up by blog domain (config at crawl time,
+usage tracking and slot release afterwards). Subdomain matching loads
+every publisher row, so lookups are cached here by domain and by
+publisher_id for a short TTL. Postgres NOTIFYs on publisher changes
+(see PostgresPublisherRepository.listen_for_changes) evict entries
+immediately, so config edits take effect within seconds.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+from fyi_widget_shared_library.data.postgres_database import PostgresPublisherRepository
+from fyi_widget_shared_library.models.publisher import Publisher
+
+from metrics import publisher_cache_lookups_total, publisher_cache_invalidations_total
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_domain(domain: str) -> str:
+    """Normalize a domain the way get_publisher_by_domain does."""
+    domain = domain.lower().strip()
+    for prefix in ['https://', 'http://', 'www.']:
+        if domain.startswith(prefix):
+            domain = domain[len(prefix):]
+    return domain.rstrip('/')
+
+
+class PublisherCache:
+    """TTL cache of publishers keyed by domain and by publisher_id."""
+
+    def __init__(self, publisher_repo: PostgresPublisherRepository, ttl_seconds: float = 60):
+        """
+        Initialize cache.
+
+        Args:
+            publisher_repo: Repository used on cache misses
+            ttl_seconds: Lifetime of a cached lookup (safety net if a notification is missed)
+        """
+        self.publisher_repo = publisher_repo
+        self.ttl_seconds = ttl_seconds
+        # Domain lookups cache misses too (None), so unknown domains don't rescan the table
+        self._by_domain: Dict[str, Tuple[float, Optional[Publisher]]] = {}
+        self._by_id: Dict[str, Tuple[float, Publisher]] = {}
+        # One in-flight query per key: concurrent jobs for a publisher share it
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bumped on every invalidation; results of queries started before it are not stored
+        self._generation = 0
+        logger.info(f"✅ PublisherCache initialized (ttl: {self.ttl_seconds}s)")
+
+    async def get_by_domain(self, domain: str) -> Optional[Publisher]:
+        """
+        Get the publisher of a domain (subdomains match their root publisher).
+
+        Args:
+            domain: Blog domain
+
+        Returns:
+            Publisher, or None if no publisher matches
+        """
+        domain = normalize_domain(domain)
+        entry = self._by_domain.get(domain)
+        if entry and entry[0] > time.monotonic():
+            publisher_cache_lookups_total.labels(key="domain", result="hit").inc()
+            return entry[1]
+
+        publisher_cache_lookups_total.labels(key="domain", result="miss").inc()
+        return await self._load(
+            f"domain:{domain}",
+            lambda: self.publisher_repo.get_publisher_by_domain(domain, allow_subdomain=True),
+            domain=domain
+        )
+
+    async def get_by_id(self, publisher_id: str) -> Optional[Publisher]:
+        """
+        Get a publisher by ID.
+
+        Args:
+            publisher_id: Publisher ID
+
+        Returns:
+            Publisher, or None if it does not exist
+        """
+        entry = self._by_id.get(publisher_id)
+        if entry and entry[0] > time.monotonic():
+            publisher_cache_lookups_total.labels(key="id", result="hit").inc()
+            return entry[1]
+
+        publisher_cache_lookups_total.labels(key="id", result="miss").inc()
+        return await self._load(
+            f"id:{publisher_id}",
+            lambda: self.publisher_repo.get_publisher_by_id(publisher_id)
+        )
+
+    async def _load(self, key: str, query, domain: Optional[str] = None) -> Optional[Publisher]:
+        """
+        Run a lookup query (shared by concurrent callers) and cache its result.
+
+        Args:
+            key: In-flight key
+            query: Zero-argument coroutine function running the repository lookup
+            domain: Normalized domain to cache the result under (domain lookups)
+
+        Returns:
+            Publisher or None
+        """
+        future = self._inflight.get(key)
+        if future:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            publisher = await query()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: callers may all have gone
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if generation == self._generation:
+            expires_at = time.monotonic() + self.ttl_seconds
+            if domain is not None:
+                self._by_domain[domain] = (expires_at, publisher)
+            if publisher and publisher.id:
+                self._by_id[publisher.id] = (expires_at, publisher)
+
+        future.set_result(publisher)
+        return publisher
+
+    def invalidate(self, publisher_id: Optional[str] = None):
+        """
+        Evict a publisher (all its domain entries included), or everything.
+
+        Args:
+            publisher_id: Publisher to evict; None clears the whole cache
+        """
+        self._generation += 1
+        if publisher_id is None:
+            self._by_domain.clear()
+            self._by_id.clear()
+            return
+
+        self._by_id.pop(publisher_id, None)
+        for domain in [d for d, (_, pub) in self._by_domain.items() if pub and pub.id == publisher_id]:
+            del self._by_domain[domain]
+
+    def handle_change(self, change: Optional[dict]):
+        """
+        Apply a publisher change notification.
+
+        A settings update only evicts that publisher. Inserts, deletes and
+        domain changes can change which publisher a domain resolves to (or
+        whether one does), so they clear everything; so does None, which the
+        listener sends after reconnecting because notifications may have
+        been missed.
+
+        Args:
+            change: Notification payload {"op", "id", "domain_changed"}, or None
+        """
+        if change and change.get("op") == "UPDATE" and not change.get("domain_changed") and change.get("id"):
+            self.invalidate(change["id"])
+            publisher_cache_invalidations_total.labels(scope="publisher").inc()
+            logger.info(f"🔄 Publisher {change['id']} changed, evicted from cache")
+        else:
+            self.invalidate()
+            publisher_cache_invalidations_total.labels(scope="all").inc()
+            logger.info(f"🔄 Publisher cache cleared ({(change or {}).get('op', 'listener reconnected')})")
@@ -0,0 +1,129 @@
+"""
+Benchmark the content extraction engines against saved publisher HTML.
+
+Runs every fixture in scripts/fixtures/extraction through each engine
+("fast" lxml single-pass, "soup" BeautifulSoup) and reports pages/sec,
+p50/p95 latency and peak RSS. Each engine runs in its own subprocess so
+peak RSS is not shared between them. The engines' outputs are also
+compared per fixture.
+
+Usage:
+    python scripts/benchmark_extraction.py [--iterations 50] [--fixtures DIR]
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add repo root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+DEFAULT_FIXTURES = Path(__file__).parent / "fixtures" / "extraction"
+
+
+def load_fixtures(fixtures_dir: Path) -> dict:
+    """Load fixture HTML by file name."""
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(fixtures_dir.glob("*.html"))}
+
+
+def run_engine(engine: str, fixtures_dir: Path, iterations: int) -> dict:
+    """Time one engine over all fixtures (run inside the per-engine subprocess)."""
+    from fyi_widget_shared_library.services.content_extractor import extract_content
+
+    fixtures = load_fixtures(fixtures_dir)
+    latencies = []
+    failures = 0
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for name, html in fixtures.items():
+            page_start = time.perf_counter()
+            try:
+                extract_content(html, f"https://example.com/{name}", engine=engine)
+            except ValueError:
+                failures += 1
+            latencies.append(time.perf_counter() - page_start)
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "engine": engine,
+        "pages": len(latencies),
+        "failures": failures,
+        "pages_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        # ru_maxrss is in KB on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def compare_engines(fixtures_dir: Path) -> list:
+    """Return the fixtures for which the engines disagree."""
+    from fyi_widget_shared_library.services.content_extractor import extract_content
+
+    mismatches = []
+    for name, html in load_fixtures(fixtures_dir).items():
+        results = {}
+        for engine in ("fast", "soup"):
+            try:
+                content, _ = extract_content(html, f"https://example.com/{name}", engine=engine)
+                results[engine] = (content.title, content.content, content.language, content.word_count)
+            except ValueError as e:
+                results[engine] = ("error", str(e))
+        if results["fast"] != results["soup"]:
+            mismatches.append(name)
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML content extraction engines")
+    parser.add_argument("--iterations", type=int, default=50, help="Passes over the fixture corpus per engine")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="Directory of *.html fixtures")
+    parser.add_argument("--engine", help=argparse.SUPPRESS)  # internal: run a single engine and print JSON
+    args = parser.parse_args()
+
+    if args.engine:
+        print(json.dumps(run_engine(args.engine, args.fixtures, args.iterations)))
+        return
+
+    fixture_count = len(load_fixtures(args.fixtures))
+    if not fixture_count:
+        sys.exit(f"No fixtures found in {args.fixtures}")
+    print(f"📄 {fixture_count} fixtures x {args.iterations} iterations")
+
+    results = []
+    for engine in ("soup", "fast"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--engine", engine, "--iterations", str(args.iterations), "--fixtures", str(args.fixtures)],
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"\n{'engine':<8}{'pages/sec':>12}{'p50 ms':>10}{'p95 ms':>10}{'peak RSS MB':>14}{'failures':>10}")
+    for result in results:
+        print(
+            f"{result['engine']:<8}{result['pages_per_sec']:>12.1f}{result['p50_ms']:>10.2f}"
+            f"{result['p95_ms']:>10.2f}{result['peak_rss_mb']:>14.1f}{result['failures']:>10}"
+        )
+
+    baseline, fast = results
+    if fast["pages_per_sec"] and baseline["pages_per_sec"]:
+        print(f"\n⚡ fast engine: {fast['pages_per_sec'] / baseline['pages_per_sec']:.1f}x pages/sec vs soup")
+
+    mismatches = compare_engines(args.fixtures)
+    if mismatches:
+        print(f"❌ Engines disagree on: {', '.join(mismatches)}")
+        sys.exit(1)
+    print("✅ Engines produce identical results on all fixtures")
+
+
+if __name__ == "__main__":
+    main()